@@ -0,0 +1,66 @@
+# benchmarks/concurrency.py
+
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from ciphers.keyed_cipher import KeyedCipher  # noqa: E402
+from cli.main import parse_size  # noqa: E402
+from engines.kernels import NUMPY_ENGINES, numpy_available  # noqa: E402
+from specs.spec import CipherSpec  # noqa: E402
+from throughput import ALPHABET, best_of, sample_text  # noqa: E402
+
+"""
+Throughput of one shared `KeyedCipher` as threads increase.
+
+"requests" serves many independent texts with `KeyedCipher.map`; "chunks"
+splits one large text across the pool. Pure-Python engines only scale on
+free-threaded builds (the GIL serializes them); the NumPy engine releases
+the GIL in its loops.
+
+    python benchmarks/concurrency.py --requests 512 --request-size 64K --threads 1,2,4,8
+"""
+
+
+def gil_enabled() -> bool:
+    check = getattr(sys, "_is_gil_enabled", None)
+    return True if check is None else check()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Shared keyed cipher throughput per thread count.")
+    parser.add_argument("--requests", type=int, default=256, help="Texts per 'requests' run.")
+    parser.add_argument("--request-size", type=parse_size, default=1 << 16, help="Characters per text.")
+    parser.add_argument("--threads", default="1,2,4,8", help="Comma-separated thread counts.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per measurement (best is kept).")
+    args = parser.parse_args(argv)
+
+    threads = [int(count) for count in args.threads.split(",")]
+    text = sample_text(args.request_size)
+    texts = [text] * args.requests
+    big = text * args.requests
+    megabytes = len(big) / 1e6
+    engines = [e for e in ("translate", "numpy") if e not in NUMPY_ENGINES or numpy_available()]
+
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled() else 'disabled'}, {os.cpu_count()} CPUs")
+    print(f"{'engine':<11}{'mode':<10}" + "".join(f"{f'{n} thr MB/s':>14}" for n in threads))
+    for engine in engines:
+        cipher = KeyedCipher.from_spec(CipherSpec(type="vigenere", text="", alphabet=ALPHABET, keyword="LEMON", engine=engine))
+        for mode in ("requests", "chunks"):
+            rates = []
+            for count in threads:
+                with ThreadPoolExecutor(max_workers=count) as pool:
+                    if mode == "requests":
+                        seconds = best_of(args.repeat, lambda: cipher.map(texts, executor=pool))
+                    else:
+                        seconds = best_of(args.repeat, lambda: cipher.encrypt(big, executor=pool, chunk_size=len(text)))
+                rates.append(megabytes / seconds)
+            print(f"{engine:<11}{mode:<10}" + "".join(f"{rate:>14.1f}" for rate in rates))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
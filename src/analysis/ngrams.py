@@ -0,0 +1,109 @@
+# src/analysis/ngrams.py
+
+import math
+from dataclasses import dataclass, field
+from typing import Dict, Sequence
+
+import numpy as np
+
+from utils.error import InvalidInputTypeError
+from utils.validators import ensure_not_empty
+
+"""
+N-gram language scoring over alphabet index arrays.
+
+Scores are mean log10 probabilities per n-gram, computed with dense lookup
+tables so that whole batches of candidate plaintexts (one per row of an
+index matrix) are scored in a few vectorized operations.
+"""
+
+
+@dataclass(frozen=True)
+class NgramScorer:
+    """
+    Dense n-gram log-probability table for an alphabet.
+
+    Attributes:
+        alphabet: Alphabet the indices refer to.
+        order: N-gram length.
+        log_probs: log10 probability of each n-gram, indexed by its base-|alphabet| code.
+        expected: Mean score of the text the table was built from.
+        uniform: Mean score of uniformly random text.
+
+    Example:
+        >>> scorer = NgramScorer.from_text("THE CAT SAT ON THE MAT", "ACEHMNOST", order=2)
+        >>> scorer.score(scorer.indices("THE")) > scorer.score(scorer.indices("TTT"))
+        True
+    """
+
+    alphabet: Sequence[str]
+    order: int
+    log_probs: np.ndarray = field(repr=False, compare=False)
+    expected: float = 0.0
+    uniform: float = 0.0
+    index_map: Dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        ensure_not_empty(self.alphabet, "Alphabet must not be empty.")
+        if len(self.log_probs) != len(self.alphabet) ** self.order:
+            raise InvalidInputTypeError(
+                f"Table of {len(self.log_probs)} entries does not match alphabet of "
+                f"{len(self.alphabet)} characters at order {self.order}."
+            )
+        object.__setattr__(self, "index_map", {char: idx for idx, char in enumerate(self.alphabet)})
+
+    @classmethod
+    def from_text(cls, text: str, alphabet: Sequence[str], order: int = 2, floor: float = 0.01) -> "NgramScorer":
+        """
+        Count the n-grams of a sample text (characters outside the alphabet are skipped).
+
+        Unseen n-grams get `floor` counts, so they are unlikely but not impossible.
+        """
+        alphabet = tuple(alphabet)
+        index_map = {char: idx for idx, char in enumerate(alphabet)}
+        indices = np.fromiter((index_map[char] for char in text if char in index_map), dtype=np.int64)
+        if len(indices) < order:
+            raise InvalidInputTypeError(f"Sample text needs at least {order} alphabet characters.")
+
+        codes = ngram_codes(indices, len(alphabet), order)
+        counts = np.bincount(codes, minlength=len(alphabet) ** order).astype(np.float64)
+        log_probs = np.log10(np.maximum(counts, floor) / counts.sum())
+        return cls(
+            alphabet=alphabet,
+            order=order,
+            log_probs=log_probs,
+            expected=float(log_probs[codes].mean()),
+            uniform=float(log_probs.mean()),
+        )
+
+    def indices(self, text: str) -> np.ndarray:
+        """Alphabet indices of the alphabet characters in `text`."""
+        index_map = self.index_map
+        return np.fromiter((index_map[char] for char in text if char in index_map), dtype=np.int64)
+
+    def score(self, indices: np.ndarray) -> float:
+        """Mean log10 probability of the n-grams of one index array."""
+        if len(indices) < self.order:
+            return -math.inf
+        return float(self.log_probs[ngram_codes(indices, len(self.alphabet), self.order)].mean())
+
+    def score_batch(self, matrix: np.ndarray) -> np.ndarray:
+        """Score each row of a 2-D index array."""
+        if matrix.shape[1] < self.order:
+            return np.full(len(matrix), -math.inf)
+        return self.log_probs[ngram_codes(matrix, len(self.alphabet), self.order)].mean(axis=1)
+
+
+def ngram_codes(indices: np.ndarray, size: int, order: int) -> np.ndarray:
+    """
+    Base-`size` code of every n-gram along the last axis of an index array.
+
+    Example:
+        >>> ngram_codes(np.array([1, 2, 0]), size=3, order=2).tolist()
+        [5, 6]
+    """
+    width = indices.shape[-1] - order + 1
+    codes = np.zeros(indices.shape[:-1] + (width,), dtype=np.int64)
+    for offset in range(order):
+        codes = codes * size + indices[..., offset:offset + width]
+    return codes
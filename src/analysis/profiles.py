@@ -0,0 +1,266 @@
+# src/analysis/profiles.py
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from analysis.ngrams import NgramScorer, ngram_codes
+from engines.numpy_engine import AlphabetArrays, to_code_points
+from structures.sequences import AlphabetSequence
+from utils.cache import cache_dir, callable_identity
+from utils.error import InvalidInputTypeError
+
+"""
+Compiled language profiles: unigram, bigram and quadgram log-probability
+tables for an alphabet, built once from a corpus and cached on disk.
+
+Corpora are counted a chunk at a time with `np.bincount` over n-gram codes
+(characters outside the alphabet are skipped, as in `NgramScorer`), so the
+corpus never has to fit in memory. Tables are dense float32 arrays indexed
+by base-|alphabet| n-gram code and are saved as one `.npy` file per order;
+cached profiles load memory-mapped, so opening one costs a few file reads.
+"""
+
+
+DEFAULT_ORDERS = (1, 2, 4)
+PROFILE_VERSION = 1
+PROFILE_DIR = "profiles"
+CHUNK_CHARS = 1 << 22
+
+Alphabet = Union[str, Sequence[str], AlphabetSequence]
+
+
+@dataclass(frozen=True)
+class LanguageProfile:
+    """
+    N-gram tables of several orders for one alphabet.
+
+    Scoring uses the highest order unless another is requested, and the
+    profile can stand in for an `NgramScorer` (e.g. in `DictionaryAttack`).
+
+    Attributes:
+        alphabet: Alphabet the tables are indexed by.
+        tables: One `NgramScorer` per order.
+
+    Example:
+        >>> profile = LanguageProfile.compile("THE CAT SAT ON THE MAT", "ACEHMNOST", orders=(1, 2))
+        >>> profile.orders, profile.order
+        ((1, 2), 2)
+        >>> codes = profile.indices("THE")
+        >>> profile.score(codes) > profile.score(profile.indices("TTT"))
+        True
+        >>> profile.score(codes, order=1) == profile.table(1).score(codes)
+        True
+    """
+
+    alphabet: Tuple[str, ...]
+    tables: Dict[int, NgramScorer] = field(repr=False, compare=False)
+    _arrays: AlphabetArrays = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "alphabet", tuple(AlphabetSequence(list(self.alphabet))))
+        if not self.tables:
+            raise InvalidInputTypeError("A language profile needs at least one n-gram table.")
+        if any(tuple(table.alphabet) != self.alphabet for table in self.tables.values()):
+            raise InvalidInputTypeError("Every n-gram table must use the profile's alphabet.")
+        object.__setattr__(self, "tables", dict(sorted(self.tables.items())))
+        object.__setattr__(self, "_arrays", AlphabetArrays.build(self.alphabet))
+
+    @property
+    def orders(self) -> Tuple[int, ...]:
+        return tuple(self.tables)
+
+    @property
+    def order(self) -> int:
+        """Default scoring order: the highest available."""
+        return self.orders[-1]
+
+    @property
+    def expected(self) -> float:
+        return self.tables[self.order].expected
+
+    @property
+    def uniform(self) -> float:
+        return self.tables[self.order].uniform
+
+    def table(self, order: int) -> NgramScorer:
+        if order not in self.tables:
+            raise InvalidInputTypeError(f"Profile has no order-{order} table (orders: {list(self.tables)}).")
+        return self.tables[order]
+
+    def indices(self, text: str) -> np.ndarray:
+        """Alphabet indices of the alphabet characters in `text`."""
+        found = self._arrays.indices(to_code_points(text))
+        return found[found >= 0].astype(np.int64)
+
+    def score(self, indices: np.ndarray, order: Optional[int] = None) -> float:
+        """Mean log10 probability of the n-grams of one index array."""
+        return self.table(order or self.order).score(indices)
+
+    def score_batch(self, matrix: np.ndarray, order: Optional[int] = None) -> np.ndarray:
+        """Score each row of a 2-D index array."""
+        return self.table(order or self.order).score_batch(matrix)
+
+    @classmethod
+    def compile(
+        cls,
+        corpus: Union[str, Iterable[str]],
+        alphabet: Alphabet,
+        orders: Sequence[int] = DEFAULT_ORDERS,
+        floor: float = 0.01,
+        normalize: Optional[Callable[[str], str]] = None,
+    ) -> "LanguageProfile":
+        """
+        Count a corpus, given as one string or an iterable of chunks.
+
+        `normalize` is applied to every chunk first (e.g. `str.upper` for an
+        upper-case alphabet). Unseen n-grams get `floor` counts.
+        """
+        alphabet = tuple(AlphabetSequence(list(alphabet)))
+        orders = sorted(set(orders))
+        if not orders or orders[0] < 1:
+            raise InvalidInputTypeError(f"N-gram orders must be positive (got {orders}).")
+
+        arrays = AlphabetArrays.build(alphabet)
+        size = len(alphabet)
+        counts = {order: np.zeros(size ** order, dtype=np.int64) for order in orders}
+        carry = np.empty(0, dtype=np.int64)
+        for chunk in [corpus] if isinstance(corpus, str) else corpus:
+            if normalize is not None:
+                chunk = normalize(chunk)
+            found = arrays.indices(to_code_points(chunk))
+            indices = np.concatenate((carry, found[found >= 0].astype(np.int64)))
+            for order in orders:
+                # Skip n-grams lying wholly inside the carried tail: the previous chunk counted them.
+                start = max(0, len(carry) - order + 1)
+                if len(indices) - start >= order:
+                    found = np.bincount(ngram_codes(indices[start:], size, order))
+                    counts[order][:len(found)] += found
+            carry = indices[max(0, len(indices) - orders[-1] + 1):]
+
+        tables = {}
+        for order, table in counts.items():
+            total = table.sum()
+            if not total:
+                raise InvalidInputTypeError(f"Corpus needs at least {order} alphabet characters.")
+            log_probs = np.log10(np.maximum(table, floor) / total)
+            tables[order] = NgramScorer(
+                alphabet=alphabet,
+                order=order,
+                log_probs=log_probs.astype(np.float32),
+                expected=float(table @ log_probs / total),
+                uniform=float(log_probs.mean()),
+            )
+        return cls(alphabet, tables)
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        alphabet: Alphabet,
+        orders: Sequence[int] = DEFAULT_ORDERS,
+        floor: float = 0.01,
+        normalize: Optional[Callable[[str], str]] = None,
+        encoding: str = "utf-8",
+        cache: bool = True,
+        cache_tag: Optional[str] = None,
+    ) -> "LanguageProfile":
+        """
+        Compile a corpus file, or load the profile cached for it.
+
+        The cache key covers the file (path, size, modification time), the
+        alphabet, orders, floor and `normalize`, so editing any of them
+        compiles a fresh profile. `normalize` is identified by its qualified
+        name; a lambda or nested function has none that tells it apart, so it
+        is only cached under an explicit `cache_tag` naming what it does.
+        """
+        key = cache_key(path, alphabet, orders, floor, normalize, cache_tag) if cache else None
+        directory = os.path.join(cache_dir(create=False), PROFILE_DIR, key) if key else None
+        if directory and os.path.isdir(directory):
+            try:
+                return cls.load(directory)
+            except (OSError, ValueError, KeyError):
+                pass  # Unreadable cache entry: compile again and replace it.
+
+        with open(path, encoding=encoding) as f:
+            profile = cls.compile(iter(lambda: f.read(CHUNK_CHARS), ""), alphabet, orders, floor, normalize)
+        if directory:
+            profile.save(directory)
+        return profile
+
+    def save(self, directory: str) -> None:
+        """Write `profile.json` and one `order-N.npy` per table, replacing `directory` atomically."""
+        parent = os.path.dirname(os.path.abspath(directory))
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=parent, prefix=".profile-")
+        try:
+            meta = {
+                "version": PROFILE_VERSION,
+                "alphabet": list(self.alphabet),
+                "tables": {
+                    str(order): {"expected": table.expected, "uniform": table.uniform}
+                    for order, table in self.tables.items()
+                },
+            }
+            with open(os.path.join(staging, "profile.json"), "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False)
+            for order, table in self.tables.items():
+                np.save(os.path.join(staging, f"order-{order}.npy"), np.asarray(table.log_probs, dtype=np.float32))
+            if os.path.isdir(directory):
+                shutil.rmtree(directory)
+            os.replace(staging, directory)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "LanguageProfile":
+        """Load a profile written by `save` (memory-mapped unless `mmap` is False)."""
+        with open(os.path.join(directory, "profile.json"), encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("version") != PROFILE_VERSION:
+            raise ValueError(f"Unsupported profile version {meta.get('version')}.")
+
+        alphabet = tuple(meta["alphabet"])
+        tables = {}
+        for order, stats in meta["tables"].items():
+            log_probs = np.load(os.path.join(directory, f"order-{order}.npy"), mmap_mode="r" if mmap else None)
+            tables[int(order)] = NgramScorer(alphabet, int(order), log_probs, stats["expected"], stats["uniform"])
+        return cls(alphabet, tables)
+
+
+def cache_key(
+    path: str,
+    alphabet: Alphabet,
+    orders: Sequence[int],
+    floor: float,
+    normalize: Optional[Callable[[str], str]],
+    cache_tag: Optional[str] = None,
+) -> Optional[str]:
+    """Fingerprint of a corpus file and the compile settings; None if `normalize` cannot be identified."""
+    normalizer = cache_tag if cache_tag is not None else callable_identity(normalize)
+    if normalize is not None and normalizer is None:
+        return None
+    stat = os.stat(path)
+    settings = [
+        PROFILE_VERSION,
+        os.path.realpath(path),
+        stat.st_size,
+        stat.st_mtime_ns,
+        list(alphabet),
+        sorted(set(orders)),
+        floor,
+        None if normalize is None else normalizer,
+    ]
+    return hashlib.sha256(json.dumps(settings, ensure_ascii=False).encode("utf-8")).hexdigest()[:32]
+
+
+def clear_profile_cache() -> None:
+    """Remove every cached profile."""
+    shutil.rmtree(os.path.join(cache_dir(create=False), PROFILE_DIR), ignore_errors=True)
@@ -0,0 +1,197 @@
+# src/attacks/crib_drag.py
+
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from engines.numpy_engine import AlphabetArrays, to_code_points
+from utils.coercion import NativeText, TextLike, coerce_to_native_text
+from utils.error import InvalidInputTypeError
+from utils.validators import ensure_not_empty
+
+"""
+Crib dragging: locate a known plaintext fragment in Vigenère or ROT ciphertext.
+
+Keys advance on alphabet characters only, so both ciphertext and crib are
+reduced to their alphabet indices. A read-only sliding window view over the
+ciphertext indices gives one row per offset; subtracting the crib from the
+rows yields the key stream each offset implies. An offset is a hit when that
+key stream repeats with a period no longer than half the crib: period 1 is a
+ROT shift, longer periods a Vigenère keyword. Periods are tested one column
+of the implied key at a time, each test only on the rows that passed the
+previous one, so the full offset-by-crib matrix is never built.
+
+Ciphertext is processed in blocks, carrying the last `len(crib) - 1`
+indices over to the next block, so arbitrarily large texts can be streamed
+through `search_stream` in bounded memory.
+"""
+
+
+# Text characters converted per block.
+DEFAULT_BLOCK = 1 << 22
+
+# Offsets compared per step within a block.
+_ROWS = 1 << 16
+
+
+@dataclass(frozen=True)
+class CribHit:
+    """
+    An offset where the crib fits under a periodic key.
+
+    Attributes:
+        offset: Position of the crib's first character in the ciphertext (characters, or bytes for byte input).
+        key_position: Number of alphabet characters before it, i.e. the key position it was encrypted at.
+        period: Period of the implied key.
+        key: One period of the key, aligned to key position 0.
+        shifts: Alphabet indices of `key`, i.e. the shift at each key position.
+    """
+
+    offset: int
+    key_position: int
+    period: int
+    key: str
+    shifts: Tuple[int, ...]
+
+    @property
+    def shift(self) -> Optional[int]:
+        """The ROT shift for period-1 hits, None otherwise."""
+        return self.shifts[0] if self.period == 1 else None
+
+
+@dataclass(frozen=True)
+class CribDragger:
+    """
+    Compiled crib for one alphabet.
+
+    Attributes:
+        crib: Known plaintext; characters outside the alphabet are ignored.
+        alphabet: Cipher alphabet.
+        max_period: Longest key period to report (default and upper bound: half the crib).
+        distinct: Only report keys whose period has no repeated character, as
+            `KeywordSequence` keywords never do.
+
+    Example:
+        >>> dragger = CribDragger("ATTACKATDAWN", tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+        >>> [(hit.offset, hit.key) for hit in dragger.search("-- LXFOPV EF RNHR")]
+        [(3, 'LEMON')]
+    """
+
+    crib: str
+    alphabet: Sequence[str]
+    max_period: Optional[int] = None
+    distinct: bool = True
+    _arrays: AlphabetArrays = field(init=False, repr=False, compare=False)
+    _plain: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        ensure_not_empty(self.alphabet, "Alphabet must not be empty.")
+        arrays = AlphabetArrays.build(self.alphabet)
+        indices = arrays.indices(to_code_points(self.crib))
+        plain = indices[indices >= 0]
+        if len(plain) < 2:
+            raise InvalidInputTypeError("Crib needs at least two alphabet characters.")
+
+        longest = len(plain) // 2
+        max_period = longest if self.max_period is None else min(self.max_period, longest)
+        if max_period < 1:
+            raise InvalidInputTypeError("max_period must be at least 1.")
+        object.__setattr__(self, "max_period", max_period)
+        object.__setattr__(self, "_arrays", arrays)
+        object.__setattr__(self, "_plain", plain.astype(self._dtype))
+
+    @property
+    def _dtype(self) -> type:
+        # Narrowest type holding the difference of two indices.
+        return np.int8 if len(self.alphabet) <= 127 else np.int16 if len(self.alphabet) <= 32767 else np.int32
+
+    def implied_keys(self, ciphertext: TextLike) -> np.ndarray:
+        """
+        Key stream implied at every offset: one row of alphabet indices per
+        ciphertext alphabet character at which the crib fits.
+        """
+        cipher, _ = self._indices(coerce_to_native_text(ciphertext), 0)
+        if len(cipher) < len(self._plain):
+            return np.empty((0, len(self._plain)), dtype=self._dtype)
+        return self._implied(sliding_window_view(cipher, len(self._plain)))
+
+    def search(self, ciphertext: TextLike, block: int = DEFAULT_BLOCK) -> List[CribHit]:
+        """All hits in an in-memory ciphertext."""
+        text = coerce_to_native_text(ciphertext)
+        return list(self.search_stream(text[start:start + block] for start in range(0, len(text), block)))
+
+    def search_stream(self, chunks: Iterable[NativeText]) -> Iterator[CribHit]:
+        """
+        Hits in a ciphertext given as consecutive chunks (e.g. from
+        `engines.key_streams.mapped_file_source(path)()`), yielded in order.
+        """
+        width = len(self._plain)
+        carry = np.empty(0, dtype=self._dtype)
+        carry_positions = np.empty(0, dtype=np.int64)
+        text_offset = 0
+        key_position = 0  # key position of carry[0]
+
+        for chunk in chunks:
+            indices, positions = self._indices(chunk, text_offset)
+            text_offset += len(chunk)
+            cipher = np.concatenate((carry, indices))
+            positions = np.concatenate((carry_positions, positions))
+
+            if len(cipher) >= width:
+                windows = sliding_window_view(cipher, width)
+                for start in range(0, len(windows), _ROWS):
+                    yield from self._hits(windows[start:start + _ROWS], positions[start:], key_position + start)
+                consumed = len(windows)
+                key_position += consumed
+                cipher, positions = cipher[consumed:], positions[consumed:]
+            carry, carry_positions = cipher, positions
+
+    def _indices(self, text: NativeText, base: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Alphabet indices of a chunk and the text positions they came from."""
+        if isinstance(text, str):
+            code_points = to_code_points(text)
+        else:
+            code_points = np.frombuffer(text, dtype=np.uint8)
+        indices = self._arrays.indices(code_points)
+        positions = np.flatnonzero(indices >= 0)
+        return indices[positions].astype(self._dtype), positions + base
+
+    def _implied(self, windows: np.ndarray) -> np.ndarray:
+        return (windows - self._plain) % len(self.alphabet)
+
+    def _hits(self, windows: np.ndarray, positions: np.ndarray, key_position: int) -> Iterator[CribHit]:
+        n = len(self.alphabet)
+        plain = self._plain
+        period = np.zeros(len(windows), dtype=np.int64)
+        for p in range(1, self.max_period + 1):
+            # Implied key columns j - p and j agree iff the ciphertext columns differ by the
+            # crib difference modulo n. The first test runs over all rows, each later one
+            # only over the (about n times fewer) rows that passed so far.
+            rows = None
+            for j in range(p, len(plain)):
+                expected = (int(plain[j]) - int(plain[j - p])) % n
+                if rows is None:
+                    difference = windows[:, j] - windows[:, j - p]
+                    rows = np.flatnonzero((difference == expected) | (difference == expected - n))
+                    rows = rows[period[rows] == 0]
+                else:
+                    difference = windows[rows, j] - windows[rows, j - p]
+                    rows = rows[(difference == expected) | (difference == expected - n)]
+                if not len(rows):
+                    break
+            else:
+                period[rows] = p
+
+        alphabet = self.alphabet
+        for row in np.flatnonzero(period):
+            p = int(period[row])
+            stream = self._implied(windows[row])[:p].tolist()
+            if self.distinct and len(set(stream)) < p:
+                continue
+            # Rotate the key so that it starts at key position 0.
+            start = (key_position + int(row)) % p
+            shifts = tuple(stream[(i - start) % p] for i in range(p))
+            key = "".join(alphabet[shift] for shift in shifts)
+            yield CribHit(int(positions[row]), key_position + int(row), p, key, shifts)
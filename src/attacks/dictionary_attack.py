@@ -0,0 +1,394 @@
+# src/attacks/dictionary_attack.py
+
+import hashlib
+import json
+import os
+import time
+from codecs import latin_1_decode
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from analysis.ngrams import NgramScorer
+from analysis.profiles import LanguageProfile
+from engines.numpy_engine import AlphabetArrays, to_code_points
+from utils.cache import callable_identity
+from utils.coercion import TextLike, coerce_to_native_text
+from utils.error import InvalidCheckpointError, InvalidInputTypeError
+from utils.validators import ensure_not_empty
+
+"""
+Dictionary attack on repeating-key Vigenère ciphertext.
+
+Every candidate keyword goes through the same reduction as `KeywordSequence`
+(order-preserving dedup, at least two distinct characters), after which a
+whole batch of candidates is tried at once: the keys become one flat index
+array, each candidate decrypts only the first `prefix_length` alphabet
+characters of the ciphertext as a row of an index matrix, and rows scoring
+below the n-gram threshold are rejected on the spot. Survivors are rescored
+on `verify_length` characters and the best `top` are kept.
+
+Wordlist files are cut into byte-range shards that worker processes read
+themselves; with a checkpoint file, finished shards are recorded as they
+complete and an interrupted run resumes where it stopped. A checkpoint is
+only resumed by the same attack: same ciphertext, scoring tables, normalizer
+and settings, and the same wordlist (a file of the same path, size and
+modification time, or an iterable whose finished shards hash the same).
+"""
+
+
+DEFAULT_SHARD_BYTES = 1 << 20
+DEFAULT_SHARD_WORDS = 1 << 16
+
+# Largest number of index cells scored in one verification step.
+_VERIFY_CELLS = 1 << 20
+
+CHECKPOINT_VERSION = 2
+
+
+@dataclass(frozen=True, order=True)
+class Candidate:
+    """A keyword that survived rejection, with its verification score."""
+
+    score: float
+    keyword: str = field(compare=False)
+    key: str = field(compare=False)
+
+
+@dataclass
+class AttackResult:
+    candidates: List[Candidate]
+    tested: int = 0
+    rejected: int = 0
+    invalid: int = 0
+    shards: int = 0
+    seconds: float = 0.0
+
+    @property
+    def best(self) -> Optional[Candidate]:
+        return self.candidates[0] if self.candidates else None
+
+
+def reduce_keyword(word: str) -> str:
+    """
+    Order-preserving dedup, as `KeywordSequence` does.
+
+    Example:
+        >>> reduce_keyword("LEMONLEMON")
+        'LEMON'
+    """
+    return "".join(dict.fromkeys(word))
+
+
+def merge_top(candidates: Iterable[Candidate], top: int) -> List[Candidate]:
+    """Best `top` candidates, highest score first, one per effective key."""
+    seen = set()
+    result = []
+    for candidate in sorted(candidates, reverse=True):
+        if candidate.key not in seen:
+            seen.add(candidate.key)
+            result.append(candidate)
+            if len(result) == top:
+                break
+    return result
+
+
+@dataclass(frozen=True)
+class DictionaryAttack:
+    """
+    Rank candidate keywords for a Vigenère ciphertext.
+
+    Attributes:
+        ciphertext: Ciphertext (characters outside the alphabet are ignored, as the key skips them).
+        alphabet: Cipher alphabet; must match the scorer's.
+        scorer: N-gram scorer or compiled `LanguageProfile` for the expected plaintext language.
+        prefix_length: Alphabet characters decrypted per candidate before rejection.
+        verify_length: Alphabet characters decrypted to rank surviving candidates.
+        threshold: Minimum prefix score; defaults to a third of the way from the
+            score of random text to that of the scorer's sample text.
+        top: Number of candidates to keep.
+        normalize: Applied to each word before reduction (e.g. `str.upper`); must be picklable.
+        batch_size: Candidates decrypted per index matrix.
+    """
+
+    ciphertext: TextLike
+    alphabet: Sequence[str]
+    scorer: Union[NgramScorer, LanguageProfile]
+    prefix_length: int = 48
+    verify_length: int = 1024
+    threshold: Optional[float] = None
+    top: int = 10
+    normalize: Optional[Callable[[str], str]] = None
+    batch_size: int = 4096
+    _arrays: AlphabetArrays = field(init=False, repr=False, compare=False)
+    _cipher: np.ndarray = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        ensure_not_empty(self.alphabet, "Alphabet must not be empty.")
+        if tuple(self.scorer.alphabet) != tuple(self.alphabet):
+            raise InvalidInputTypeError("Scorer alphabet does not match the cipher alphabet.")
+
+        text = coerce_to_native_text(self.ciphertext)
+        if not isinstance(text, str):
+            text = latin_1_decode(text)[0]
+        arrays = AlphabetArrays.build(self.alphabet)
+        indices = arrays.indices(to_code_points(text))
+        cipher = indices[indices >= 0].astype(np.int64)
+        if len(cipher) < self.scorer.order:
+            raise InvalidInputTypeError("Ciphertext is too short to score.")
+
+        object.__setattr__(self, "_arrays", arrays)
+        object.__setattr__(self, "_cipher", cipher)
+        if self.threshold is None:
+            object.__setattr__(self, "threshold", self.scorer.uniform + (self.scorer.expected - self.scorer.uniform) / 3)
+
+    def score_words(self, words: Iterable[str]) -> AttackResult:
+        """Try candidate keywords in this process."""
+        result = AttackResult(candidates=[])
+        words = iter(words)
+        while True:
+            batch = list(islice(words, self.batch_size))
+            if not batch:
+                return result
+            self._score_batch(batch, result)
+
+    def _score_batch(self, words: List[str], result: AttackResult) -> None:
+        normalize = self.normalize
+        stripped = [word.strip() for word in words]
+        stripped = [word for word in stripped if word]
+        if normalize is not None:
+            stripped = [normalize(word) for word in stripped]
+        pairs = [(word, reduce_keyword(word)) for word in stripped]
+        pairs = [(word, key) for word, key in pairs if len(key) >= 2]
+        result.tested += len(stripped)
+        result.invalid += len(stripped) - len(pairs)
+        if not pairs:
+            return
+
+        # All keys as one flat index array; keys with characters outside the alphabet drop out.
+        lengths = np.fromiter((len(key) for _, key in pairs), dtype=np.int64, count=len(pairs))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        flat = self._arrays.indices(to_code_points("".join(key for _, key in pairs))).astype(np.int64)
+        valid = np.minimum.reduceat(flat, starts) >= 0
+        result.invalid += int((~valid).sum())
+        lengths, starts = lengths[valid], starts[valid]
+        pairs = [pair for pair, ok in zip(pairs, valid) if ok]
+        if not pairs:
+            return
+
+        scores = self._decrypt_scores(flat, starts, lengths, self.prefix_length)
+        passed = np.flatnonzero(scores >= self.threshold)
+        result.rejected += len(pairs) - len(passed)
+        if not len(passed):
+            return
+
+        length = min(self.verify_length, len(self._cipher))
+        step = max(1, _VERIFY_CELLS // length)
+        found = []
+        for begin in range(0, len(passed), step):
+            rows = passed[begin:begin + step]
+            verified = self._decrypt_scores(flat, starts[rows], lengths[rows], length)
+            found.extend(Candidate(float(s), *pairs[row]) for s, row in zip(verified, rows))
+        result.candidates = merge_top(result.candidates + found, self.top)
+
+    def _decrypt_scores(self, flat: np.ndarray, starts: np.ndarray, lengths: np.ndarray, length: int) -> np.ndarray:
+        """Decrypt the first `length` characters under each key (one row per key) and score the rows."""
+        length = min(length, len(self._cipher))
+        columns = np.arange(length)
+        keys = flat[starts[:, None] + columns % lengths[:, None]]
+        plain = (self._cipher[:length] - keys) % len(self.alphabet)
+        return self.scorer.score_batch(plain)
+
+    def run(
+        self,
+        candidates: Union[str, os.PathLike, Iterable[str]],
+        workers: Optional[int] = None,
+        checkpoint: Optional[str] = None,
+        shard_size: Optional[int] = None,
+        encoding: str = "utf-8",
+    ) -> AttackResult:
+        """
+        Try every candidate, across a process pool.
+
+        Args:
+            candidates: Path of a wordlist (one keyword per line) or an iterable of keywords.
+            workers: Worker processes (default: CPU count); 1 runs in this process.
+            checkpoint: JSON file recording finished shards; an existing one is resumed.
+                Requires `normalize`, if set, to be a module-level function.
+            shard_size: Bytes of wordlist (files) or number of candidates (iterables) per shard.
+            encoding: Wordlist file encoding.
+
+        Returns:
+            The AttackResult over all shards, including those finished by earlier runs.
+        """
+        started = time.perf_counter()
+        workers = workers or os.cpu_count() or 1
+        if isinstance(candidates, (str, os.PathLike)):
+            path = os.fspath(candidates)
+            shard_size = shard_size or DEFAULT_SHARD_BYTES
+            shards = ((i, (path, start, end, encoding)) for i, (start, end) in enumerate(file_shards(path, shard_size)))
+            stat = os.stat(path)
+            source = {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        else:
+            shard_size = shard_size or DEFAULT_SHARD_WORDS
+            words = iter(candidates)
+            shards = enumerate(iter(lambda: list(islice(words, shard_size)), []))
+            source = {"iterable": True}
+
+        fingerprint = None
+        result, done, digests = AttackResult(candidates=[]), set(), {}
+        if checkpoint:
+            fingerprint = self._fingerprint(source, shard_size)
+            result, done, digests = _load_checkpoint(checkpoint, fingerprint)
+
+        def pending() -> Iterator[Tuple[int, Union[Tuple[str, int, int, str], List[str]]]]:
+            for i, task in shards:
+                if checkpoint and isinstance(task, list):
+                    # Iterables cannot be fingerprinted up front: each shard is hashed as it is read.
+                    digest = _shard_digest(task)
+                    if i in done and digests.get(i) != digest:
+                        raise InvalidCheckpointError(
+                            f"Checkpoint {checkpoint} was written for a different wordlist (shard {i} differs)."
+                        )
+                    digests[i] = digest
+                if i not in done:
+                    yield i, task
+
+        pending_shards = pending()
+
+        def collect(shard_id: int, shard: AttackResult) -> None:
+            result.candidates = merge_top(result.candidates + shard.candidates, self.top)
+            result.tested += shard.tested
+            result.rejected += shard.rejected
+            result.invalid += shard.invalid
+            result.shards += 1
+            done.add(shard_id)
+            if checkpoint:
+                _save_checkpoint(checkpoint, fingerprint, result, done, digests)
+
+        if workers == 1:
+            for shard_id, task in pending_shards:
+                collect(shard_id, self._run_task(task))
+        else:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(self,)) as pool:
+                running: Dict = {}
+                for shard_id, task in pending_shards:
+                    running[pool.submit(_run_worker_task, task)] = shard_id
+                    if len(running) >= 2 * workers:
+                        finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                        for future in finished:
+                            collect(running.pop(future), future.result())
+                for future in list(running):
+                    collect(running.pop(future), future.result())
+
+        result.seconds += time.perf_counter() - started
+        return result
+
+    def _run_task(self, task: Union[Tuple[str, int, int, str], List[str]]) -> AttackResult:
+        if isinstance(task, tuple):
+            return self.score_words(read_shard(*task))
+        return self.score_words(task)
+
+    def _fingerprint(self, source: Dict, shard_size: int) -> Dict:
+        normalize = None
+        if self.normalize is not None:
+            normalize = callable_identity(self.normalize)
+            if normalize is None:
+                raise InvalidInputTypeError("Checkpoints need `normalize` to be a module-level function, not a lambda.")
+
+        digest = hashlib.sha256(self._cipher.tobytes())
+        digest.update("\0".join(self.alphabet).encode("utf-8"))
+        tables = self.scorer.tables if isinstance(self.scorer, LanguageProfile) else {self.scorer.order: self.scorer}
+        scorer = hashlib.sha256()
+        for order in sorted(tables):
+            scorer.update(order.to_bytes(4, "little"))
+            scorer.update(np.ascontiguousarray(tables[order].log_probs, dtype=np.float32).tobytes())
+        return {
+            "version": CHECKPOINT_VERSION,
+            "ciphertext": digest.hexdigest(),
+            "scorer": scorer.hexdigest(),
+            "normalize": normalize,
+            "prefix_length": self.prefix_length,
+            "verify_length": self.verify_length,
+            "threshold": self.threshold,
+            "top": self.top,
+            "shard_size": shard_size,
+            "source": source,
+        }
+
+
+def file_shards(path: str, shard_size: int) -> List[Tuple[int, int]]:
+    """Byte ranges of a file; each line belongs to the shard its first byte falls in."""
+    size = os.path.getsize(path)
+    return [(start, min(start + shard_size, size)) for start in range(0, size, shard_size)]
+
+
+def read_shard(path: str, start: int, end: int, encoding: str = "utf-8") -> Iterator[str]:
+    """Lines of a wordlist that start within [start, end)."""
+    with open(path, "rb") as f:
+        if start > 0:
+            f.seek(start - 1)
+            f.readline()  # finish the line owned by the previous shard
+        position = f.tell()
+        if position >= end:
+            return iter(())
+        data = f.read(end - position)
+        if not data.endswith(b"\n"):
+            data += f.readline()
+    return iter(data.decode(encoding).splitlines())
+
+
+_worker_attack: Optional[DictionaryAttack] = None
+
+
+def _init_worker(attack: DictionaryAttack) -> None:
+    global _worker_attack
+    _worker_attack = attack
+
+
+def _run_worker_task(task) -> AttackResult:
+    return _worker_attack._run_task(task)
+
+
+def _shard_digest(words: List[str]) -> str:
+    return hashlib.sha256("\n".join(words).encode("utf-8", "surrogatepass")).hexdigest()
+
+
+def _load_checkpoint(path: str, fingerprint: Dict) -> Tuple[AttackResult, set, Dict[int, str]]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    except FileNotFoundError:
+        return AttackResult(candidates=[]), set(), {}
+    except ValueError:
+        raise InvalidCheckpointError(f"Checkpoint {path} is not valid JSON.")
+
+    if data.get("fingerprint") != fingerprint:
+        raise InvalidCheckpointError(f"Checkpoint {path} was written for a different ciphertext, wordlist or settings.")
+    result = AttackResult(
+        candidates=[Candidate(*entry) for entry in data["candidates"]],
+        tested=data["tested"],
+        rejected=data["rejected"],
+        invalid=data["invalid"],
+        shards=len(data["done"]),
+    )
+    return result, set(data["done"]), {int(i): digest for i, digest in data["digests"].items()}
+
+
+def _save_checkpoint(path: str, fingerprint: Dict, result: AttackResult, done: set, digests: Dict[int, str]) -> None:
+    data = {
+        "fingerprint": fingerprint,
+        "done": sorted(done),
+        "digests": {str(i): digests[i] for i in sorted(done) if i in digests},
+        "tested": result.tested,
+        "rejected": result.rejected,
+        "invalid": result.invalid,
+        "candidates": [[c.score, c.keyword, c.key] for c in result.candidates],
+    }
+    temporary = f"{path}.tmp"
+    with open(temporary, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(temporary, path)
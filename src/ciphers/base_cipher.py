@@ -1,22 +1,64 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import TYPE_CHECKING, Any, List, Optional
 from dataclasses import dataclass
+from utils.coercion import TextLike, coerce_to_native_text, restore_text_type, write_into
 from utils.validators import ensure_not_empty
 
+if TYPE_CHECKING:
+    from engines.streams import ChunkStream
+
 @dataclass
 class CipherBit(ABC):
-    text: List[str]
+    """
+    Base class for ciphers bound to a text.
+
+    The text may be a `str`, a bytes-like object (`bytes`, `bytearray`,
+    `memoryview`, read as Latin-1) or a list of characters; `encrypt` and
+    `decrypt` return the same type. Subclasses implement `_run_cipher` on the
+    native form of the text (see `native_text`).
+    """
+
+    text: TextLike
     alphabet: List[str]
 
     def __post_init__(self):
         ensure_not_empty(self.text, "Text must not be empty.")
         ensure_not_empty(self.alphabet, "Alphabet must not be empty.")
 
-    @abstractmethod
-    def encrypt(self) -> List[str]:
-        pass
+    @property
+    def native_text(self):
+        """The text as `str` or bytes-like object, without per-character copies."""
+        return coerce_to_native_text(self.text)
 
     @abstractmethod
-    def decrypt(self) -> List[str]:
-        pass
+    def _run_cipher(self, decrypt: bool):
+        """Encrypt or decrypt `native_text`, returning str or bytes."""
+
+    def encrypt(self) -> TextLike:
+        return restore_text_type(self._run_cipher(decrypt=False), self.text)
+
+    def decrypt(self) -> TextLike:
+        return restore_text_type(self._run_cipher(decrypt=True), self.text)
+
+    def _open_stream(self, decrypt: bool) -> Optional["ChunkStream"]:
+        """The chunk stream `_run_cipher` runs on, if any."""
+        return None
+
+    def encrypt_into(self, out: Any) -> int:
+        """
+        Encrypt bytes-like text into a preallocated writable buffer; returns bytes written.
+
+        Ciphers with a chunk stream write each chunk straight into `out`;
+        others build the whole result first and copy it.
+        """
+        return self._run_into(out, decrypt=False)
+
+    def decrypt_into(self, out: Any) -> int:
+        """Decrypt bytes-like text into a preallocated writable buffer; returns bytes written."""
+        return self._run_into(out, decrypt=True)
 
+    def _run_into(self, out: Any, decrypt: bool) -> int:
+        stream = self._open_stream(decrypt)
+        if stream is None:
+            return write_into(out, self._run_cipher(decrypt))
+        return stream.process_into(self.native_text, out)
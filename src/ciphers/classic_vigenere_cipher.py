@@ -1,45 +1,71 @@
-from typing import List, Callable
+from typing import Optional, Sequence, Union
 from dataclasses import dataclass, field
 
 from ciphers.base_cipher import CipherBit
-from transforms.list_ops import rotate_sequence_by_lookup_values
-from structures.sequences import KeywordSequence, AlphabetSequence
+from engines.kernels import KeyedKernel, ShiftKernel
+from engines.tables import build_index_map
+from engines.key_streams import KeySource
+from engines.streams import ChunkStream, open_stream
+from specs.types import VigenereMode
+from structures.sequences import AlphabetSequence, KeywordSequence
+from utils.coercion import NativeText, TextLike
+from utils.error import InvalidKeywordError
 
 
-@dataclass
-class ClassicVigenereCipher(CipherBit):
-    keyword: KeywordSequence
-    _key_chars: List[str] = field(init=False)
-    _rotations: List[List[str]] = field(init=False)
+def build_vigenere_kernel(
+    alphabet: Sequence[str],
+    keyword: Optional[Union[KeywordSequence, Sequence[str]]],
+    mode: VigenereMode = VigenereMode.REPEATING,
+    key_source: Optional[KeySource] = None,
+    engine: str = "translate",
+) -> Union[ShiftKernel, KeyedKernel]:
+    """
+    Compile the kernel for a Vigenère cipher in the given mode.
 
-    def __post_init__(self):
-        super().__post_init__()
-        self._key_chars = list(self.keyword)
-        self._rotations = rotate_sequence_by_lookup_values(self._key_chars, list(self.alphabet))
+    In AUTOKEY mode `keyword` is the primer, taken character for character
+    (pass the raw keyword, not a deduplicated `KeywordSequence`).
 
-    def __call__(self, mode: str = "encrypt") -> List[str]:
-        return self.encrypt() if mode == "encrypt" else self.decrypt()
+    Example:
+        >>> kernel = build_vigenere_kernel(list("ABC"), KeywordSequence("CB"))
+        >>> kernel.shifts
+        (2, 1)
+    """
+    if mode is VigenereMode.RUNNING_KEY:
+        if key_source is None:
+            raise InvalidKeywordError("Key source must be provided for running-key Vigenère cipher.")
+        return KeyedKernel(alphabet=tuple(alphabet), key_source=key_source, engine=engine)
+
+    if keyword is None:
+        raise InvalidKeywordError(f"Keyword must be provided for {mode.value} Vigenère cipher.")
 
-    def _run_cipher(self, lookup: Callable[[List[str], str], str]) -> List[str]:
-        result = []
-        key_index = 0
+    index_map = alphabet.index_map if isinstance(alphabet, AlphabetSequence) else build_index_map(alphabet)
+    if any(char not in index_map for char in keyword):
+        raise InvalidKeywordError(f"Keyword characters must belong to the alphabet (got: {list(keyword)}).")
 
-        for char in self.text:
-            if char not in self.alphabet:
-                result.append(char)
-                continue
+    if mode is VigenereMode.AUTOKEY:
+        return KeyedKernel(alphabet=tuple(alphabet), primer=tuple(keyword), engine=engine)
 
-            key_char = self._key_chars[key_index % len(self._key_chars)]
-            rotated_row = self._rotations[self._key_chars.index(key_char)]
+    return ShiftKernel(alphabet=tuple(alphabet), shifts=tuple(index_map[char] for char in keyword), engine=engine)
 
-            result.append(lookup(rotated_row, char))
-            key_index += 1
 
-        return result
+@dataclass
+class ClassicVigenereCipher(CipherBit):
+    keyword: Optional[Union[KeywordSequence, Sequence[str]]] = None
+    mode: VigenereMode = VigenereMode.REPEATING
+    key_source: Optional[KeySource] = None
+    engine: str = "translate"
+    _kernel: Union[ShiftKernel, KeyedKernel] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._kernel = build_vigenere_kernel(self.alphabet, self.keyword, self.mode, self.key_source, self.engine)
 
-    def encrypt(self) -> List[str]:
-        return self._run_cipher(lambda row, char: row[self.alphabet.index(char)])
+    def __call__(self, mode: str = "encrypt") -> TextLike:
+        return self.encrypt() if mode == "encrypt" else self.decrypt()
 
-    def decrypt(self) -> List[str]:
-        return self._run_cipher(lambda row, char: self.alphabet[self.alphabet.index(char)] if char in row else '?')
+    def _open_stream(self, decrypt: bool) -> ChunkStream:
+        return open_stream(self._kernel, decrypt)
 
+    def _run_cipher(self, decrypt: bool) -> NativeText:
+        # Key and text are consumed in lockstep chunks by the stream.
+        return self._open_stream(decrypt).process_all(self.native_text)
@@ -0,0 +1,115 @@
+# src/ciphers/keyed_cipher.py
+
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable, List, Optional, Tuple
+
+from engines.kernels import KeyedKernel
+from engines.streams import DEFAULT_CHUNK, Kernel, open_stream
+from specs.registry import build_kernel
+from specs.spec import CipherSpec
+from utils.coercion import TextLike, coerce_to_native_text, restore_text_type
+
+"""
+Keyed ciphers: compiled key material that is not bound to a text.
+
+A `CipherBit` holds its text, so serving many requests means building one
+cipher per request. A `KeyedCipher` holds only the compiled kernel, which is
+immutable once its lazy tables are built (they are built up front here), so
+one instance can serve any number of threads at once: every call opens its
+own stream, and all per-call state (key position, key reader, autokey tail)
+lives in that stream.
+
+Running-key ciphers replay their key source from the start for each call,
+so the source must be replayable (`mapped_file_source`, or
+`iterable_source` over a list or string).
+
+Thread pools help in two ways. `map` serves many texts concurrently, which
+pays off when requests wait on I/O, with the NumPy engines (which release the
+GIL) and on free-threaded Python builds. `encrypt`/`decrypt` with an
+`executor` split one large text into chunks, prepare the chunks in order and
+transform them on the executor's workers.
+"""
+
+
+@dataclass(frozen=True)
+class KeyedCipher:
+    """
+    A reentrant cipher over compiled key material, safe to share across threads.
+
+    Example:
+        >>> spec = CipherSpec(type="vigenere", text="", alphabet="ABCDEFGHIJKLMNOPQRSTUVWXYZ", keyword="KEY")
+        >>> cipher = KeyedCipher.from_spec(spec)
+        >>> cipher.encrypt("HELLO, WORLD"), cipher.decrypt(b"RIJVS, UYVJN")
+        ('RIJVS, UYVJN', b'HELLO, WORLD')
+        >>> cipher.map(["ATTACK", "AT DAWN"])
+        ['KXRKGI', 'KX BKAL']
+    """
+
+    kernel: Kernel
+
+    def __post_init__(self):
+        # Build every lazily compiled table now, so that concurrent calls only ever read the kernel.
+        sample = "".join(self.kernel.alphabet)
+        for decrypt in (False, True):
+            if isinstance(self.kernel, KeyedKernel):
+                self.kernel.transform_with_key(sample, sample, decrypt)
+            else:
+                self.kernel.transform(sample, 0, decrypt)
+
+    @classmethod
+    def from_spec(cls, spec: CipherSpec, text_size: Optional[int] = None) -> "KeyedCipher":
+        """
+        Compile a spec's key; its text is ignored.
+
+        The engine is the one the planner picks for texts of `text_size`
+        characters (default: the size of `spec.text`), unless the spec forces one.
+        """
+        return cls(build_kernel(spec, spec.plan(text_size=text_size, allow_parallel=False).engine))
+
+    @property
+    def alphabet(self) -> Tuple[str, ...]:
+        return self.kernel.alphabet
+
+    @property
+    def engine(self) -> str:
+        return self.kernel.engine
+
+    def encrypt(self, text: TextLike, executor: Optional[Executor] = None, chunk_size: int = DEFAULT_CHUNK) -> TextLike:
+        """Encrypt `text`, returning the same type; chunks run on `executor` if given."""
+        return restore_text_type(self._run(text, False, executor, chunk_size), text)
+
+    def decrypt(self, text: TextLike, executor: Optional[Executor] = None, chunk_size: int = DEFAULT_CHUNK) -> TextLike:
+        """Decrypt `text`, returning the same type; chunks run on `executor` if given."""
+        return restore_text_type(self._run(text, True, executor, chunk_size), text)
+
+    def encrypt_into(self, text: TextLike, out: Any, chunk_size: int = DEFAULT_CHUNK) -> int:
+        """Encrypt bytes-like text chunk by chunk straight into a preallocated writable buffer; returns bytes written."""
+        return open_stream(self.kernel, False).process_into(coerce_to_native_text(text), out, chunk_size)
+
+    def decrypt_into(self, text: TextLike, out: Any, chunk_size: int = DEFAULT_CHUNK) -> int:
+        """Decrypt bytes-like text chunk by chunk straight into a preallocated writable buffer; returns bytes written."""
+        return open_stream(self.kernel, True).process_into(coerce_to_native_text(text), out, chunk_size)
+
+    def map(
+        self,
+        texts: Iterable[TextLike],
+        decrypt: bool = False,
+        executor: Optional[Executor] = None,
+        workers: Optional[int] = None,
+    ) -> List[TextLike]:
+        """
+        Encrypt (or decrypt) many texts concurrently, returning results in order.
+
+        Runs on `executor` if given, else on a thread pool of `workers`
+        threads (default: one per CPU) for the duration of the call.
+        """
+        run = self.decrypt if decrypt else self.encrypt
+        if executor is not None:
+            return list(executor.map(run, texts))
+        with ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1, thread_name_prefix="keyed-cipher") as pool:
+            return list(pool.map(run, texts))
+
+    def _run(self, text: TextLike, decrypt: bool, executor: Optional[Executor], chunk_size: int):
+        return open_stream(self.kernel, decrypt).process_all(coerce_to_native_text(text), chunk_size, executor)
@@ -1,24 +1,26 @@
-from typing import List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ciphers.base_cipher import CipherBit
-from transforms.rot_ops import shift_characters
-from structures.sequences import TextSequence, AlphabetSequence 
+from engines.kernels import ShiftKernel
+from engines.streams import ChunkStream, open_stream
+from utils.coercion import NativeText, TextLike
 
 
 @dataclass
 class RotCipher(CipherBit):
     shift: int
+    engine: str = "translate"
+    _kernel: ShiftKernel = field(init=False, repr=False)
 
     def __post_init__(self):
         super().__post_init__()
+        self._kernel = ShiftKernel(alphabet=tuple(self.alphabet), shifts=(self.shift,), fill='?', engine=self.engine)
 
-    def __call__(self, mode: str = "encrypt") -> List[str]:
+    def __call__(self, mode: str = "encrypt") -> TextLike:
         return self.encrypt() if mode == "encrypt" else self.decrypt()
 
-    def encrypt(self) -> List[str]:
-        return shift_characters(self.text, self.alphabet, self.shift)
-
-    def decrypt(self) -> List[str]:
-        return shift_characters(self.text, self.alphabet, -self.shift)
+    def _open_stream(self, decrypt: bool) -> ChunkStream:
+        return open_stream(self._kernel, decrypt)
 
+    def _run_cipher(self, decrypt: bool) -> NativeText:
+        return self._open_stream(decrypt).process_all(self.native_text)
@@ -0,0 +1,29 @@
+from dataclasses import dataclass, field
+from typing import List
+
+from ciphers.base_cipher import CipherBit
+from engines.kernels import SubstitutionKernel
+from engines.streams import ChunkStream, open_stream
+from utils.coercion import NativeText, TextLike
+
+
+@dataclass
+class SubstitutionCipher(CipherBit):
+    cipher_alphabet: List[str]
+    engine: str = "translate"
+    _kernel: SubstitutionKernel = field(init=False, repr=False)
+
+    def __post_init__(self):
+        super().__post_init__()
+        self._kernel = SubstitutionKernel(
+            alphabet=tuple(self.alphabet), cipher_alphabet=tuple(self.cipher_alphabet), engine=self.engine
+        )
+
+    def __call__(self, mode: str = "encrypt") -> TextLike:
+        return self.encrypt() if mode == "encrypt" else self.decrypt()
+
+    def _open_stream(self, decrypt: bool) -> ChunkStream:
+        return open_stream(self._kernel, decrypt)
+
+    def _run_cipher(self, decrypt: bool) -> NativeText:
+        return self._open_stream(decrypt).process_all(self.native_text)
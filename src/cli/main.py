@@ -0,0 +1,124 @@
+# src/cli/main.py
+
+import argparse
+import codecs
+import os
+import sys
+from contextlib import ExitStack
+from typing import List, Optional
+
+from cli.pipeline import run_pipeline
+from engines.kernels import ENGINES
+from engines.planner import AUTO
+from engines.key_streams import mapped_file_source
+from engines.streams import open_stream
+from specs.registry import build_kernel
+from specs.spec import CipherSpec
+from specs.types import VigenereMode
+from utils.error import CryptoTractatusError
+
+"""
+Command-line entry point: `python -m cli`.
+
+    python -m cli --type vigenere --alphabet ABCDEFGHIJKLMNOPQRSTUVWXYZ --keyword LEMON < in.txt > out.txt
+    python -m cli --type rot --alphabet ABC --shift 1 --decrypt -i out.txt -o in.txt
+    python -m cli --type vigenere --mode running --key-file book.txt --alphabet ABC ...
+"""
+
+
+_SIZE_SUFFIXES = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30}
+
+
+def parse_size(value: str) -> int:
+    """
+    Parse a byte count with an optional K/M/G suffix.
+
+    >>> parse_size("64K")
+    65536
+    >>> parse_size("2M")
+    2097152
+    """
+    value = value.strip().upper()
+    factor = _SIZE_SUFFIXES.get(value[-1:], 1)
+    digits = value[:-1] if factor != 1 else value
+    try:
+        size = int(digits) * factor
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {value!r}")
+    if size <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive: {value!r}")
+    return size
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m cli",
+        description="Stream text through a cipher.",
+    )
+    parser.add_argument("-t", "--type", required=True, help="Cipher type, e.g. rot or vigenere.")
+    parser.add_argument("-a", "--alphabet", required=True, help="Cipher alphabet.")
+    parser.add_argument("-k", "--keyword", help="Keyword for keyed ciphers.")
+    parser.add_argument("-s", "--shift", type=int, help="Shift for rotation ciphers.")
+    parser.add_argument("-m", "--mode", choices=[mode.value for mode in VigenereMode], help="Vigenère key mode.")
+    parser.add_argument("--key-file", help="Key file for running-key ciphers (memory-mapped).")
+    parser.add_argument("-d", "--decrypt", action="store_true", help="Decrypt instead of encrypt.")
+    parser.add_argument("-i", "--input", default="-", help="Input file (default: stdin).")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout).")
+    parser.add_argument("--chunk-size", type=parse_size, default=1 << 20, help="Bytes per chunk, e.g. 256K or 4M.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of cipher threads (1 for autokey decryption).")
+    parser.add_argument(
+        "--engine", choices=[AUTO] + sorted(ENGINES), default=AUTO,
+        help="Execution engine (default: chosen by the planner per chunk size).",
+    )
+    parser.add_argument("--explain", action="store_true", help="Print the execution plan to stderr.")
+    parser.add_argument("--encoding", default="utf-8", help="Text encoding of input and output.")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Do not report throughput.")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        codecs.lookup(args.encoding)
+    except LookupError:
+        parser.error(f"unknown encoding: {args.encoding}")
+    if args.key_file and not os.path.isfile(args.key_file):
+        parser.error(f"key file not found: {args.key_file}")
+
+    spec = CipherSpec(
+        type=args.type,
+        text="",
+        alphabet=args.alphabet,
+        keyword=args.keyword,
+        shift=args.shift,
+        mode=VigenereMode(args.mode) if args.mode else None,
+        key_source=mapped_file_source(args.key_file, args.encoding) if args.key_file else None,
+        engine=args.engine,
+    )
+    try:
+        # Chunks already run concurrently on the pipeline's workers.
+        plan = spec.plan(text_size=args.chunk_size, allow_parallel=False)
+        stream = open_stream(build_kernel(spec, plan.engine), args.decrypt)
+    except CryptoTractatusError as exc:
+        parser.error(str(exc))
+    if args.explain:
+        print(plan.explain(), file=sys.stderr)
+
+    try:
+        with ExitStack() as files:
+            # The input is opened first, so a missing input does not truncate the output.
+            source = sys.stdin.buffer if args.input == "-" else files.enter_context(open(args.input, "rb"))
+            sink = sys.stdout.buffer if args.output == "-" else files.enter_context(open(args.output, "wb"))
+            stats = run_pipeline(
+                source, sink, stream.prepare, stream.transform,
+                chunk_size=args.chunk_size,
+                workers=args.workers if stream.parallel else 1,
+                encoding=args.encoding,
+            )
+    except (CryptoTractatusError, ValueError, OSError) as exc:
+        parser.exit(1, f"{parser.prog}: error: {exc}\n")
+
+    if not args.quiet:
+        print(f"{parser.prog}: {stats.summary()}", file=sys.stderr)
+    return 0
@@ -0,0 +1,175 @@
+# src/cli/pipeline.py
+
+import codecs
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, BinaryIO, Callable, Dict
+
+from utils.validators import ensure_greater_then
+
+"""
+Threaded streaming pipeline: read -> cipher -> write.
+
+The reader decodes chunks and runs `prepare` on each one in order (this is
+where key state such as the key position moves forward), cipher workers run
+`transform` on chunks independently, and the writer puts them back in
+order. Stages are connected by bounded queues holding `depth` chunks per
+worker, so with the default depth of 2 every stage works on one chunk while
+the next one is already buffered (double buffering) and memory stays bounded
+at a few chunks regardless of input size.
+"""
+
+
+Prepare = Callable[[str], Any]
+Transform = Callable[[str, Any], str]
+
+_DONE = object()
+
+
+@dataclass
+class PipelineStats:
+    """Byte counts and wall time of a pipeline run."""
+
+    bytes_in: int = 0
+    bytes_out: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mb_per_s(self) -> float:
+        """Input throughput in MB/s (10**6 bytes)."""
+        return self.bytes_in / 1e6 / self.seconds if self.seconds > 0 else 0.0
+
+    def summary(self) -> str:
+        return (
+            f"{self.bytes_in / 1e6:.2f} MB in {self.seconds:.3f} s "
+            f"({self.mb_per_s:.1f} MB/s, {self.chunks} chunks)"
+        )
+
+
+def run_pipeline(
+    source: BinaryIO,
+    sink: BinaryIO,
+    prepare: Prepare,
+    transform: Transform,
+    chunk_size: int = 1 << 20,
+    workers: int = 1,
+    depth: int = 2,
+    encoding: str = "utf-8",
+) -> PipelineStats:
+    """
+    Stream `source` through `transform` into `sink`.
+
+    Args:
+        source: Binary input stream.
+        sink: Binary output stream.
+        prepare: Function called on each chunk in order, returning its context.
+        transform: Function of (chunk, context) returning the transformed chunk.
+        chunk_size: Bytes read per chunk.
+        workers: Number of cipher threads.
+        depth: Chunks buffered per worker between stages.
+        encoding: Text encoding of input and output.
+
+    Returns:
+        PipelineStats for the run.
+    """
+    ensure_greater_then(chunk_size, 0, "Chunk size must be greater than 0.")
+    ensure_greater_then(workers, 0, "Worker count must be greater than 0.")
+    ensure_greater_then(depth, 0, "Pipeline depth must be greater than 0.")
+    # Looked up before any thread starts: an unknown encoding raises LookupError here.
+    decoder = codecs.getincrementaldecoder(encoding)()
+
+    stats = PipelineStats()
+    inbox: "queue.Queue" = queue.Queue(maxsize=depth * workers)
+    outbox: "queue.Queue" = queue.Queue(maxsize=depth * workers)
+    stop = threading.Event()
+    errors: list = []
+
+    def put(q: "queue.Queue", item) -> bool:
+        while not stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def get(q: "queue.Queue"):
+        while not stop.is_set():
+            try:
+                return q.get(timeout=0.1)
+            except queue.Empty:
+                continue
+        return _DONE
+
+    def read() -> None:
+        seq = 0
+        try:
+            while True:
+                raw = source.read(chunk_size)
+                stats.bytes_in += len(raw)
+                text = decoder.decode(raw, final=not raw)
+                if text:
+                    if not put(inbox, (seq, text, prepare(text))):
+                        return
+                    seq += 1
+                if not raw:
+                    break
+        except BaseException as exc:
+            errors.append(exc)
+            stop.set()
+        finally:
+            stats.chunks = seq
+            for _ in range(workers):
+                put(inbox, _DONE)
+
+    def work() -> None:
+        try:
+            while True:
+                item = get(inbox)
+                if item is _DONE:
+                    break
+                seq, text, context = item
+                if not put(outbox, (seq, transform(text, context).encode(encoding))):
+                    break
+        except BaseException as exc:
+            errors.append(exc)
+            stop.set()
+        finally:
+            put(outbox, _DONE)
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=read, name="pipeline-reader", daemon=True)]
+    threads += [threading.Thread(target=work, name=f"pipeline-worker-{i}", daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+
+    pending: Dict[int, bytes] = {}
+    next_seq = 0
+    finished = 0
+    try:
+        while finished < workers:
+            item = get(outbox)
+            if item is _DONE:
+                finished += 1
+                continue
+            seq, data = item
+            pending[seq] = data
+            while next_seq in pending:
+                data = pending.pop(next_seq)
+                sink.write(data)
+                stats.bytes_out += len(data)
+                next_seq += 1
+    finally:
+        stop.set()
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+
+    sink.flush()
+    stats.seconds = time.perf_counter() - started
+    return stats
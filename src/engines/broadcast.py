@@ -0,0 +1,139 @@
+# src/engines/broadcast.py
+
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from engines.numpy_engine import AlphabetArrays, from_code_points, to_code_points
+from structures.sequences import KeywordSequence
+from utils.coercion import TextLike, coerce_to_native_text, restore_text_type
+from utils.error import InvalidInputTypeError, InvalidKeywordError
+from utils.validators import ensure_not_empty
+
+"""
+Broadcast encryption: one text under many keys in one vectorized step.
+
+The text is mapped to alphabet indices once. Shifts (ROT) or keywords
+(Vigenère) are stacked into a keys x characters index matrix, added to the
+text indices by broadcasting and mapped back, giving a keys x text matrix of
+code points with one ciphertext per row. The `iter_*` methods do the same a
+block of keys at a time and yield one ciphertext per key, so the number of
+keys is unbounded while memory stays at `block_cells` code points.
+"""
+
+
+# Code points computed per block by the iterators.
+DEFAULT_BLOCK_CELLS = 1 << 22
+
+Keyword = Union[str, List[str], KeywordSequence]
+
+
+@dataclass(frozen=True)
+class BroadcastText:
+    """
+    A text compiled for encryption under many keys.
+
+    Results follow `RotCipher` and `ClassicVigenereCipher`: ROT replaces
+    characters outside the alphabet with '?', Vigenère leaves them in place
+    and advances the key on alphabet characters only.
+
+    Example:
+        >>> text = BroadcastText("HELLO, WORLD", tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+        >>> list(text.iter_rot([1, 3]))
+        ['IFMMP??XPSME', 'KHOOR??ZRUOG']
+        >>> [text.row_text(row) for row in text.vigenere_matrix(["KEY", "LEMON"])]
+        ['RIJVS, UYVJN', 'SIXZB, HSDZQ']
+    """
+
+    text: TextLike
+    alphabet: Sequence[str]
+    block_cells: int = DEFAULT_BLOCK_CELLS
+    _arrays: AlphabetArrays = field(init=False, repr=False, compare=False)
+    _source: np.ndarray = field(init=False, repr=False, compare=False)
+    _mask: np.ndarray = field(init=False, repr=False, compare=False)
+    _indices: np.ndarray = field(init=False, repr=False, compare=False)
+    _dtype: type = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        ensure_not_empty(self.alphabet, "Alphabet must not be empty.")
+        text = coerce_to_native_text(self.text)
+        ensure_not_empty(text, "Text must not be empty.")
+        source = to_code_points(text) if isinstance(text, str) else np.frombuffer(text, dtype=np.uint8)
+
+        arrays = AlphabetArrays.build(self.alphabet)
+        indices = arrays.indices(source)
+        mask = indices >= 0
+
+        # One byte per code point when text and alphabet (and ROT's '?') all fit.
+        narrow = source.dtype == np.uint8 and int(arrays.code_points.max()) < 256
+        if not narrow and not isinstance(text, str):
+            raise InvalidInputTypeError("Byte input requires an alphabet of code points below 256.")
+
+        object.__setattr__(self, "_arrays", arrays)
+        object.__setattr__(self, "_source", source)
+        object.__setattr__(self, "_mask", mask)
+        object.__setattr__(self, "_indices", indices[mask].astype(np.int64))
+        object.__setattr__(self, "_dtype", np.uint8 if narrow else np.uint32)
+
+    def rot_matrix(self, shifts: Sequence[int], decrypt: bool = False) -> np.ndarray:
+        """Code points of the text under each shift, one row per shift."""
+        shifts = np.asarray(shifts, dtype=np.int64).reshape(-1, 1)
+        return self._rows(-shifts if decrypt else shifts, fill="?")
+
+    def vigenere_matrix(self, keywords: Sequence[Keyword], decrypt: bool = False) -> np.ndarray:
+        """Code points of the text under each keyword, one row per keyword."""
+        keys = self._key_matrix(keywords)
+        return self._rows(-keys if decrypt else keys, fill=None)
+
+    def iter_rot(self, shifts: Iterable[int], decrypt: bool = False) -> Iterator[TextLike]:
+        """Ciphertext under each shift, computed a block of shifts at a time."""
+        for block in self._blocks(shifts):
+            yield from map(self.row_text, self.rot_matrix(block, decrypt))
+
+    def iter_vigenere(self, keywords: Iterable[Keyword], decrypt: bool = False) -> Iterator[TextLike]:
+        """Ciphertext under each keyword, computed a block of keywords at a time."""
+        for block in self._blocks(keywords):
+            yield from map(self.row_text, self.vigenere_matrix(block, decrypt))
+
+    def row_text(self, row: np.ndarray) -> TextLike:
+        """One row of a result matrix as text of the input's type."""
+        if isinstance(coerce_to_native_text(self.text), str):
+            return restore_text_type(from_code_points(row), self.text)
+        return restore_text_type(row.tobytes(), self.text)
+
+    def _blocks(self, keys: Iterable) -> Iterator[list]:
+        rows = max(1, self.block_cells // len(self._source))
+        keys = iter(keys)
+        return iter(lambda: list(islice(keys, rows)), [])
+
+    def _key_matrix(self, keywords: Sequence[Keyword]) -> np.ndarray:
+        """Key index at each alphabet character of the text, one row per keyword."""
+        reduced = ["".join(KeywordSequence(keyword)) for keyword in keywords]
+        if not reduced:
+            return np.empty((0, len(self._indices)), dtype=np.int64)
+
+        lengths = np.fromiter(map(len, reduced), dtype=np.int64, count=len(reduced))
+        starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+        flat = self._arrays.indices(to_code_points("".join(reduced))).astype(np.int64)
+        invalid = np.flatnonzero(np.minimum.reduceat(flat, starts) < 0)
+        if len(invalid):
+            raise InvalidKeywordError(
+                f"Keyword characters must belong to the alphabet (got: {list(reduced[invalid[0]])})."
+            )
+        positions = np.arange(len(self._indices))
+        return flat[starts[:, None] + positions % lengths[:, None]]
+
+    def _rows(self, shifts: np.ndarray, fill: Optional[str]) -> np.ndarray:
+        n = len(self.alphabet)
+        code_points = self._arrays.code_points.astype(self._dtype)
+        shifted = code_points[(self._indices + shifts) % n]
+        if self._mask.all():
+            return shifted
+
+        base = self._source if fill is None else np.full(len(self._source), ord(fill))
+        out = np.empty((len(shifted), len(self._source)), dtype=self._dtype)
+        out[:] = base.astype(self._dtype)
+        out[:, self._mask] = shifted
+        return out
@@ -0,0 +1,491 @@
+# src/engines/kernels.py
+
+from codecs import latin_1_decode, latin_1_encode
+from dataclasses import dataclass, field
+from importlib.util import find_spec
+from itertools import accumulate
+from operator import add
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from engines.key_streams import KeySource
+from engines.tables import (
+    build_byte_shift_table,
+    build_byte_substitution_table,
+    build_index_map,
+    build_shift_table,
+    build_strip_table,
+    build_substitution_table,
+)
+from utils.coercion import BytesLike
+from utils.error import InvalidEngineError, InvalidInputTypeError, InvalidKeywordError
+from utils.validators import ensure_not_empty
+
+"""
+Compiled cipher kernels.
+
+A kernel holds only compiled key material (index maps, shifted rows and
+translate tables) and never the text, so one kernel can transform any number
+of chunks. Keyed ciphers advance their key on alphabet characters only, so a
+chunk is transformed at a key `position`; `advance` tells the caller how far
+the key moved across a chunk, which gives the position of the next one.
+Non-periodic keys (running key, autokey) are handed to the kernel explicitly
+instead, one key character per alphabet character of the chunk.
+
+Byte input is read as Latin-1, one character per byte, and requires an
+alphabet of code points below 256.
+
+A substitution kernel applies one fixed permutation of the alphabet; like a
+single shift it has no key state.
+
+Each kernel runs on a named engine. "translate" and "dict" are pure Python;
+"numpy" and "parallel" live in `engines.numpy_engine`, which is imported on
+first use so that NumPy stays optional and off the import path.
+"""
+
+
+# Largest alphabet for which keyed kernels precompute a (text, key) pair table.
+PAIR_TABLE_LIMIT = 128
+
+# Periodic keys: `run_translate` takes passthrough characters out of the text
+# when at most one character in this many is one, else uses `run_dict`.
+SPARSE_PASSTHROUGH = 5
+
+# Engines that need NumPy.
+NUMPY_ENGINES = ("numpy", "parallel")
+
+_numpy_available: Optional[bool] = None
+
+
+def numpy_available() -> bool:
+    """Whether NumPy can be imported (checked without importing it)."""
+    global _numpy_available
+    if _numpy_available is None:
+        _numpy_available = find_spec("numpy") is not None
+    return _numpy_available
+
+
+def _check_engine(engine: str, engines: Dict[str, Any]) -> None:
+    if engine not in engines:
+        raise InvalidEngineError(f"Unknown engine '{engine}' (available: {', '.join(engines)}).")
+    if engine in NUMPY_ENGINES and not numpy_available():
+        raise InvalidEngineError(f"Engine '{engine}' requires NumPy, which is not installed.")
+
+
+@dataclass(frozen=True)
+class ShiftKernel:
+    """
+    Shift each alphabet character by a periodic stream of key offsets.
+
+    ROT is a kernel with a single shift that replaces unknown characters with
+    '?', Vigenère one shift per keyword character that leaves them untouched.
+
+    Attributes:
+        alphabet: Reference alphabet.
+        shifts: Key stream offsets, repeated for the length of the text.
+        fill: Replacement for characters outside the alphabet (None = passthrough).
+        engine: Name of the engine in `ENGINES` used to run the kernel.
+
+    Example:
+        >>> kernel = ShiftKernel(alphabet=tuple("ABC"), shifts=(1, 2))
+        >>> kernel.transform("AB-C")
+        'BA-A'
+        >>> kernel.transform("BA-A", decrypt=True)
+        'AB-C'
+        >>> kernel.advance("AB-C")
+        3
+    """
+
+    alphabet: Tuple[str, ...]
+    shifts: Tuple[int, ...]
+    fill: Optional[str] = None
+    engine: str = "translate"
+    index_map: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _rows: Tuple[Tuple[str, ...], ...] = field(init=False, repr=False, compare=False)
+    _inverse_rows: Tuple[Tuple[str, ...], ...] = field(init=False, repr=False, compare=False)
+    _tables: Tuple[Dict[int, str], ...] = field(init=False, repr=False, compare=False)
+    _inverse_tables: Tuple[Dict[int, str], ...] = field(init=False, repr=False, compare=False)
+    _strip: Dict[int, None] = field(init=False, repr=False, compare=False)
+    _byte_tables: Optional[Tuple[bytes, ...]] = field(init=False, repr=False, compare=False)
+    _inverse_byte_tables: Optional[Tuple[bytes, ...]] = field(init=False, repr=False, compare=False)
+    _compiled: Dict[str, Any] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def __post_init__(self):
+        ensure_not_empty(self.alphabet, "Alphabet must not be empty.")
+        ensure_not_empty(self.shifts, "Key stream must not be empty.")
+        _check_engine(self.engine, ENGINES)
+
+        n = len(self.alphabet)
+        distinct = {shift % n for shift in self.shifts}
+        tables = {s: build_shift_table(self.alphabet, s, self.fill) for s in distinct}
+        inverse = {s: build_shift_table(self.alphabet, -s, self.fill) for s in distinct}
+
+        object.__setattr__(self, "index_map", build_index_map(self.alphabet))
+        object.__setattr__(self, "_tables", tuple(tables[s % n] for s in self.shifts))
+        object.__setattr__(self, "_inverse_tables", tuple(inverse[s % n] for s in self.shifts))
+        object.__setattr__(self, "_rows", tuple(
+            tuple(self.alphabet[(i + s) % n] for i in range(n)) for s in self.shifts
+        ))
+        object.__setattr__(self, "_inverse_rows", tuple(
+            tuple(self.alphabet[(i - s) % n] for i in range(n)) for s in self.shifts
+        ))
+        object.__setattr__(self, "_strip", build_strip_table(self.alphabet))
+
+        byte_tables = byte_inverse = None
+        if build_byte_shift_table(self.alphabet, 0, self.fill) is not None:
+            byte_tables = tuple(build_byte_shift_table(self.alphabet, s, self.fill) for s in self.shifts)
+            byte_inverse = tuple(build_byte_shift_table(self.alphabet, -s, self.fill) for s in self.shifts)
+        object.__setattr__(self, "_byte_tables", byte_tables)
+        object.__setattr__(self, "_inverse_byte_tables", byte_inverse)
+
+    @property
+    def period(self) -> int:
+        return len(self.shifts)
+
+    def advance(self, text: str) -> int:
+        """Number of key positions consumed by `text` (its alphabet characters)."""
+        if self.period == 1:
+            return 0
+        return len(text) - len(text.translate(self._strip))
+
+    def transform(self, text: str, position: int = 0, decrypt: bool = False) -> str:
+        """Encrypt (or decrypt) `text`, starting at key `position`."""
+        return ENGINES[self.engine](self, text, position, decrypt)
+
+    def transform_bytes(self, data: BytesLike, position: int = 0, decrypt: bool = False) -> BytesLike:
+        """
+        Encrypt (or decrypt) bytes-like data, starting at key `position`.
+
+        A single shift is one `bytes.translate` call; bytes and bytearray keep their type.
+
+        Example:
+            >>> ShiftKernel(alphabet=tuple("ABC"), shifts=(1,), fill="?").transform_bytes(bytearray(b"AB-C"))
+            bytearray(b'BC?A')
+        """
+        tables = self._inverse_byte_tables if decrypt else self._byte_tables
+        if tables is None:
+            raise InvalidInputTypeError("Byte input requires an alphabet of code points below 256.")
+        if len(tables) == 1:
+            source = data if isinstance(data, (bytes, bytearray)) else bytes(data)
+            return source.translate(tables[0])
+        return latin_1_encode(self.transform(latin_1_decode(data)[0], position, decrypt))[0]
+
+
+def run_dict(kernel: ShiftKernel, text: str, position: int, decrypt: bool) -> str:
+    """Reference engine: one dict lookup per character."""
+    index_map = kernel.index_map
+    rows = kernel._inverse_rows if decrypt else kernel._rows
+    period = len(rows)
+    fill = kernel.fill
+
+    result: List[str] = []
+    key_index = position
+    for char in text:
+        idx = index_map.get(char)
+        if idx is None:
+            result.append(char if fill is None else fill)
+            continue
+        result.append(rows[key_index % period][idx])
+        key_index += 1
+    return "".join(result)
+
+
+def run_translate(kernel: ShiftKernel, text: str, position: int, decrypt: bool) -> str:
+    """
+    `str.translate` engine.
+
+    A single shift is one translate call. A periodic key translates each of
+    the `period` strided slices of the alphabet characters with its own table
+    and interleaves them. Characters outside the alphabet do not advance the
+    key, so they are taken out first: translating them all to the first of
+    them and splitting on it gives the alphabet runs between them. The joined
+    runs are translated, cut back to their lengths and interleaved with the
+    passthrough characters again. That costs a few list operations per
+    passthrough character, so denser text goes through `run_dict`.
+    """
+    tables = kernel._inverse_tables if decrypt else kernel._tables
+    period = len(tables)
+    if period == 1:
+        return text.translate(tables[0])
+
+    others = text.translate(kernel._strip)
+    if not others:
+        return _translate_strided(text, tables, position)
+    if len(others) * SPARSE_PASSTHROUGH > len(text):
+        return run_dict(kernel, text, position, decrypt)
+
+    separator = others[0]
+    runs = text.translate(dict.fromkeys(map(ord, set(others)), separator)).split(separator)
+    shifted = _translate_strided("".join(runs), tables, position)
+    bounds = list(accumulate(map(len, runs), initial=0))
+
+    parts = [""] * (2 * len(runs) - 1)
+    parts[::2] = map(shifted.__getitem__, map(slice, bounds, bounds[1:]))
+    parts[1::2] = others if kernel.fill is None else kernel.fill * len(others)
+    return "".join(parts)
+
+
+def _translate_strided(text: str, tables: Tuple[Dict[int, str], ...], position: int) -> str:
+    """Periodic key over text made only of alphabet characters."""
+    period = len(tables)
+    result = list(text)
+    for offset in range(min(period, len(text))):
+        result[offset::period] = text[offset::period].translate(tables[(position + offset) % period])
+    return "".join(result)
+
+
+def run_numpy(kernel: ShiftKernel, text: str, position: int, decrypt: bool) -> str:
+    """Vectorized engine, see `engines.numpy_engine.run_shift`."""
+    from engines.numpy_engine import run_shift
+    return run_shift(kernel, text, position, decrypt)
+
+
+def run_parallel(kernel: ShiftKernel, text: str, position: int, decrypt: bool) -> str:
+    """Chunk-parallel vectorized engine, see `engines.numpy_engine.run_shift_parallel`."""
+    from engines.numpy_engine import run_shift_parallel
+    return run_shift_parallel(kernel, text, position, decrypt)
+
+
+ENGINES: Dict[str, Callable[[ShiftKernel, str, int, bool], str]] = {
+    "translate": run_translate,
+    "dict": run_dict,
+    "numpy": run_numpy,
+    "parallel": run_parallel,
+}
+
+
+@dataclass(frozen=True)
+class KeyedKernel:
+    """
+    Shift each alphabet character by an explicit, non-repeating key.
+
+    Used for running-key ciphers, where the key is read from `key_source`, and
+    autokey ciphers, where the key is `primer` followed by the plaintext itself.
+    Exactly one of the two must be given. The key is not stored in the kernel:
+    see `engines.streams` for reading it in lockstep with the text.
+
+    Example:
+        >>> kernel = KeyedKernel(alphabet=tuple("ABC"), primer=tuple("B"))
+        >>> kernel.transform_with_key("AB-C", "CBA")
+        'CC-C'
+        >>> kernel.transform_with_key("CC-C", "CBA", decrypt=True)
+        'AB-C'
+    """
+
+    alphabet: Tuple[str, ...]
+    key_source: Optional[KeySource] = None
+    primer: Optional[Tuple[str, ...]] = None
+    engine: str = "translate"
+    index_map: Dict[str, int] = field(init=False, repr=False, compare=False)
+    _pairs: Optional[Dict[str, str]] = field(init=False, repr=False, compare=False)
+    _inverse_pairs: Optional[Dict[str, str]] = field(init=False, repr=False, compare=False)
+    _strip: Dict[int, None] = field(init=False, repr=False, compare=False)
+    _compiled: Dict[str, Any] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def __post_init__(self):
+        ensure_not_empty(self.alphabet, "Alphabet must not be empty.")
+        if (self.key_source is None) == (self.primer is None):
+            raise InvalidKeywordError("Keyed kernels need exactly one of a key source or an autokey primer.")
+        _check_engine(self.engine, KEYED_ENGINES)
+
+        index_map = build_index_map(self.alphabet)
+        if self.primer is not None:
+            ensure_not_empty(self.primer, "Autokey primer must not be empty.")
+            if any(char not in index_map for char in self.primer):
+                raise InvalidKeywordError(f"Primer characters must belong to the alphabet (got: {list(self.primer)}).")
+
+        pairs = inverse = None
+        n = len(self.alphabet)
+        if n <= PAIR_TABLE_LIMIT:
+            pairs = {p + k: self.alphabet[(i + j) % n] for p, i in index_map.items() for k, j in index_map.items()}
+            inverse = {c + k: self.alphabet[(i - j) % n] for c, i in index_map.items() for k, j in index_map.items()}
+
+        object.__setattr__(self, "index_map", index_map)
+        object.__setattr__(self, "_pairs", pairs)
+        object.__setattr__(self, "_inverse_pairs", inverse)
+        object.__setattr__(self, "_strip", build_strip_table(self.alphabet))
+
+    @property
+    def autokey(self) -> bool:
+        return self.primer is not None
+
+    def advance(self, text: str) -> int:
+        """Number of key characters consumed by `text` (its alphabet characters)."""
+        return len(text) - len(text.translate(self._strip))
+
+    def transform_with_key(self, text: str, key: str, decrypt: bool = False) -> str:
+        """Encrypt (or decrypt) `text` with one key character per alphabet character."""
+        return KEYED_ENGINES[self.engine](self, text, key, decrypt)
+
+
+def run_keyed_dict(kernel: KeyedKernel, text: str, key: str, decrypt: bool) -> str:
+    """Reference keyed engine: index arithmetic per character."""
+    index_map = kernel.index_map
+    alphabet = kernel.alphabet
+    n = len(alphabet)
+    sign = -1 if decrypt else 1
+
+    result: List[str] = []
+    keys = iter(key)
+    for char in text:
+        idx = index_map.get(char)
+        if idx is None:
+            result.append(char)
+            continue
+        result.append(alphabet[(idx + sign * index_map[next(keys)]) % n])
+    return "".join(result)
+
+
+def run_keyed_translate(kernel: KeyedKernel, text: str, key: str, decrypt: bool) -> str:
+    """
+    Table engine: looks each (text, key) character pair up in a precompiled table.
+
+    Runs entirely in C (`map` over `str.__add__` and `dict.__getitem__`) for
+    text made only of alphabet characters; other texts use `run_keyed_dict`.
+    """
+    pairs = kernel._inverse_pairs if decrypt else kernel._pairs
+    if pairs is None or len(key) != len(text):
+        return run_keyed_dict(kernel, text, key, decrypt)
+    return "".join(map(pairs.__getitem__, map(add, text, key)))
+
+
+def run_keyed_numpy(kernel: KeyedKernel, text: str, key: str, decrypt: bool) -> str:
+    """Vectorized keyed engine, see `engines.numpy_engine.run_keyed`."""
+    from engines.numpy_engine import run_keyed
+    return run_keyed(kernel, text, key, decrypt)
+
+
+def run_keyed_parallel(kernel: KeyedKernel, text: str, key: str, decrypt: bool) -> str:
+    """Chunk-parallel vectorized keyed engine, see `engines.numpy_engine.run_keyed_parallel`."""
+    from engines.numpy_engine import run_keyed_parallel as run
+    return run(kernel, text, key, decrypt)
+
+
+KEYED_ENGINES: Dict[str, Callable[[KeyedKernel, str, str, bool], str]] = {
+    "translate": run_keyed_translate,
+    "dict": run_keyed_dict,
+    "numpy": run_keyed_numpy,
+    "parallel": run_keyed_parallel,
+}
+
+
+@dataclass(frozen=True)
+class SubstitutionKernel:
+    """
+    Replace each alphabet character by the cipher alphabet character at its index.
+
+    The permutation is compiled to forward and inverse index tuples (the
+    alphabet index each index maps to) and to `str`/`bytes` translate tables.
+
+    Attributes:
+        alphabet: Reference alphabet.
+        cipher_alphabet: A permutation of the alphabet.
+        fill: Replacement for characters outside the alphabet (None = passthrough).
+        engine: Name of the engine in `SUBSTITUTION_ENGINES` used to run the kernel.
+
+    Example:
+        >>> kernel = SubstitutionKernel(alphabet=tuple("ABC"), cipher_alphabet=tuple("CAB"))
+        >>> kernel.forward, kernel.inverse
+        ((2, 0, 1), (1, 2, 0))
+        >>> kernel.transform("AB-C"), kernel.transform("CA-B", decrypt=True)
+        ('CA-B', 'AB-C')
+    """
+
+    alphabet: Tuple[str, ...]
+    cipher_alphabet: Tuple[str, ...]
+    fill: Optional[str] = None
+    engine: str = "translate"
+    index_map: Dict[str, int] = field(init=False, repr=False, compare=False)
+    forward: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    inverse: Tuple[int, ...] = field(init=False, repr=False, compare=False)
+    _table: Dict[int, str] = field(init=False, repr=False, compare=False)
+    _inverse_table: Dict[int, str] = field(init=False, repr=False, compare=False)
+    _byte_table: Optional[bytes] = field(init=False, repr=False, compare=False)
+    _inverse_byte_table: Optional[bytes] = field(init=False, repr=False, compare=False)
+    _compiled: Dict[str, Any] = field(init=False, repr=False, compare=False, default_factory=dict)
+
+    def __post_init__(self):
+        ensure_not_empty(self.alphabet, "Alphabet must not be empty.")
+        _check_engine(self.engine, SUBSTITUTION_ENGINES)
+
+        index_map = build_index_map(self.alphabet)
+        if len(self.cipher_alphabet) != len(self.alphabet) or set(self.cipher_alphabet) != set(index_map):
+            raise InvalidKeywordError(
+                f"Cipher alphabet must be a permutation of the alphabet (got: {list(self.cipher_alphabet)})."
+            )
+
+        forward = tuple(index_map[char] for char in self.cipher_alphabet)
+        inverse = [0] * len(forward)
+        for idx, target in enumerate(forward):
+            inverse[target] = idx
+
+        object.__setattr__(self, "index_map", index_map)
+        object.__setattr__(self, "forward", forward)
+        object.__setattr__(self, "inverse", tuple(inverse))
+        object.__setattr__(self, "_table", build_substitution_table(self.alphabet, self.cipher_alphabet, self.fill))
+        object.__setattr__(self, "_inverse_table", build_substitution_table(self.cipher_alphabet, self.alphabet, self.fill))
+        object.__setattr__(self, "_byte_table", build_byte_substitution_table(self.alphabet, self.cipher_alphabet, self.fill))
+        object.__setattr__(
+            self, "_inverse_byte_table", build_byte_substitution_table(self.cipher_alphabet, self.alphabet, self.fill)
+        )
+
+    @property
+    def period(self) -> int:
+        return 1
+
+    def advance(self, text: str) -> int:
+        """Substitution has no key position: always 0."""
+        return 0
+
+    def transform(self, text: str, position: int = 0, decrypt: bool = False) -> str:
+        """Encrypt (or decrypt) `text`; `position` is accepted for symmetry with `ShiftKernel`."""
+        return SUBSTITUTION_ENGINES[self.engine](self, text, position, decrypt)
+
+    def transform_bytes(self, data: BytesLike, position: int = 0, decrypt: bool = False) -> BytesLike:
+        """Encrypt (or decrypt) bytes-like data with one `bytes.translate` call."""
+        table = self._inverse_byte_table if decrypt else self._byte_table
+        if table is None:
+            raise InvalidInputTypeError("Byte input requires an alphabet of code points below 256.")
+        source = data if isinstance(data, (bytes, bytearray)) else bytes(data)
+        return source.translate(table)
+
+
+def run_substitution_dict(kernel: SubstitutionKernel, text: str, position: int, decrypt: bool) -> str:
+    """Reference substitution engine: one dict lookup per character."""
+    index_map = kernel.index_map
+    alphabet = kernel.alphabet
+    permutation = kernel.inverse if decrypt else kernel.forward
+    fill = kernel.fill
+
+    result: List[str] = []
+    for char in text:
+        idx = index_map.get(char)
+        if idx is None:
+            result.append(char if fill is None else fill)
+            continue
+        result.append(alphabet[permutation[idx]])
+    return "".join(result)
+
+
+def run_substitution_translate(kernel: SubstitutionKernel, text: str, position: int, decrypt: bool) -> str:
+    """`str.translate` substitution engine: one call per text."""
+    return text.translate(kernel._inverse_table if decrypt else kernel._table)
+
+
+def run_substitution_numpy(kernel: SubstitutionKernel, text: str, position: int, decrypt: bool) -> str:
+    """Vectorized substitution engine, see `engines.numpy_engine.run_substitution`."""
+    from engines.numpy_engine import run_substitution
+    return run_substitution(kernel, text, position, decrypt)
+
+
+def run_substitution_parallel(kernel: SubstitutionKernel, text: str, position: int, decrypt: bool) -> str:
+    """Chunk-parallel vectorized substitution engine, see `engines.numpy_engine.run_substitution_parallel`."""
+    from engines.numpy_engine import run_substitution_parallel as run
+    return run(kernel, text, position, decrypt)
+
+
+SUBSTITUTION_ENGINES: Dict[str, Callable[[SubstitutionKernel, str, int, bool], str]] = {
+    "translate": run_substitution_translate,
+    "dict": run_substitution_dict,
+    "numpy": run_substitution_numpy,
+    "parallel": run_substitution_parallel,
+}
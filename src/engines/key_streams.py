@@ -0,0 +1,89 @@
+# src/engines/key_streams.py
+
+import codecs
+import mmap
+from typing import Callable, Iterable, Iterator, Sequence
+
+from engines.tables import build_keep_table
+from utils.error import InvalidKeywordError
+
+"""
+Key sources for running-key ciphers.
+
+A key source is a zero-argument callable returning a fresh iterator of raw key
+text chunks, so the same source can be replayed for encryption and
+decryption. `KeyReader` filters those chunks down to alphabet characters and
+hands them out in exactly the amounts the text needs, which keeps key and
+text in lockstep without ever holding more than one chunk of either.
+"""
+
+
+KeySource = Callable[[], Iterator[str]]
+
+DEFAULT_KEY_CHUNK = 1 << 16
+
+
+def mapped_file_source(path: str, encoding: str = "utf-8", chunk_size: int = DEFAULT_KEY_CHUNK) -> KeySource:
+    """
+    Key source streaming a (book-length) file through a read-only memory map.
+
+    Only the pages actually consumed are read from disk.
+    """
+    def open_source() -> Iterator[str]:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        with open(path, "rb") as f:
+            try:
+                mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # empty files cannot be mapped
+                return
+            with mapped:
+                for start in range(0, len(mapped), chunk_size):
+                    text = decoder.decode(mapped[start:start + chunk_size])
+                    if text:
+                        yield text
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    yield tail
+    return open_source
+
+
+def iterable_source(chunks: Iterable[str]) -> KeySource:
+    """
+    Key source over an iterable of key text chunks (or single characters).
+
+    Re-iterable inputs (lists, strings) can be replayed; plain iterators can be consumed once.
+
+    Example:
+        >>> "".join(iterable_source(["AB", "C"])())
+        'ABC'
+    """
+    return lambda: iter(chunks)
+
+
+class KeyReader:
+    """
+    Hands out alphabet characters from a key source on demand.
+
+    Example:
+        >>> reader = KeyReader(iterable_source(["A-B", "CD"]), ["A", "B", "C", "D"])
+        >>> reader.take(2), reader.take(2)
+        ('AB', 'CD')
+    """
+
+    def __init__(self, source: KeySource, alphabet: Sequence[str]):
+        self._chunks = source()
+        self._keep = build_keep_table(alphabet)
+        self._buffer = ""
+
+    def take(self, count: int) -> str:
+        """Return the next `count` key characters."""
+        while len(self._buffer) < count:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                raise InvalidKeywordError(
+                    f"Key stream exhausted: needed {count} more key characters, {len(self._buffer)} left."
+                )
+            self._buffer += chunk.translate(self._keep)
+
+        key, self._buffer = self._buffer[:count], self._buffer[count:]
+        return key
@@ -0,0 +1,227 @@
+# src/engines/numpy_engine.py
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import accumulate
+from threading import Lock
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+"""
+NumPy engines: cipher kernels as index arithmetic on code point arrays.
+
+Text is converted to an array of code points (one byte per character for
+ASCII text), mapped to alphabet indices through a lookup table, shifted with
+vectorized modular arithmetic and mapped back. This module imports NumPy and
+is only loaded when one of its engines is used.
+"""
+
+
+# Characters per chunk for the parallel engines.
+PARALLEL_CHUNK = 1 << 20
+
+_pool: Optional[ThreadPoolExecutor] = None
+_pool_lock = Lock()
+
+
+@dataclass(frozen=True)
+class AlphabetArrays:
+    """
+    Lookup arrays for one alphabet.
+
+    Attributes:
+        code_points: Code point of each alphabet character.
+        lut: Alphabet index of each code point up to the largest one in the alphabet, -1 elsewhere.
+        ascii: True if every alphabet character (and the fill) is ASCII.
+        fill: Code point replacing characters outside the alphabet, or None to keep them.
+    """
+
+    code_points: np.ndarray
+    lut: np.ndarray
+    ascii: bool
+    fill: Optional[int]
+
+    @classmethod
+    def build(cls, alphabet: Sequence[str], fill: Optional[str] = None) -> "AlphabetArrays":
+        code_points = np.fromiter(map(ord, alphabet), dtype=np.uint32, count=len(alphabet))
+        lut = np.full(int(code_points.max()) + 1, -1, dtype=np.int32)
+        lut[code_points] = np.arange(len(alphabet), dtype=np.int32)
+        fill_cp = ord(fill) if fill is not None else None
+        ascii_only = bool(code_points.max() < 128) and (fill_cp is None or fill_cp < 128)
+        return cls(code_points=code_points, lut=lut, ascii=ascii_only, fill=fill_cp)
+
+    def indices(self, code_points: np.ndarray) -> np.ndarray:
+        """Alphabet index of each code point, -1 for characters outside the alphabet."""
+        if len(self.lut) > 255 or code_points.dtype != np.uint8:
+            inside = code_points < len(self.lut)
+            clipped = np.where(inside, code_points, 0)
+            return np.where(inside, self.lut[clipped], -1).astype(np.int32, copy=False)
+        padded = np.full(256, -1, dtype=np.int32)
+        padded[:len(self.lut)] = self.lut
+        return padded[code_points]
+
+
+def arrays_for(kernel) -> AlphabetArrays:
+    """Return (and cache on the kernel) the lookup arrays of a kernel's alphabet."""
+    arrays = kernel._compiled.get("numpy")
+    if arrays is None:
+        arrays = AlphabetArrays.build(kernel.alphabet, getattr(kernel, "fill", None))
+        kernel._compiled["numpy"] = arrays
+    return arrays
+
+
+def to_code_points(text: str) -> np.ndarray:
+    """Code points of `text`: uint8 for ASCII text, uint32 otherwise."""
+    if text.isascii():
+        return np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    return np.frombuffer(text.encode("utf-32-le"), dtype="<u4")
+
+
+def from_code_points(code_points: np.ndarray) -> str:
+    if code_points.dtype == np.uint8:
+        return code_points.tobytes().decode("latin-1")
+    return code_points.astype("<u4", copy=False).tobytes().decode("utf-32-le")
+
+
+def _finish(arrays: AlphabetArrays, source: np.ndarray, shifted: np.ndarray, mask: Optional[np.ndarray]) -> str:
+    """Map shifted indices back to characters and restore characters outside the alphabet."""
+    out_dtype = np.uint8 if arrays.ascii and source.dtype == np.uint8 else np.uint32
+    result = arrays.code_points.astype(out_dtype)[shifted]
+    if mask is not None:
+        keep = source if arrays.fill is None else out_dtype(arrays.fill)
+        result = np.where(mask, result, keep).astype(out_dtype, copy=False)
+    return from_code_points(result)
+
+
+def run_shift(kernel, text: str, position: int, decrypt: bool) -> str:
+    """
+    Periodic shift kernel as index arithmetic.
+
+    The key only advances on alphabet characters: the j-th alphabet character
+    (a cumulative count over the in-alphabet mask) takes key position
+    `(position + j) % period`. The alphabet characters are therefore
+    compacted into one array, each of its `period` strided slices is mapped
+    through the code point row of its shift, and the result is scattered
+    back over a copy of the text, leaving other characters untouched (or
+    replaced by the fill).
+    """
+    if not text:
+        return text
+    arrays = arrays_for(kernel)
+    n = len(kernel.alphabet)
+    source = to_code_points(text)
+    idx = arrays.indices(source)
+    mask = idx >= 0
+    full = bool(mask.all())
+
+    period = len(kernel.shifts)
+    if period == 1:
+        shift = (-kernel.shifts[0] if decrypt else kernel.shifts[0]) % n
+        return _finish(arrays, source, (idx + shift) % n, None if full else mask)
+
+    out_dtype = np.uint8 if arrays.ascii and source.dtype == np.uint8 else np.uint32
+    rows = _shift_rows(kernel, arrays, decrypt).astype(out_dtype, copy=False)
+    core = idx if full else idx[mask]
+    shifted = np.empty(len(core), dtype=out_dtype)
+    for offset in range(min(period, len(core))):
+        shifted[offset::period] = rows[(position + offset) % period][core[offset::period]]
+    if full:
+        return from_code_points(shifted)
+
+    out = source.astype(out_dtype) if arrays.fill is None else np.full(len(source), arrays.fill, dtype=out_dtype)
+    out[mask] = shifted
+    return from_code_points(out)
+
+
+def _shift_rows(kernel, arrays: AlphabetArrays, decrypt: bool) -> np.ndarray:
+    """Code point of each alphabet index under each shift of the key, as a (period, n) array."""
+    name = "numpy_inverse_rows" if decrypt else "numpy_rows"
+    rows = kernel._compiled.get(name)
+    if rows is None:
+        n = len(kernel.alphabet)
+        shifts = np.asarray(kernel.shifts, dtype=np.int64)
+        shifts = -shifts if decrypt else shifts
+        rows = arrays.code_points[(np.arange(n) + shifts[:, None]) % n]
+        kernel._compiled[name] = rows
+    return rows
+
+
+def run_keyed(kernel, text: str, key: str, decrypt: bool) -> str:
+    """Explicit key stream as index arithmetic; only alphabet characters consume key."""
+    if not text:
+        return text
+    arrays = arrays_for(kernel)
+    n = len(kernel.alphabet)
+    source = to_code_points(text)
+    idx = arrays.indices(source)
+    key_idx = arrays.indices(to_code_points(key)).astype(np.int64)
+    if decrypt:
+        key_idx = -key_idx
+
+    mask = idx >= 0
+    if len(key_idx) == len(idx):
+        return _finish(arrays, source, (idx + key_idx) % n, None)
+
+    shifted = np.zeros(len(idx), dtype=np.int64)
+    shifted[mask] = (idx[mask] + key_idx) % n
+    return _finish(arrays, source, shifted, mask)
+
+
+def run_substitution(kernel, text: str, position: int, decrypt: bool) -> str:
+    """Substitution as a gather through the forward (or inverse) permutation."""
+    if not text:
+        return text
+    arrays = arrays_for(kernel)
+    source = to_code_points(text)
+    idx = arrays.indices(source)
+    mask = idx >= 0
+    permutation = kernel._compiled.get("numpy_permutations")
+    if permutation is None:
+        permutation = (np.asarray(kernel.forward, dtype=np.intp), np.asarray(kernel.inverse, dtype=np.intp))
+        kernel._compiled["numpy_permutations"] = permutation
+    # Indices of -1 pick an arbitrary entry, replaced again by `_finish`.
+    mapped = permutation[1 if decrypt else 0][idx]
+    return _finish(arrays, source, mapped, None if mask.all() else mask)
+
+
+def _executor() -> ThreadPoolExecutor:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(max_workers=os.cpu_count() or 1, thread_name_prefix="cipher-numpy")
+    return _pool
+
+
+def _split(text: str, size: int) -> List[str]:
+    return [text[start:start + size] for start in range(0, len(text), size)]
+
+
+def run_shift_parallel(kernel, text: str, position: int, decrypt: bool) -> str:
+    """`run_shift` over chunks on a thread pool (NumPy releases the GIL in its loops)."""
+    chunks = _split(text, PARALLEL_CHUNK)
+    if len(chunks) <= 1:
+        return run_shift(kernel, text, position, decrypt)
+    counts = [kernel.advance(chunk) for chunk in chunks]
+    positions = accumulate(counts[:-1], initial=position)
+    return "".join(_executor().map(lambda c, p: run_shift(kernel, c, p, decrypt), chunks, positions))
+
+
+def run_keyed_parallel(kernel, text: str, key: str, decrypt: bool) -> str:
+    """`run_keyed` over chunks on a thread pool, each with its own slice of key."""
+    chunks = _split(text, PARALLEL_CHUNK)
+    if len(chunks) <= 1:
+        return run_keyed(kernel, text, key, decrypt)
+    offsets = list(accumulate((kernel.advance(chunk) for chunk in chunks), initial=0))
+    keys = [key[start:end] for start, end in zip(offsets, offsets[1:])]
+    return "".join(_executor().map(lambda c, k: run_keyed(kernel, c, k, decrypt), chunks, keys))
+
+
+def run_substitution_parallel(kernel, text: str, position: int, decrypt: bool) -> str:
+    """`run_substitution` over chunks on a thread pool."""
+    chunks = _split(text, PARALLEL_CHUNK)
+    if len(chunks) <= 1:
+        return run_substitution(kernel, text, position, decrypt)
+    return "".join(_executor().map(lambda c: run_substitution(kernel, c, 0, decrypt), chunks))
@@ -0,0 +1,269 @@
+# src/engines/planner.py
+
+import json
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+from engines.kernels import ENGINES, KEYED_ENGINES, NUMPY_ENGINES, KeyedKernel, ShiftKernel, numpy_available
+from engines.key_streams import iterable_source
+from utils.cache import cache_path
+from utils.error import InvalidEngineError
+
+"""
+Execution planner: picks the engine a cipher runs on.
+
+The choice depends on the kernel kind, the text size and type, and the
+alphabet size. Without calibration the planner uses fixed heuristics; after
+`calibrate()` has been run once on a machine, its cached measurements decide
+instead. An engine can always be forced, per spec (`CipherSpec.engine`) or
+process-wide through the CRYPTO_TRACTATUS_ENGINE environment variable.
+"""
+
+
+AUTO = "auto"
+ENGINE_ENV = "CRYPTO_TRACTATUS_ENGINE"
+CALIBRATION_FILE = "calibration.json"
+CALIBRATION_VERSION = 1
+
+# Kernel kinds.
+ROT = "rot"              # single shift, one translate table
+PERIODIC = "periodic"    # repeating key
+KEYED = "keyed"          # running key or autokey
+SUBSTITUTION = "substitution"  # one fixed table, planned like ROT
+KINDS = (ROT, PERIODIC, KEYED)
+
+# Heuristic thresholds, in characters.
+SMALL_TEXT = 1 << 12
+PARALLEL_TEXT = 1 << 23
+
+CALIBRATION_SIZES = (1 << 12, 1 << 16, 1 << 20)
+
+_calibration: Optional[Dict] = None
+_calibration_loaded = False
+
+
+@dataclass(frozen=True)
+class ExecutionPlan:
+    """
+    The engine chosen for one cipher run, and why.
+
+    Example:
+        >>> plan = plan_execution(ROT, text_size=10, alphabet_size=26)
+        >>> plan.engine
+        'translate'
+        >>> print(plan.explain())
+        engine: translate (heuristic)
+        inputs: kind=rot, text=str[10], alphabet=26
+        reason: text below 4096 characters; compiled translate tables win on setup cost
+    """
+
+    engine: str
+    kind: str
+    text_kind: str
+    text_size: int
+    alphabet_size: int
+    source: str
+    reason: str
+
+    def explain(self) -> str:
+        return (
+            f"engine: {self.engine} ({self.source})\n"
+            f"inputs: kind={self.kind}, text={self.text_kind}[{self.text_size}], alphabet={self.alphabet_size}\n"
+            f"reason: {self.reason}"
+        )
+
+
+def available_engines(kind: str = PERIODIC) -> Tuple[str, ...]:
+    """Engines that can run a kernel of this kind in the current environment."""
+    engines = KEYED_ENGINES if kind == KEYED else ENGINES
+    return tuple(name for name in engines if name not in NUMPY_ENGINES or numpy_available())
+
+
+def plan_execution(
+    kind: str,
+    text_size: int,
+    alphabet_size: int,
+    text_kind: str = "str",
+    engine: Optional[str] = None,
+    allow_parallel: bool = True,
+) -> ExecutionPlan:
+    """
+    Choose an engine.
+
+    Args:
+        kind: Kernel kind (ROT, PERIODIC or KEYED).
+        text_size: Length of the text (or of one chunk when streaming).
+        alphabet_size: Number of alphabet characters.
+        text_kind: "str" or "bytes".
+        engine: Engine to force; None or "auto" to choose.
+        allow_parallel: Whether the parallel engine may be chosen (callers that
+            already run chunks concurrently should pass False).
+
+    Returns:
+        The ExecutionPlan.
+    """
+    args = (kind, text_kind, text_size, alphabet_size)
+    forced = engine if engine not in (None, AUTO) else os.environ.get(ENGINE_ENV) or None
+    if forced is not None and forced != AUTO:
+        if forced not in available_engines(kind):
+            raise InvalidEngineError(
+                f"Engine '{forced}' is not available for {kind} kernels "
+                f"(available: {', '.join(available_engines(kind))})."
+            )
+        source = "forced" if engine not in (None, AUTO) else f"forced by ${ENGINE_ENV}"
+        return ExecutionPlan(forced, *args, source=source, reason="engine selected explicitly")
+
+    calibration = load_calibration()
+    if calibration is not None:
+        measured = _calibrated_choice(calibration, kind, text_size, allow_parallel)
+        if measured is not None:
+            name, rate = measured
+            reason = f"fastest in local calibration ({rate / 1e6:.1f} M chars/s)"
+            if name == "numpy" and _wants_parallel(text_size, allow_parallel):
+                name, reason = "parallel", f"{reason}, split across {os.cpu_count()} threads"
+            return ExecutionPlan(name, *args, source="calibrated", reason=reason)
+
+    name, reason = _heuristic_choice(kind, text_size, alphabet_size, text_kind, allow_parallel)
+    return ExecutionPlan(name, *args, source="heuristic", reason=reason)
+
+
+def _heuristic_choice(
+    kind: str, text_size: int, alphabet_size: int, text_kind: str, allow_parallel: bool
+) -> Tuple[str, str]:
+    if text_size < SMALL_TEXT:
+        return "translate", f"text below {SMALL_TEXT} characters; compiled translate tables win on setup cost"
+    if kind in (ROT, SUBSTITUTION):
+        return "translate", "a single table is one str/bytes.translate call"
+    if not numpy_available():
+        return "translate", "NumPy is not installed"
+    if _wants_parallel(text_size, allow_parallel):
+        return "parallel", f"text of at least {PARALLEL_TEXT} characters split across {os.cpu_count()} threads"
+    if kind == KEYED and alphabet_size > 128:
+        return "numpy", "no pair table for alphabets above 128 characters; index arithmetic instead"
+    return "numpy", "vectorized index arithmetic beats per-character key lookups"
+
+
+def _wants_parallel(text_size: int, allow_parallel: bool) -> bool:
+    return allow_parallel and text_size >= PARALLEL_TEXT and (os.cpu_count() or 1) > 1
+
+
+def _calibrated_choice(calibration: Dict, kind: str, text_size: int, allow_parallel: bool) -> Optional[Tuple[str, float]]:
+    by_size = calibration.get("results", {}).get(ROT if kind == SUBSTITUTION else kind)
+    if not by_size:
+        return None
+    size = min(by_size, key=lambda s: abs(int(s).bit_length() - max(text_size, 1).bit_length()))
+    rates = {
+        name: rate for name, rate in by_size[size].items()
+        if name in available_engines(kind) and (allow_parallel or name != "parallel")
+    }
+    if not rates:
+        return None
+    best = max(rates, key=rates.get)
+    return best, rates[best]
+
+
+def _environment() -> Dict[str, str]:
+    import platform
+    numpy_version = None
+    if numpy_available():
+        from importlib.metadata import version
+        numpy_version = version("numpy")
+    return {
+        "python": sys.version.split()[0],
+        "numpy": numpy_version,
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def load_calibration(path: Optional[str] = None) -> Optional[Dict]:
+    """Load cached calibration results, if any were recorded for this environment."""
+    global _calibration, _calibration_loaded
+    if path is None and _calibration_loaded:
+        return _calibration
+
+    data = None
+    try:
+        with open(path or cache_path(CALIBRATION_FILE, create=False), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        pass
+    if data and (data.get("version") != CALIBRATION_VERSION or data.get("environment") != _environment()):
+        data = None
+
+    if path is None:
+        _calibration, _calibration_loaded = data, True
+    return data
+
+
+def _sample_kernel(kind: str, engine: str, alphabet: Sequence[str], key: str):
+    if kind == ROT:
+        return ShiftKernel(alphabet=tuple(alphabet), shifts=(3,), fill="?", engine=engine)
+    if kind == PERIODIC:
+        return ShiftKernel(alphabet=tuple(alphabet), shifts=(11, 4, 12, 14, 13), engine=engine)
+    return KeyedKernel(alphabet=tuple(alphabet), key_source=iterable_source(key), engine=engine)
+
+
+def calibrate(
+    sizes: Sequence[int] = CALIBRATION_SIZES,
+    repeat: int = 3,
+    path: Optional[str] = None,
+    save: bool = True,
+) -> Dict:
+    """
+    Time every available engine on synthetic text and cache the results.
+
+    The text is uppercase letters with one space in eight, so passthrough
+    handling is part of the measurement. Results (characters per second,
+    best of `repeat`) are saved as JSON in the cache directory and used by
+    `plan_execution` from then on. The parallel engine is not timed: at
+    calibration sizes it is the NumPy engine, and the planner switches to it
+    for large texts when NumPy measured fastest.
+    """
+    import random
+    global _calibration, _calibration_loaded
+    alphabet = [chr(c) for c in range(ord("A"), ord("Z") + 1)]
+    rng = random.Random(0)
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    for kind in KINDS:
+        results[kind] = {}
+        for size in sizes:
+            text = "".join(rng.choice(alphabet) if rng.random() > 0.125 else " " for _ in range(size))
+            key = "".join(rng.choice(alphabet) for _ in range(size))
+            rates = {}
+            for engine in available_engines(kind):
+                if engine == "parallel":
+                    continue
+                kernel = _sample_kernel(kind, engine, alphabet, key)
+                best = float("inf")
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    if kind == KEYED:
+                        kernel.transform_with_key(text, key[:kernel.advance(text)])
+                    else:
+                        kernel.transform(text)
+                    best = min(best, time.perf_counter() - started)
+                rates[engine] = size / max(best, 1e-9)
+            results[kind][str(size)] = rates
+
+    data = {"version": CALIBRATION_VERSION, "environment": _environment(), "results": results}
+    if save:
+        with open(path or cache_path(CALIBRATION_FILE), "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+    if path is None:
+        _calibration, _calibration_loaded = data, True
+    return data
+
+
+def reset_calibration(path: Optional[str] = None) -> None:
+    """Forget calibration results, in memory and on disk."""
+    global _calibration, _calibration_loaded
+    _calibration, _calibration_loaded = None, True
+    try:
+        os.remove(path or cache_path(CALIBRATION_FILE, create=False))
+    except OSError:
+        pass
@@ -0,0 +1,208 @@
+# src/engines/streams.py
+
+from abc import ABC, abstractmethod
+from codecs import latin_1_decode, latin_1_encode
+from collections import deque
+from typing import TYPE_CHECKING, Any, List, Optional, Union
+
+from engines.kernels import KeyedKernel, ShiftKernel, SubstitutionKernel
+from engines.key_streams import KeyReader
+from engines.tables import build_keep_table
+from utils.coercion import BytesLike, NativeText, ensure_bytes_like, writable_view
+from utils.error import InvalidInputTypeError
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+"""
+Stateful chunk streams over compiled kernels.
+
+A stream splits the work on each chunk in two: `prepare` runs once per chunk,
+in order, and carries all state from one chunk to the next (key position,
+key characters read in lockstep); `transform` does the actual ciphering and,
+when `parallel` is true, can run for several chunks at once on any thread.
+"""
+
+
+# Text is fed to the kernels in chunks of this many characters.
+DEFAULT_CHUNK = 1 << 16
+
+Kernel = Union[ShiftKernel, SubstitutionKernel, KeyedKernel]
+
+
+class ChunkStream(ABC):
+    parallel: bool = True
+
+    @abstractmethod
+    def prepare(self, text: str) -> Any:
+        """Advance the stream over `text` and return what `transform` needs for it."""
+
+    @abstractmethod
+    def transform(self, text: str, context: Any) -> str:
+        """Transform a chunk given the context `prepare` returned for it."""
+
+    def process(self, text: str) -> str:
+        """Prepare and transform a chunk in one step."""
+        return self.transform(text, self.prepare(text))
+
+    def process_all(
+        self, text: NativeText, chunk_size: int = DEFAULT_CHUNK, executor: Optional["Executor"] = None
+    ) -> NativeText:
+        """
+        Transform a whole text, chunk by chunk.
+
+        Bytes-like input is read as Latin-1 and returned as bytes. With an
+        `executor` (and a `parallel` stream), chunks are prepared in order and
+        then transformed concurrently on the executor's workers.
+        """
+        if not isinstance(text, str):
+            return _encode_latin_1(self.process_all(latin_1_decode(text)[0], chunk_size, executor))
+        chunks = [text[start:start + chunk_size] for start in range(0, len(text), chunk_size)]
+        if executor is None or not self.parallel or len(chunks) < 2:
+            return "".join(map(self.process, chunks))
+        contexts = [self.prepare(chunk) for chunk in chunks]
+        return "".join(executor.map(self.transform, chunks, contexts))
+
+    def process_into(self, data: BytesLike, out: Any, chunk_size: int = DEFAULT_CHUNK) -> int:
+        """
+        Transform bytes-like data chunk by chunk, writing each result straight into `out`.
+
+        Only one chunk's result is held at a time, and `out` may be `data`
+        itself. Returns the number of bytes written.
+        """
+        ensure_bytes_like(data)
+        source = memoryview(data).cast("B")
+        view = writable_view(out, len(source))
+        for start in range(0, len(source), chunk_size):
+            result = self._process_bytes(source[start:start + chunk_size])
+            view[start:start + len(result)] = result
+        return len(source)
+
+    def _process_bytes(self, chunk: memoryview) -> bytes:
+        return _encode_latin_1(self.process(latin_1_decode(chunk)[0]))
+
+
+class PeriodicStream(ChunkStream):
+    """Repeating key (or a fixed substitution): the context is the key position of the chunk."""
+
+    def __init__(self, kernel: Union[ShiftKernel, SubstitutionKernel], decrypt: bool = False):
+        self.kernel = kernel
+        self.decrypt = decrypt
+        self.position = 0
+
+    def prepare(self, text: str) -> int:
+        position = self.position
+        self.position += self.kernel.advance(text)
+        return position
+
+    def transform(self, text: str, context: int) -> str:
+        return self.kernel.transform(text, context, self.decrypt)
+
+    def process_all(
+        self, text: NativeText, chunk_size: int = DEFAULT_CHUNK, executor: Optional["Executor"] = None
+    ) -> NativeText:
+        # A single shift needs no key state: bytes go straight through `bytes.translate`.
+        if not isinstance(text, str) and self.kernel.period == 1:
+            return self.kernel.transform_bytes(text, 0, self.decrypt)
+        return super().process_all(text, chunk_size, executor)
+
+    def _process_bytes(self, chunk: memoryview) -> bytes:
+        if self.kernel.period == 1:
+            return self.kernel.transform_bytes(chunk, 0, self.decrypt)
+        return super()._process_bytes(chunk)
+
+
+class RunningKeyStream(ChunkStream):
+    """Running key: the context is the slice of key the chunk consumes."""
+
+    def __init__(self, kernel: KeyedKernel, decrypt: bool = False):
+        self.kernel = kernel
+        self.decrypt = decrypt
+        self.reader = KeyReader(kernel.key_source, kernel.alphabet)
+
+    def prepare(self, text: str) -> str:
+        return self.reader.take(self.kernel.advance(text))
+
+    def transform(self, text: str, context: str) -> str:
+        return self.kernel.transform_with_key(text, context, self.decrypt)
+
+
+class AutokeyEncryptStream(ChunkStream):
+    """
+    Autokey encryption: the key is the primer followed by the plaintext.
+
+    Since the plaintext is known up front, `prepare` derives each chunk's key
+    from the previous chunk's tail and the chunk itself, and chunks can still
+    be transformed in parallel.
+    """
+
+    def __init__(self, kernel: KeyedKernel):
+        self.kernel = kernel
+        self._keep = build_keep_table(kernel.alphabet)
+        self._tail = "".join(kernel.primer)
+
+    def prepare(self, text: str) -> str:
+        plain = text.translate(self._keep)
+        stream = self._tail + plain
+        key, self._tail = stream[:len(plain)], stream[len(plain):]
+        return key
+
+    def transform(self, text: str, context: str) -> str:
+        return self.kernel.transform_with_key(text, context, decrypt=False)
+
+
+class AutokeyDecryptStream(ChunkStream):
+    """
+    Autokey decryption: each key character is a plaintext character recovered earlier.
+
+    The dependency is sequential, so chunks must be transformed in order.
+    """
+
+    parallel = False
+
+    def __init__(self, kernel: KeyedKernel):
+        self.kernel = kernel
+        self._pending = deque(kernel.index_map[char] for char in kernel.primer)
+
+    def prepare(self, text: str) -> None:
+        return None
+
+    def transform(self, text: str, context: None) -> str:
+        index_map = self.kernel.index_map
+        alphabet = self.kernel.alphabet
+        n = len(alphabet)
+        pending = self._pending
+
+        result: List[str] = []
+        for char in text:
+            idx = index_map.get(char)
+            if idx is None:
+                result.append(char)
+                continue
+            plain = (idx - pending.popleft()) % n
+            pending.append(plain)
+            result.append(alphabet[plain])
+        return "".join(result)
+
+
+def _encode_latin_1(text: str) -> bytes:
+    try:
+        return latin_1_encode(text)[0]
+    except UnicodeEncodeError:
+        raise InvalidInputTypeError("Byte input requires an alphabet of code points below 256.")
+
+
+def open_stream(kernel: Kernel, decrypt: bool = False) -> ChunkStream:
+    """
+    Open a fresh stream over a kernel.
+
+    Example:
+        >>> from engines.kernels import ShiftKernel
+        >>> open_stream(ShiftKernel(alphabet=tuple("ABC"), shifts=(1, 2))).process_all("AB-C", chunk_size=2)
+        'BA-A'
+    """
+    if isinstance(kernel, (ShiftKernel, SubstitutionKernel)):
+        return PeriodicStream(kernel, decrypt)
+    if kernel.autokey:
+        return AutokeyDecryptStream(kernel) if decrypt else AutokeyEncryptStream(kernel)
+    return RunningKeyStream(kernel, decrypt)
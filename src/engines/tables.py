@@ -0,0 +1,125 @@
+# src/engines/tables.py
+
+from typing import Dict, Optional, Sequence
+
+from transforms.list_ops import rotate
+
+
+class FillTable(dict):
+    """
+    A `str.translate` table that maps every character it does not contain to `fill`.
+
+    A `fill` of None deletes those characters.
+
+    Example:
+        >>> "AB-".translate(FillTable({ord("A"): "B"}, fill="?"))
+        'B??'
+    """
+
+    def __init__(self, mapping: Dict[int, str], fill: Optional[str]):
+        super().__init__(mapping)
+        self.fill = fill
+
+    def __missing__(self, key: int) -> Optional[str]:
+        return self.fill
+
+
+def build_index_map(alphabet: Sequence[str]) -> Dict[str, int]:
+    """
+    Map each alphabet character to its index.
+
+    Example:
+        >>> build_index_map(["A", "B", "C"])
+        {'A': 0, 'B': 1, 'C': 2}
+    """
+    return {char: idx for idx, char in enumerate(alphabet)}
+
+
+def build_shift_table(alphabet: Sequence[str], shift: int, fill: Optional[str] = None) -> Dict[int, str]:
+    """
+    Build a `str.translate` table shifting each alphabet character by `shift`.
+
+    Characters outside the alphabet are left untouched, or replaced by `fill` if given.
+
+    Example:
+        >>> "CAB!".translate(build_shift_table(["A", "B", "C"], 1))
+        'ABC!'
+        >>> "CAB!".translate(build_shift_table(["A", "B", "C"], 1, fill="?"))
+        'ABC?'
+    """
+    return build_substitution_table(alphabet, rotate(list(alphabet), -shift), fill)
+
+
+def build_substitution_table(
+    alphabet: Sequence[str], targets: Sequence[str], fill: Optional[str] = None
+) -> Dict[int, str]:
+    """
+    Build a `str.translate` table mapping each alphabet character to the target at its index.
+
+    Example:
+        >>> "CAB!".translate(build_substitution_table(["A", "B", "C"], ["C", "A", "B"]))
+        'BCA!'
+    """
+    mapping = {ord(char): target for char, target in zip(alphabet, targets)}
+    return FillTable(mapping, fill) if fill is not None else mapping
+
+
+def build_keep_table(alphabet: Sequence[str]) -> Dict[int, Optional[str]]:
+    """
+    Build a `str.translate` table that deletes every character outside the alphabet.
+
+    Example:
+        >>> "A-B".translate(build_keep_table(["A", "B"]))
+        'AB'
+    """
+    return FillTable({ord(char): char for char in alphabet}, fill=None)
+
+
+def build_strip_table(alphabet: Sequence[str]) -> Dict[int, None]:
+    """
+    Build a `str.translate` table that deletes every alphabet character.
+
+    Used to count alphabet characters in C: `len(text) - len(text.translate(strip))`.
+
+    Example:
+        >>> "A-B".translate(build_strip_table(["A", "B"]))
+        '-'
+    """
+    return dict.fromkeys(map(ord, alphabet))
+
+
+def build_byte_shift_table(alphabet: Sequence[str], shift: int, fill: Optional[str] = None) -> Optional[bytes]:
+    """
+    Build a 256-byte `bytes.translate` table shifting each alphabet character by `shift`.
+
+    Bytes are read as Latin-1 code points. Returns None if the alphabet (or
+    `fill`) has characters that do not fit in a byte.
+
+    Example:
+        >>> b"CAB!".translate(build_byte_shift_table(["A", "B", "C"], 1, fill="?"))
+        b'ABC?'
+        >>> build_byte_shift_table(["A", "Ω"], 1) is None
+        True
+    """
+    return build_byte_substitution_table(alphabet, rotate(list(alphabet), -shift), fill)
+
+
+def build_byte_substitution_table(
+    alphabet: Sequence[str], targets: Sequence[str], fill: Optional[str] = None
+) -> Optional[bytes]:
+    """
+    Build a 256-byte `bytes.translate` table mapping each alphabet character to the target at its index.
+
+    Returns None if the alphabet (or `fill`) has characters that do not fit in a byte.
+
+    Example:
+        >>> b"CAB!".translate(build_byte_substitution_table(["A", "B", "C"], ["C", "A", "B"]))
+        b'BCA!'
+    """
+    if any(ord(char) > 0xFF for char in alphabet) or (fill is not None and ord(fill) > 0xFF):
+        return None
+
+    table = bytearray(range(256)) if fill is None else bytearray([ord(fill)]) * 256
+    for char, target in zip(alphabet, targets):
+        table[ord(char)] = ord(target)
+    return bytes(table)
@@ -1,4 +1,4 @@
-# lib/sequences/math.py
+# src/numeric/sequence_math.py
 from typing import Dict
 from math import gcd
 
@@ -1,20 +1,32 @@
-from specs.registry import register_cipher
-from specs.types import CipherType
+from typing import List, Optional, Sequence, Union
+
+from specs.registry import register_cipher, register_kernel
+from specs.types import CipherType, VigenereMode
 from specs.spec import CipherSpec
 from ciphers.rot_cipher import RotCipher
-from ciphers.classic_vigenere_cipher import ClassicVigenereCipher
+from ciphers.classic_vigenere_cipher import ClassicVigenereCipher, build_vigenere_kernel
+from ciphers.substitution_cipher import SubstitutionCipher
 from ciphers.base_cipher import CipherBit
-from math.sequence_math import unique_rotation
+from engines.kernels import KeyedKernel, ShiftKernel, SubstitutionKernel
+from numeric.sequence_math import unique_rotation
+from transforms.alphabet_ops import keyed_alphabet
+from utils.coercion import NativeText, coerce_to_char_list, coerce_to_native_text
 from utils.error import InvalidRotationStepError, InvalidKeywordError
-from structures.sequences import TextSequence, AlphabetSequence, KeywordSequence
+from utils.validators import ensure_not_empty
+from structures.sequences import AlphabetSequence, KeywordSequence
 
 
-@register_cipher(CipherType.ROT)
-def rot_constructor(spec: CipherSpec) -> CipherBit:
+def _native_text(spec: CipherSpec) -> NativeText:
+    # Validated without copying: the ciphers work on str and bytes directly.
+    text = coerce_to_native_text(spec.text)
+    ensure_not_empty(text, "Text cannot be empty")
+    return text
+
+
+def _rot_alphabet(spec: CipherSpec) -> AlphabetSequence:
     if spec.shift is None:
         raise InvalidRotationStepError(f"Shift must be specified for ROT cipher (got {spec.shift}).")
 
-    text = TextSequence(spec.text)
     alphabet = AlphabetSequence(spec.alphabet)
 
     if unique_rotation(spec.shift, len(alphabet)) == 1:
@@ -22,21 +34,90 @@ def rot_constructor(spec: CipherSpec) -> CipherBit:
             f"Shift {spec.shift} produces no effective rotation for alphabet of length {len(alphabet)}."
         )
 
-    return RotCipher(text=list(text), alphabet=list(alphabet), shift=spec.shift)
+    return alphabet
 
 
-@register_cipher(CipherType.VIGENERE)
-def vigenere_constructor(spec: CipherSpec) -> CipherBit:
+def _vigenere_key(
+    spec: CipherSpec,
+) -> tuple[AlphabetSequence, Optional[Union[KeywordSequence, Sequence[str]]], VigenereMode]:
+    mode = VigenereMode(spec.mode or VigenereMode.REPEATING)
+
+    if mode is VigenereMode.RUNNING_KEY:
+        if spec.key_source is None:
+            raise InvalidKeywordError("Key source must be provided for running-key Vigenère cipher.")
+        return AlphabetSequence(spec.alphabet), None, mode
+
     if spec.keyword is None:
         raise InvalidKeywordError("Keyword must be provided for Vigenère cipher.")
 
-    text = TextSequence(spec.text)
+    if mode is VigenereMode.AUTOKEY:
+        # The primer is used as written: repeated letters count and a single letter is enough.
+        return AlphabetSequence(spec.alphabet), coerce_to_char_list(spec.keyword), mode
+
+    return AlphabetSequence(spec.alphabet), KeywordSequence(spec.keyword), mode
+
+
+def _substitution_alphabets(spec: CipherSpec) -> tuple[AlphabetSequence, List[str]]:
+    # The keyword mixes the alphabet; a keyword using every character is the cipher alphabet itself.
+    if spec.keyword is None:
+        raise InvalidKeywordError("Keyword must be provided for substitution cipher.")
+
     alphabet = AlphabetSequence(spec.alphabet)
-    keyword = KeywordSequence(spec.keyword)
+    return alphabet, keyed_alphabet(KeywordSequence(spec.keyword), alphabet)
+
+
+@register_cipher(CipherType.ROT)
+def rot_constructor(spec: CipherSpec) -> CipherBit:
+    text = _native_text(spec)
+    alphabet = _rot_alphabet(spec)
+
+    return RotCipher(text=text, alphabet=list(alphabet), shift=spec.shift, engine=spec.plan().engine)
+
+
+@register_kernel(CipherType.ROT)
+def rot_kernel(spec: CipherSpec, engine: str) -> ShiftKernel:
+    alphabet = _rot_alphabet(spec)
+
+    return ShiftKernel(alphabet=alphabet.chars, shifts=(spec.shift,), fill='?', engine=engine)
+
+
+@register_cipher(CipherType.VIGENERE)
+def vigenere_constructor(spec: CipherSpec) -> CipherBit:
+    text = _native_text(spec)
+    alphabet, keyword, mode = _vigenere_key(spec)
 
     return ClassicVigenereCipher(
-        text=list(text),
+        text=text,
+        alphabet=list(alphabet),
+        keyword=keyword,
+        mode=mode,
+        key_source=spec.key_source,
+        engine=spec.plan().engine
+    )
+
+
+@register_kernel(CipherType.VIGENERE)
+def vigenere_kernel(spec: CipherSpec, engine: str) -> Union[ShiftKernel, KeyedKernel]:
+    alphabet, keyword, mode = _vigenere_key(spec)
+
+    return build_vigenere_kernel(alphabet, keyword, mode, spec.key_source, engine)
+
+
+@register_cipher(CipherType.SUBSTITUTION)
+def substitution_constructor(spec: CipherSpec) -> CipherBit:
+    text = _native_text(spec)
+    alphabet, cipher_alphabet = _substitution_alphabets(spec)
+
+    return SubstitutionCipher(
+        text=text,
         alphabet=list(alphabet),
-        keyword=keyword
+        cipher_alphabet=cipher_alphabet,
+        engine=spec.plan().engine
     )
 
+
+@register_kernel(CipherType.SUBSTITUTION)
+def substitution_kernel(spec: CipherSpec, engine: str) -> SubstitutionKernel:
+    alphabet, cipher_alphabet = _substitution_alphabets(spec)
+
+    return SubstitutionKernel(alphabet=alphabet.chars, cipher_alphabet=tuple(cipher_alphabet), engine=engine)
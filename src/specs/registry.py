@@ -1,28 +1,137 @@
-from typing import Callable, Dict
+from importlib import import_module
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Union
 
 from utils.error import InvalidCipherTypeError
-from ciphers.base_cipher import CipherBit
-from specs.spec import CipherSpec
 from specs.types import CipherType
 
+if TYPE_CHECKING:
+    from ciphers.base_cipher import CipherBit
+    from engines.streams import Kernel
+    from specs.spec import CipherSpec
+
 """
-This module provides a registry for cipher constructors, allowing for dynamic 
+This module provides a registry for cipher constructors, allowing for dynamic
 creation of cipher instances based on their specifications.
+
+Constructors are resolved lazily. Each cipher type maps to a target string,
+either "package.module" (the module registers itself with `register_cipher`
+when imported) or "package.module:constructor". The target is only imported
+the first time `build_cipher` needs it, so importing the specs package does
+not pull in any cipher implementation.
+
+Ciphers that can be streamed chunk by chunk (see `engines.kernels`) also
+register a kernel constructor with `register_kernel`, resolved the same way.
+
+Third-party ciphers are discovered through the `crypto_tractatus.ciphers`
+entry point group, using the entry point name as cipher type and its value
+as target:
+
+    [project.entry-points."crypto_tractatus.ciphers"]
+    atbash = "my_package.atbash:atbash_constructor"
 """
 
 
-CipherConstructor = Callable[[CipherSpec], CipherBit]
+CipherConstructor = Callable[["CipherSpec"], "CipherBit"]
+KernelConstructor = Callable[["CipherSpec", str], "Kernel"]
+CipherKey = Union[CipherType, str]
+
+ENTRY_POINT_GROUP = "crypto_tractatus.ciphers"
+
+_registry: Dict[str, CipherConstructor] = {}
+
+_kernel_registry: Dict[str, KernelConstructor] = {}
 
-_registry: Dict[CipherType, CipherConstructor] = {}
+_lazy_registry: Dict[str, str] = {
+    CipherType.ROT.value: "specs.constructors",
+    CipherType.VIGENERE.value: "specs.constructors",
+    CipherType.SUBSTITUTION.value: "specs.constructors",
+}
 
-def register_cipher(cipher_type: CipherType):
+_entry_points_loaded = False
+
+
+def _key(cipher_type: CipherKey) -> str:
+    return cipher_type.value if isinstance(cipher_type, CipherType) else str(cipher_type)
+
+
+def register_cipher(cipher_type: CipherKey):
     def wrapper(func: CipherConstructor):
-        _registry[cipher_type] = func
+        _registry[_key(cipher_type)] = func
+        return func
+    return wrapper
+
+
+def register_kernel(cipher_type: CipherKey):
+    def wrapper(func: KernelConstructor):
+        _kernel_registry[_key(cipher_type)] = func
         return func
     return wrapper
 
-def build_cipher(spec: CipherSpec) -> CipherBit:
-    if spec.type not in _registry:
+
+def register_lazy_cipher(cipher_type: CipherKey, target: str) -> None:
+    """
+    Map a cipher type to the target that provides its constructor.
+
+    Example:
+        register_lazy_cipher("atbash", "my_package.atbash:atbash_constructor")
+    """
+    _lazy_registry[_key(cipher_type)] = target
+
+
+def _load_entry_points() -> None:
+    """Add installed third-party ciphers to the lazy registry (once per process)."""
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+
+    from importlib.metadata import entry_points
+
+    try:
+        found = entry_points(group=ENTRY_POINT_GROUP)
+    except TypeError:  # Python < 3.10 returns a dict of groups
+        found = entry_points().get(ENTRY_POINT_GROUP, [])
+
+    for entry_point in found:
+        # Built-in ciphers always take precedence over plugins.
+        _lazy_registry.setdefault(entry_point.name, entry_point.value)
+
+
+def _resolve(key: str) -> Optional[CipherConstructor]:
+    if key in _registry:
+        return _registry[key]
+
+    target = _lazy_registry.get(key)
+    if target is None:
+        _load_entry_points()
+        target = _lazy_registry.get(key)
+    if target is None:
+        return None
+
+    module_path, _, attr = target.partition(":")
+    module = import_module(module_path)
+    if attr and key not in _registry:
+        _registry[key] = getattr(module, attr)
+    return _registry.get(key)
+
+
+def registered_cipher_types() -> List[str]:
+    """Return every cipher type that can be built, without importing any cipher."""
+    _load_entry_points()
+    return sorted(set(_registry) | set(_lazy_registry))
+
+
+def build_cipher(spec: "CipherSpec") -> "CipherBit":
+    constructor = _resolve(_key(spec.type))
+    if constructor is None:
         raise InvalidCipherTypeError(f"Cipher type '{spec.type}' is not registered.")
-    return _registry[spec.type](spec)
+    return constructor(spec)
+
 
+def build_kernel(spec: "CipherSpec", engine: str = "translate") -> "Kernel":
+    """Build the compiled kernel for a spec; its text is not used."""
+    key = _key(spec.type)
+    _resolve(key)
+    if key not in _kernel_registry:
+        raise InvalidCipherTypeError(f"Cipher type '{spec.type}' has no streaming kernel.")
+    return _kernel_registry[key](spec, engine)
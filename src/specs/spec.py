@@ -1,21 +1,67 @@
 from dataclasses import dataclass
 from typing import Union, Optional, List
-from specs.types import CipherType
+from specs.types import CipherType, VigenereMode
 from ciphers.base_cipher import CipherBit
+from engines.key_streams import KeySource
+from engines.planner import KEYED, PERIODIC, ROT, SUBSTITUTION, ExecutionPlan, plan_execution
+from utils.coercion import TextLike
 from specs.registry import build_cipher
 
 @dataclass
 class CipherSpec:
     """
     A specification for a cipher, containing the type, text, alphabet, and optional keyword or shift.
+
+    The text may be a str, bytes, bytearray, memoryview or list of characters;
+    the cipher returns results of the same type.
+
+    The type is usually a `CipherType`, but plain strings are accepted so that
+    ciphers registered by plugins can be addressed by name.
+
+    Vigenère ciphers can also set `mode`: RUNNING_KEY reads the key from
+    `key_source` (see `engines.key_streams`), AUTOKEY uses `keyword` as primer.
+
+    The engine the cipher runs on is chosen by the planner (see
+    `engines.planner`) unless `engine` forces one; `explain()` shows the plan.
     """
 
-    type: CipherType
-    text: str
+    type: Union[CipherType, str]
+    text: TextLike
     alphabet: Union[str, List[str]]
     keyword: Optional[str] = None
     shift: Optional[int] = None
+    mode: Optional[VigenereMode] = None
+    key_source: Optional[KeySource] = None
+    engine: Optional[str] = None
+
+    @property
+    def kernel_kind(self) -> str:
+        if self.type in (CipherType.ROT, CipherType.ROT.value):
+            return ROT
+        if self.type in (CipherType.SUBSTITUTION, CipherType.SUBSTITUTION.value):
+            return SUBSTITUTION
+        if self.mode not in (None, VigenereMode.REPEATING, VigenereMode.REPEATING.value):
+            return KEYED
+        return PERIODIC
+
+    def plan(self, text_size: Optional[int] = None, allow_parallel: bool = True) -> ExecutionPlan:
+        """
+        The execution plan `to_cipher` will use for this spec.
+
+        `text_size` overrides the length of `text`, e.g. with the chunk size
+        when the spec only describes a stream.
+        """
+        return plan_execution(
+            self.kernel_kind,
+            text_size=len(self.text) if text_size is None else text_size,
+            alphabet_size=len(self.alphabet),
+            text_kind="str" if isinstance(self.text, (str, list)) else "bytes",
+            engine=self.engine,
+            allow_parallel=allow_parallel,
+        )
+
+    def explain(self) -> str:
+        return self.plan().explain()
 
     def to_cipher(self) -> CipherBit:
         return build_cipher(self)
-
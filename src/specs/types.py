@@ -9,3 +9,12 @@ class CipherType(Enum):
     ROT = "rot"
     VIGENERE = "vigenere"
     CAESAR = "caesar"
+    SUBSTITUTION = "substitution"
+
+
+class VigenereMode(Enum):
+    """How the Vigenère key stream is produced."""
+
+    REPEATING = "repeating"
+    RUNNING_KEY = "running"
+    AUTOKEY = "autokey"
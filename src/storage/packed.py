@@ -0,0 +1,358 @@
+# src/storage/packed.py
+
+import io
+import os
+import struct
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from engines.numpy_engine import AlphabetArrays, from_code_points, to_code_points
+from structures.sequences import AlphabetSequence
+from utils.coercion import NativeText
+from utils.error import InvalidInputTypeError
+
+"""
+Bit-packed ciphertext storage.
+
+Alphabet characters are stored as indices of ceil(log2 |alphabet|) bits
+each; everything else (spaces, punctuation, characters a ROT cipher
+replaced) goes to a sparse side table per block: the positions, as 16/32-bit
+offsets or a bitmap, whichever is smaller, plus the characters themselves.
+
+Layout (little-endian):
+
+    header   magic "CTPK", version u8, bits u8, kind u8 (0 = str, 1 = bytes),
+             block size u32, alphabet length u32, alphabet (UTF-8)
+    blocks   n_chars u32, side format u8, n_side u32, side chars length u32,
+             packed indices, side positions, side chars
+    end      a block header with n_chars = 0
+    index    u64 file offset of each block
+    footer   index offset u64, total characters u64, block count u32, magic
+
+Every block but the last holds exactly `block_size` characters, so a
+character offset maps straight to a block. Writing only appends (pipes
+work); `PackedReader.iter_blocks` reads sequentially up to the end marker,
+while `read_block`/`read` seek through the index.
+"""
+
+
+MAGIC = b"CTPK"
+VERSION = 1
+DEFAULT_BLOCK_SIZE = 1 << 16
+
+_HEADER = struct.Struct("<4sBBBII")
+_BLOCK = struct.Struct("<IBII")
+_FOOTER = struct.Struct("<QQI4s")
+
+_STR, _BYTES = 0, 1
+_NO_SIDE, _SIDE_POSITIONS, _SIDE_BITMAP = 0, 1, 2
+
+
+def bits_for(size: int) -> int:
+    """
+    Bits per packed index for an alphabet of `size` characters.
+
+    >>> bits_for(26), bits_for(64), bits_for(65)
+    (5, 6, 7)
+    """
+    return max(1, (size - 1).bit_length())
+
+
+def pack_indices(indices: np.ndarray, bits: int) -> bytes:
+    """Pack indices into `bits` bits each, most significant bit first."""
+    shifts = np.arange(bits - 1, -1, -1, dtype=np.uint32)
+    planes = (indices.astype(np.uint32)[:, None] >> shifts) & 1
+    return np.packbits(planes.astype(np.uint8).ravel()).tobytes()
+
+
+def unpack_indices(data: bytes, count: int, bits: int) -> np.ndarray:
+    """Inverse of `pack_indices`."""
+    planes = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=count * bits).reshape(count, bits)
+    weights = (1 << np.arange(bits - 1, -1, -1, dtype=np.uint32))
+    return planes.astype(np.uint32) @ weights
+
+
+def _position_dtype(block_size: int) -> np.dtype:
+    """Side-table positions: 16-bit offsets while they fit a block, else 32-bit."""
+    return np.dtype("<u2" if block_size <= 1 << 16 else "<u4")
+
+
+@dataclass(frozen=True)
+class _Layout:
+    """What a reader needs to decode blocks: everything stored in the header."""
+
+    alphabet: Tuple[str, ...]
+    bits: int
+    binary: bool
+    block_size: int
+
+    def arrays(self) -> AlphabetArrays:
+        return AlphabetArrays.build(self.alphabet)
+
+
+def _open(target: Union[str, os.PathLike, BinaryIO], mode: str) -> Tuple[BinaryIO, bool]:
+    if isinstance(target, (str, os.PathLike)):
+        return open(target, mode), True
+    return target, False
+
+
+class PackedWriter:
+    """
+    Streaming writer: `write` text in pieces of any size, `close` to finish.
+
+    Example:
+        >>> buffer = io.BytesIO()
+        >>> with PackedWriter(buffer, "ABCDEFGHIJKLMNOPQRSTUVWXYZ", block_size=8) as writer:
+        ...     writer.write("LXFOPV EF ")
+        ...     writer.write("RNHR")
+        >>> reader = PackedReader(io.BytesIO(buffer.getvalue()))
+        >>> reader.bits, reader.blocks, reader.read(), reader.read_block(1)
+        (5, 2, 'LXFOPV EF RNHR', 'F RNHR')
+    """
+
+    def __init__(
+        self,
+        target: Union[str, os.PathLike, BinaryIO],
+        alphabet: Union[str, Sequence[str], AlphabetSequence],
+        block_size: int = DEFAULT_BLOCK_SIZE,
+    ):
+        alphabet = alphabet if isinstance(alphabet, AlphabetSequence) else AlphabetSequence(list(alphabet))
+        if any(len(char) != 1 for char in alphabet):
+            raise InvalidInputTypeError("Packed storage needs an alphabet of single characters.")
+        if not 0 < block_size < 1 << 32:
+            raise InvalidInputTypeError(f"Block size must be between 1 and 2**32 - 1 (got {block_size}).")
+
+        self._file, self._owned = _open(target, "wb")
+        self._alphabet = tuple(alphabet)
+        self._arrays = AlphabetArrays.build(self._alphabet)
+        self._bits = bits_for(len(self._alphabet))
+        self._block_size = block_size
+        self._binary: Optional[bool] = None
+        self._pending: List[NativeText] = []
+        self._pending_size = 0
+        self._offsets: List[int] = []
+        self._position = 0
+        self._total = 0
+        self._closed = False
+
+    def __enter__(self) -> "PackedWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, text: NativeText) -> None:
+        """Append text; full blocks are encoded and written immediately."""
+        binary = not isinstance(text, str)
+        if self._binary is None:
+            self._binary = binary
+            self._write_header()
+        elif binary != self._binary:
+            raise InvalidInputTypeError("Cannot mix str and bytes in one packed file.")
+
+        self._pending.append(bytes(text) if binary else text)
+        self._pending_size += len(text)
+        self._total += len(text)
+        if self._pending_size >= self._block_size:
+            data = (b"" if binary else "").join(self._pending)
+            full = len(data) - len(data) % self._block_size
+            for start in range(0, full, self._block_size):
+                self._write_block(data[start:start + self._block_size])
+            self._pending = [data[full:]]
+            self._pending_size = len(data) - full
+
+    def close(self) -> None:
+        """Write the last partial block, the index and the footer."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._binary is None:
+            self._binary = False
+            self._write_header()
+        if self._pending_size:
+            self._write_block((b"" if self._binary else "").join(self._pending))
+        self._emit(_BLOCK.pack(0, _NO_SIDE, 0, 0))
+
+        index_offset = self._position
+        self._emit(np.asarray(self._offsets, dtype="<u8").tobytes())
+        self._emit(_FOOTER.pack(index_offset, self._total, len(self._offsets), MAGIC))
+        if self._owned:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def _emit(self, data: bytes) -> None:
+        self._file.write(data)
+        self._position += len(data)
+
+    def _write_header(self) -> None:
+        alphabet = "".join(self._alphabet).encode("utf-8")
+        kind = _BYTES if self._binary else _STR
+        self._emit(_HEADER.pack(MAGIC, VERSION, self._bits, kind, self._block_size, len(alphabet)) + alphabet)
+
+    def _write_block(self, text: NativeText) -> None:
+        if self._binary:
+            code_points = np.frombuffer(text, dtype=np.uint8)
+        else:
+            code_points = to_code_points(text)
+        indices = self._arrays.indices(code_points)
+        inside = indices >= 0
+        packed = pack_indices(indices[inside], self._bits)
+
+        side_positions = np.flatnonzero(~inside)
+        side_format, positions, chars = _NO_SIDE, b"", b""
+        if len(side_positions):
+            as_offsets = side_positions.astype(_position_dtype(self._block_size)).tobytes()
+            as_bitmap = np.packbits(~inside).tobytes()
+            side_format, positions = (
+                (_SIDE_POSITIONS, as_offsets) if len(as_offsets) <= len(as_bitmap) else (_SIDE_BITMAP, as_bitmap)
+            )
+            outside = code_points[side_positions]
+            chars = outside.tobytes() if self._binary else from_code_points(outside).encode("utf-8")
+
+        self._offsets.append(self._position)
+        self._emit(_BLOCK.pack(len(text), side_format, len(side_positions), len(chars)) + packed + positions + chars)
+
+
+class PackedReader:
+    """
+    Reader with sequential (`iter_blocks`) and random (`read_block`, `read`) access.
+
+    Attributes:
+        alphabet: Alphabet stored in the file.
+        bits: Bits per packed index.
+        block_size: Characters per block (all blocks but the last).
+        length: Total number of characters (random-access readers only).
+        blocks: Number of blocks (random-access readers only).
+    """
+
+    def __init__(self, source: Union[str, os.PathLike, BinaryIO], seekable: bool = True):
+        self._file, self._owned = _open(source, "rb")
+        magic, version, bits, kind, block_size, alphabet_size = _HEADER.unpack(self._read_exact(_HEADER.size))
+        if magic != MAGIC or version != VERSION:
+            raise InvalidInputTypeError("Not a packed ciphertext file (or an unsupported version).")
+        alphabet = tuple(self._read_exact(alphabet_size).decode("utf-8"))
+        self._layout = _Layout(alphabet, bits, kind == _BYTES, block_size)
+        self._arrays = self._layout.arrays()
+        self._first_block = _HEADER.size + alphabet_size
+
+        self._offsets: Optional[np.ndarray] = None
+        self.length: Optional[int] = None
+        if seekable:
+            self._file.seek(-_FOOTER.size, io.SEEK_END)
+            index_offset, self.length, count, magic = _FOOTER.unpack(self._read_exact(_FOOTER.size))
+            if magic != MAGIC:
+                raise InvalidInputTypeError("Packed ciphertext file is truncated (no footer).")
+            self._file.seek(index_offset)
+            self._offsets = np.frombuffer(self._read_exact(8 * count), dtype="<u8")
+            self._file.seek(self._first_block)
+
+    def __enter__(self) -> "PackedReader":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._owned:
+            self._file.close()
+
+    @property
+    def alphabet(self) -> Tuple[str, ...]:
+        return self._layout.alphabet
+
+    @property
+    def bits(self) -> int:
+        return self._layout.bits
+
+    @property
+    def block_size(self) -> int:
+        return self._layout.block_size
+
+    @property
+    def blocks(self) -> Optional[int]:
+        return None if self._offsets is None else len(self._offsets)
+
+    def iter_blocks(self) -> Iterator[NativeText]:
+        """Decode blocks in order, reading sequentially from the first block."""
+        if self._offsets is not None:
+            self._file.seek(self._first_block)
+        while True:
+            block = self._read_next_block()
+            if block is None:
+                return
+            yield block
+
+    def read_block(self, index: int) -> NativeText:
+        """Decode one block, seeking to it through the index."""
+        if self._offsets is None:
+            raise InvalidInputTypeError("Random access needs a seekable reader.")
+        self._file.seek(int(self._offsets[index]))
+        return self._read_next_block()
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> NativeText:
+        """Characters [start, stop), decoding only the blocks that hold them."""
+        if self._offsets is None:
+            return self._empty().join(self.iter_blocks())[start:stop]
+        start, stop, _ = slice(start, stop).indices(self.length)
+        if start >= stop:
+            return self._empty()
+        first, last = start // self.block_size, (stop - 1) // self.block_size
+        data = self._empty().join(self.read_block(i) for i in range(first, last + 1))
+        offset = first * self.block_size
+        return data[start - offset:stop - offset]
+
+    def _empty(self) -> NativeText:
+        return b"" if self._layout.binary else ""
+
+    def _read_exact(self, size: int) -> bytes:
+        data = self._file.read(size)
+        if len(data) != size:
+            raise InvalidInputTypeError("Packed ciphertext file is truncated.")
+        return data
+
+    def _read_next_block(self) -> Optional[NativeText]:
+        n_chars, side_format, n_side, chars_size = _BLOCK.unpack(self._read_exact(_BLOCK.size))
+        if n_chars == 0:
+            return None
+        layout = self._layout
+        n_inside = n_chars - n_side
+        packed = self._read_exact((n_inside * layout.bits + 7) // 8)
+
+        inside = np.ones(n_chars, dtype=bool)
+        if side_format == _SIDE_POSITIONS:
+            dtype = _position_dtype(layout.block_size)
+            positions = np.frombuffer(self._read_exact(n_side * dtype.itemsize), dtype=dtype)
+            inside[positions] = False
+        elif side_format == _SIDE_BITMAP:
+            bitmap = np.frombuffer(self._read_exact((n_chars + 7) // 8), dtype=np.uint8)
+            inside = ~np.unpackbits(bitmap, count=n_chars).astype(bool)
+        chars = self._read_exact(chars_size)
+
+        indices = unpack_indices(packed, n_inside, layout.bits)
+        if layout.binary:
+            out = np.empty(n_chars, dtype=np.uint8)
+            out[inside] = self._arrays.code_points[indices]
+            out[~inside] = np.frombuffer(chars, dtype=np.uint8)
+            return out.tobytes()
+
+        outside = to_code_points(chars.decode("utf-8")) if n_side else np.empty(0, dtype=np.uint8)
+        out = np.empty(n_chars, dtype=np.uint32)
+        out[inside] = self._arrays.code_points[indices]
+        out[~inside] = outside
+        return from_code_points(out)
+
+
+def pack(text: NativeText, alphabet: Union[str, Sequence[str], AlphabetSequence], block_size: int = DEFAULT_BLOCK_SIZE) -> bytes:
+    """Pack a whole text into bytes."""
+    buffer = io.BytesIO()
+    with PackedWriter(buffer, alphabet, block_size) as writer:
+        writer.write(text)
+    return buffer.getvalue()
+
+
+def unpack(data: bytes) -> NativeText:
+    """Unpack bytes produced by `pack`."""
+    return PackedReader(io.BytesIO(data)).read()
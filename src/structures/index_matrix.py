@@ -0,0 +1,155 @@
+# src/structures/index_matrix.py
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from engines.numpy_engine import AlphabetArrays, to_code_points
+from structures.rotation_matrix import RotationMatrix
+from utils.error import InvalidInputTypeError
+from utils.validators import ensure_not_empty
+
+"""
+NumPy-backed form of `RotationMatrix`.
+
+Cells are stored as base sequence indices in a `uint16` array (`uint32` for
+alphabets of 65535 characters or more), so whole-matrix analytics, such as
+column statistics, comparisons and Latin-square checks, run as vectorized
+operations instead of nested list comprehensions. Cells holding a character
+outside the base sequence store `missing`, the largest value of the dtype.
+"""
+
+
+@dataclass(frozen=True, eq=False)
+class IndexMatrix:
+    """
+    A rotation matrix as a 2-D array of base sequence indices.
+
+    Example:
+        >>> im = IndexMatrix.rotations(['A', 'B', 'C'])
+        >>> im.indices.tolist()
+        [[0, 1, 2], [1, 2, 0], [2, 0, 1]]
+        >>> im.lookup([1, 2], [2, 0]).tolist()
+        [0, 2]
+        >>> im.lookup_chars([[1, 2], [0, 1]])
+        ['A', 'B']
+        >>> im.is_latin_square()
+        True
+        >>> im.to_rotation_matrix().get_column_vector(1)
+        ['B', 'C', 'A']
+    """
+
+    base_sequence: Tuple[str, ...]
+    indices: np.ndarray
+
+    def __post_init__(self):
+        ensure_not_empty(self.base_sequence, "Base sequence must not be empty.")
+        if self.indices.ndim != 2:
+            raise InvalidInputTypeError(f"Index matrix must be 2-D (got {self.indices.ndim}-D).")
+        object.__setattr__(self, "base_sequence", tuple(self.base_sequence))
+
+    @staticmethod
+    def dtype_for(size: int) -> type:
+        """Narrowest unsigned dtype holding `size` indices plus the missing marker."""
+        return np.uint16 if size < np.iinfo(np.uint16).max else np.uint32
+
+    @property
+    def missing(self) -> int:
+        return int(np.iinfo(self.indices.dtype).max)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.indices.shape
+
+    @classmethod
+    def rotations(cls, base_sequence: Sequence[str], shifts: Optional[Sequence[int]] = None) -> "IndexMatrix":
+        """Matrix whose row i is the base sequence rotated left by shifts[i] (default: every shift in order)."""
+        n = len(base_sequence)
+        shifts = np.arange(n) if shifts is None else np.asarray(shifts, dtype=np.int64)
+        indices = (np.arange(n)[None, :] + shifts[:, None]) % n
+        return cls(tuple(base_sequence), indices.astype(cls.dtype_for(n)))
+
+    @classmethod
+    def from_rotation_matrix(cls, matrix: RotationMatrix) -> "IndexMatrix":
+        """Convert the list form; rows must all have the same length."""
+        base = tuple(matrix.base_sequence)
+        rows = matrix.matrix
+        width = len(rows[0]) if rows else 0
+        if any(len(row) != width for row in rows):
+            raise InvalidInputTypeError("Rows of a RotationMatrix must have equal length to convert it to an array.")
+
+        dtype = cls.dtype_for(len(base))
+        missing = np.iinfo(dtype).max
+        cells = [char for row in rows for char in row]
+        joined = "".join(cells)
+        if len(joined) == len(cells):
+            # One character per cell: map all cells at once through a code point lookup table.
+            found = AlphabetArrays.build(base).indices(to_code_points(joined)) if joined else np.empty(0, np.int32)
+            flat = np.where(found >= 0, found, missing)
+        else:
+            index_map = matrix.index_map
+            flat = np.fromiter((index_map.get(char, missing) for char in cells), dtype=np.int64, count=len(cells))
+        return cls(base, flat.astype(dtype).reshape(len(rows), width))
+
+    def to_rotation_matrix(self, fill: str = "?") -> RotationMatrix:
+        """Convert back to the list form; missing cells become `fill`."""
+        chars = np.asarray(self.base_sequence + (fill,), dtype=object)
+        cells = np.where(self.indices == self.missing, len(self.base_sequence), self.indices)
+        return RotationMatrix(base_sequence=list(self.base_sequence), matrix=chars[cells].tolist())
+
+    def as_int_matrix(self) -> List[List[int]]:
+        """Same as `RotationMatrix.as_int_matrix`: nested lists, -1 for missing cells."""
+        return np.where(self.indices == self.missing, -1, self.indices.astype(np.int64)).tolist()
+
+    def lookup(self, rows, cols=None) -> np.ndarray:
+        """
+        Indices at many (row, col) positions at once, wrapping like `RotationMatrix.lookup`.
+
+        Pass two index arrays, or a single (k, 2) array of pairs.
+        """
+        if cols is None:
+            pairs = np.asarray(rows, dtype=np.int64).reshape(-1, 2)
+            rows, cols = pairs[:, 0], pairs[:, 1]
+        height, width = self.shape
+        return self.indices[np.asarray(rows, dtype=np.int64) % height, np.asarray(cols, dtype=np.int64) % width]
+
+    def lookup_chars(self, rows, cols=None) -> List[str]:
+        """`lookup`, mapped to base sequence characters."""
+        chars = np.asarray(self.base_sequence + ("?",), dtype=object)
+        found = self.lookup(rows, cols)
+        return chars[np.where(found == self.missing, len(self.base_sequence), found)].tolist()
+
+    def row(self, index: int) -> np.ndarray:
+        return self.indices[index % self.shape[0]]
+
+    def column(self, index: int) -> np.ndarray:
+        return self.indices[:, index % self.shape[1]]
+
+    def column_counts(self) -> np.ndarray:
+        """
+        Occurrences of each base index in each column, as a (len(base), columns) array.
+
+        Missing cells are not counted.
+        """
+        n = len(self.base_sequence)
+        height, width = self.shape
+        cells = self.indices.astype(np.int64)
+        codes = cells * width + np.arange(width)
+        codes = codes[cells != self.missing]
+        return np.bincount(codes, minlength=n * width).reshape(n, width)
+
+    def is_latin_square(self) -> bool:
+        """Whether the matrix is n x n with every base index exactly once in each row and column."""
+        n = len(self.base_sequence)
+        if self.shape != (n, n):
+            return False
+        expected = np.arange(n)
+        return bool((np.sort(self.indices, axis=1) == expected).all() and (np.sort(self.indices, axis=0).T == expected).all())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IndexMatrix):
+            return NotImplemented
+        return self.base_sequence == other.base_sequence and np.array_equal(self.indices, other.indices)
+
+    __hash__ = None
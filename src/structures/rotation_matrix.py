@@ -1,6 +1,9 @@
-from typing import List, Dict
+from typing import TYPE_CHECKING, List, Dict
 from dataclasses import dataclass, field
 
+if TYPE_CHECKING:
+    from structures.index_matrix import IndexMatrix
+
 
 @dataclass(frozen=True)
 class RotationMatrix:
@@ -63,3 +66,8 @@ class RotationMatrix:
         """Returns the matrix as integer indices according to base_sequence."""
         return [[self.index_map.get(char, -1) for char in row] for row in self.matrix]
 
+    def to_index_matrix(self) -> "IndexMatrix":
+        """Returns the NumPy-backed form (see `structures.index_matrix`); requires NumPy."""
+        from structures.index_matrix import IndexMatrix
+        return IndexMatrix.from_rotation_matrix(self)
+
@@ -1,7 +1,8 @@
 # structures/sequences.py
 
-from dataclasses import dataclass
-from typing import List, Union, Iterator
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Dict, Hashable, List, Optional, Tuple, Union, Iterator
 from utils.coercion import coerce_to_char_list
 from utils.validators import ensure_not_empty
 from utils.error import InvalidKeywordError, DuplicateCharacterError
@@ -35,16 +36,108 @@ class TextSequence(SequenceBase):
         object.__setattr__(self, "value", coerced)
 
 
+# Interned alphabets, keyed by (class, raw input); the oldest entries go first once full.
+ALPHABET_REGISTRY_SIZE = 256
+_alphabets: Dict[Tuple[type, Hashable], "AlphabetSequence"] = {}
+_alphabets_lock = Lock()
+
+# Duplicates named in a DuplicateCharacterError message.
+DUPLICATES_REPORTED = 3
+
+
 @dataclass(frozen=True)
 class AlphabetSequence(SequenceBase):
-    def __init__(self, raw: Union[str, List[str]]):
-        coerced = coerce_to_char_list(raw)
+    """
+    A validated alphabet, interned: constructing an alphabet already seen
+    (as the same str, or a list of the same characters) returns the
+    canonical object without validating again. Canonical alphabets are
+    shared, so their `value` must not be mutated.
+
+    Example:
+        >>> AlphabetSequence("ABC") is AlphabetSequence("ABC")
+        True
+        >>> AlphabetSequence("ABC").index_map
+        {'A': 0, 'B': 1, 'C': 2}
+    """
+
+    index_map: Dict[str, int] = field(init=False, repr=False, compare=False)
+    chars: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __new__(cls, raw: Union[str, List[str]]):
+        key = _registry_key(cls, raw)
+        cached = _alphabets.get(key) if key is not None else None
+        if cached is not None:
+            return cached
+
+        coerced = list(coerce_to_char_list(raw))
         ensure_not_empty(coerced, "Alphabet cannot be empty")
+        chars = tuple(coerced)
+        index_map = dict(zip(chars, range(len(chars))))
+        if len(index_map) != len(chars):
+            raise DuplicateCharacterError(_describe_duplicates(chars))
+
+        with _alphabets_lock:
+            # One canonical object per alphabet, whichever input form it was first built from.
+            canonical = _alphabets.get((cls, chars))
+            if canonical is None:
+                canonical = super().__new__(cls)
+                object.__setattr__(canonical, "value", coerced)
+                object.__setattr__(canonical, "index_map", index_map)
+                object.__setattr__(canonical, "chars", chars)
+                _remember((cls, chars), canonical)
+            if key is not None:
+                _remember(key, canonical)
+        return canonical
 
-        if len(set(coerced)) != len(coerced):
-            raise DuplicateCharacterError(f"Alphabet cannot contain duplicate characters (got: {coerced}).") 
-
-        object.__setattr__(self, "value", coerced)
+    def __init__(self, raw: Union[str, List[str]]):
+        # Validation and interning happen in __new__.
+        pass
+
+    def __reduce__(self):
+        # Unpickle through __new__, so the result is validated and interned like any other alphabet.
+        return type(self), (list(self.value),)
+
+
+def _registry_key(cls: type, raw: Union[str, List[str]]) -> Optional[Tuple[type, Hashable]]:
+    # Only the input types coerce_to_char_list accepts; anything else goes through validation.
+    if isinstance(raw, str):
+        return cls, raw
+    if not isinstance(raw, list):
+        return None
+    key = (cls, tuple(raw))
+    try:
+        hash(key)
+    except TypeError:
+        return None  # Unhashable elements: validation reports them.
+    return key
+
+
+def _remember(key: Tuple[type, Hashable], alphabet: AlphabetSequence) -> None:
+    while len(_alphabets) >= ALPHABET_REGISTRY_SIZE:
+        del _alphabets[next(iter(_alphabets))]
+    _alphabets[key] = alphabet
+
+
+def clear_alphabet_registry() -> None:
+    """Forget all interned alphabets."""
+    with _alphabets_lock:
+        _alphabets.clear()
+
+
+def _describe_duplicates(chars: Tuple[str, ...]) -> str:
+    """Name the first few repeated characters and where they occur, not the whole alphabet."""
+    first_seen: Dict[str, int] = {}
+    found = []
+    for position, char in enumerate(chars):
+        if char in first_seen:
+            found.append(f"{char!r} at {first_seen[char]} and {position}")
+            if len(found) == DUPLICATES_REPORTED:
+                break
+        else:
+            first_seen[char] = position
+    total = len(chars) - len(set(chars))
+    more = f"; {total} repeated characters in total" if total > len(found) else ""
+    return f"Alphabet cannot contain duplicate characters (got {', '.join(found)}{more})."
 
 
 @dataclass(frozen=True)
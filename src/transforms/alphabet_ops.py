@@ -1,4 +1,7 @@
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
+
+from structures.sequences import AlphabetSequence
+from utils.error import InvalidKeywordError
 
 
 def from_ascii_range(start: int, end: int) -> List[str]:
@@ -27,3 +30,24 @@ def with_extras(base: List[str], extras: List[str]) -> List[str]:
     seen = set(base)
     return base + [char for char in extras if char not in seen]
 
+
+def keyed_alphabet(keyword: Sequence[str], alphabet: Sequence[str]) -> List[str]:
+    """
+    Build a keyword-mixed alphabet: the keyword's distinct characters in
+    order, followed by the rest of the alphabet in its original order.
+
+    Runs in O(n + k) with one pass over each sequence. A keyword using every
+    alphabet character gives that permutation back unchanged.
+
+    Example:
+        >>> "".join(keyed_alphabet("KRYPTOS", "ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+        'KRYPTOSABCDEFGHIJLMNQUVWXZ'
+    """
+    head = list(dict.fromkeys(keyword))
+    members = alphabet.index_map if isinstance(alphabet, AlphabetSequence) else set(alphabet)
+    outside = [char for char in head if char not in members]
+    if outside:
+        raise InvalidKeywordError(f"Keyword characters must belong to the alphabet (got: {outside}).")
+
+    used = set(head)
+    return head + [char for char in alphabet if char not in used]
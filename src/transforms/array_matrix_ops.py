@@ -0,0 +1,49 @@
+# src/transforms/array_matrix_ops.py
+
+import numpy as np
+
+from structures.index_matrix import IndexMatrix
+
+"""
+`MatrixTransform` for `IndexMatrix`: the same operations as whole-array
+rolls, flips and transposes. Each returns a new matrix; results convert to
+exactly what `MatrixTransform` returns for the list form (shifts wrap
+modulo the matrix size here, as `rotate` does for row contents).
+"""
+
+
+class ArrayMatrixTransform:
+    """
+    Array counterpart of `transforms.matrix_ops.MatrixTransform`.
+
+    >>> im = IndexMatrix.rotations(['A', 'B', 'C'])
+    >>> ArrayMatrixTransform.rotate_rows(im, 1).indices[0].tolist()
+    [2, 0, 1]
+    >>> ArrayMatrixTransform.transpose(im).to_rotation_matrix().matrix[1]
+    ['B', 'C', 'A']
+    """
+
+    @staticmethod
+    def rotate_rows(matrix: IndexMatrix, shift: int) -> IndexMatrix:
+        """Rotates each row's content by `shift` (NOT row positions)."""
+        return IndexMatrix(matrix.base_sequence, np.roll(matrix.indices, shift, axis=1))
+
+    @staticmethod
+    def mirror_rows(matrix: IndexMatrix) -> IndexMatrix:
+        """Reverses all rows in the matrix."""
+        return IndexMatrix(matrix.base_sequence, np.flip(matrix.indices, axis=1).copy())
+
+    @staticmethod
+    def transpose(matrix: IndexMatrix) -> IndexMatrix:
+        """Transposes the matrix (rows become columns and vice versa)."""
+        return IndexMatrix(matrix.base_sequence, np.ascontiguousarray(matrix.indices.T))
+
+    @staticmethod
+    def rotate_row_order(matrix: IndexMatrix, shift: int) -> IndexMatrix:
+        """Reorders rows in the matrix by shifting their position."""
+        return IndexMatrix(matrix.base_sequence, np.roll(matrix.indices, shift, axis=0))
+
+    @staticmethod
+    def rotate_column_order(matrix: IndexMatrix, shift: int) -> IndexMatrix:
+        """Reorders columns in the matrix by shifting their position."""
+        return IndexMatrix(matrix.base_sequence, np.roll(matrix.indices, shift, axis=1))
@@ -3,7 +3,7 @@
 from typing import Callable, Iterator, TypeVar, List
 
 # kanske byta namn till rotation_math?
-from math.sequence_math import normalize_shift 
+from numeric.sequence_math import normalize_shift
 
 from utils.validators import (
         ensure_not_empty,
@@ -74,13 +74,15 @@ def move_elements_to_index(seq: List[T], elements: List[T], index: int = 0) -> I
         >>> list(move_elements_to_index(['A', 'B', 'C'], ['C']))
         [['C', 'A', 'B']]
 
+    Each variant is a fresh O(n) list; to move all the elements to the front
+    at once, see `transforms.alphabet_ops.keyed_alphabet`.
     """
     for element in elements:
         if element in seq:
             temp = list(seq)
             temp.remove(element)
             temp.insert(index, element)
-            yield [element] + temp
+            yield temp
 
 
 def generate_sequence_lists(n: int, generator_func: Callable[[int], List[T]]) -> List[List[T]]:
@@ -0,0 +1,50 @@
+# src/utils/cache.py
+
+import os
+from typing import Any, Optional
+
+"""
+Location of on-disk caches (calibration results, compiled tables).
+
+Uses $CRYPTO_TRACTATUS_CACHE if set, otherwise crypto_tractatus under
+$XDG_CACHE_HOME (default ~/.cache).
+"""
+
+
+CACHE_ENV = "CRYPTO_TRACTATUS_CACHE"
+
+
+def cache_dir(create: bool = True) -> str:
+    """Return the cache directory, creating it if needed."""
+    path = os.environ.get(CACHE_ENV) or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+        "crypto_tractatus",
+    )
+    if create:
+        os.makedirs(path, exist_ok=True)
+    return path
+
+
+def cache_path(name: str, create: bool = True) -> str:
+    """Return the path of a file in the cache directory."""
+    return os.path.join(cache_dir(create), name)
+
+
+def callable_identity(func: Any) -> Optional[str]:
+    """
+    Name identifying a function across runs, for cache keys and fingerprints.
+
+    Lambdas, nested functions and other callables without a module-level
+    qualified name cannot be told apart by name, so they get None.
+
+    Example:
+        >>> callable_identity(str.upper)
+        'builtins.str.upper'
+        >>> callable_identity(lambda s: s) is None
+        True
+    """
+    qualname = getattr(func, "__qualname__", None)
+    if not qualname or "<" in qualname:
+        return None
+    module = getattr(func, "__module__", None) or getattr(getattr(func, "__objclass__", None), "__module__", None)
+    return f"{module}.{qualname}"
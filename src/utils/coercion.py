@@ -4,6 +4,10 @@ from utils.error import InvalidInputTypeError, InvalidKeywordError
 
 T = TypeVar("T")
 
+BytesLike = Union[bytes, bytearray, memoryview]
+NativeText = Union[str, BytesLike]
+TextLike = Union[NativeText, List[str]]
+
 def coerce_to_list(data: Any) -> List[Any]:
     """
     Ensure the input is a non-empty list. Convert string to list of characters.
@@ -30,14 +34,107 @@ def coerce_to_char_list(data: Union[str, List[str]]) -> List[str]:
     If a string is provided, convert to list of characters.
     """
     if isinstance(data, str):
-        result = list(data)
-    elif isinstance(data, list) and all(isinstance(el, str) for el in data):
-        result = data
-    else:
-        raise InvalidInputTypeError(f"Expected str or List[str], but got {type(data).__name__}: {data!r}")
+        return list(data)
+    if not isinstance(data, list):
+        raise InvalidInputTypeError(f"Expected str or List[str], but got {type(data).__name__}.")
+
+    try:
+        # Type-checks every element in one C-level pass instead of an isinstance call per element.
+        "".join(data)
+    except TypeError:
+        bad = next(el for el in data if not isinstance(el, str))
+        raise InvalidInputTypeError(
+            f"Expected str or List[str], but got a list containing {type(bad).__name__}: {bad!r}"
+        ) from None
+    return data
 
+def coerce_to_native_text(data: TextLike) -> NativeText:
+    """
+    Return text in a form the cipher engines process directly.
+
+    `str` and bytes-like objects are returned as is; a list of characters is
+    joined once. Bytes are read as Latin-1, one character per byte.
+
+    Example:
+        >>> coerce_to_native_text(["A", "B"])
+        'AB'
+        >>> coerce_to_native_text(b"AB")
+        b'AB'
+    """
+    if isinstance(data, (str, bytes, bytearray, memoryview)):
+        return data
+    if isinstance(data, list):
+        return "".join(data)
+    raise InvalidInputTypeError(
+        f"Expected str, bytes, bytearray, memoryview or List[str], but got {type(data).__name__}."
+    )
+
+
+def restore_text_type(result: NativeText, like: TextLike) -> TextLike:
+    """
+    Convert an engine result back to the type of the original text.
+
+    Example:
+        >>> restore_text_type("BA", ["A", "B"])
+        ['B', 'A']
+        >>> restore_text_type(b"BA", bytearray(b"AB"))
+        bytearray(b'BA')
+    """
+    if isinstance(like, list):
+        return list(result)
+    if isinstance(like, bytearray) and not isinstance(result, bytearray):
+        return bytearray(result)
+    if isinstance(like, bytes) and not isinstance(result, bytes):
+        return bytes(result)
+    if isinstance(like, memoryview):
+        return memoryview(result)
     return result
 
+
+def write_into(out: Any, result: NativeText) -> int:
+    """
+    Copy a bytes-like result into a preallocated writable buffer.
+
+    Args:
+        out: Any writable, C-contiguous buffer (bytearray, mmap, NumPy array, ...).
+        result: Bytes-like data to write.
+
+    Returns:
+        Number of bytes written.
+
+    Example:
+        >>> buffer = bytearray(4)
+        >>> write_into(buffer, b"AB"), buffer
+        (2, bytearray(b'AB\\x00\\x00'))
+    """
+    ensure_bytes_like(result)
+    size = len(result)
+    writable_view(out, size)[:size] = result
+    return size
+
+
+def ensure_bytes_like(data: NativeText) -> None:
+    """Reject `str` where text is written into a byte buffer."""
+    if isinstance(data, str):
+        raise InvalidInputTypeError("Writing into a buffer requires bytes-like text, not str.")
+
+
+def writable_view(out: Any, size: int) -> memoryview:
+    """
+    A byte view of a preallocated output buffer, checked to be writable and to hold `size` bytes.
+
+    Example:
+        >>> writable_view(bytearray(4), 3).nbytes
+        4
+    """
+    view = memoryview(out).cast("B")
+    if view.readonly:
+        raise InvalidInputTypeError("Output buffer is read-only.")
+    if len(view) < size:
+        raise InvalidInputTypeError(f"Output buffer too small: need {size} bytes, got {len(view)}.")
+    return view
+
+
 def generate_coerced_fields(
     text: Union[str, List[str]],
     alphabet: Union[str, List[str]],
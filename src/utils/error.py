@@ -44,3 +44,14 @@ class DuplicateCharacterError(CryptoTractatusError):
     def __init__(self, message="Sequence must contain only unique characters."):
         super().__init__(message)
 
+
+class InvalidEngineError(CryptoTractatusError):
+    """Raised when an unknown or unavailable execution engine is requested."""
+    def __init__(self, message="Unknown execution engine."):
+        super().__init__(message)
+
+
+class InvalidCheckpointError(CryptoTractatusError):
+    """Raised when a saved checkpoint does not belong to the run resuming from it."""
+    def __init__(self, message="Checkpoint does not match this run."):
+        super().__init__(message)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# The packages live directly under src/ (ciphers, specs, transforms, ...).
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
@@ -0,0 +1,63 @@
+import random
+import unittest
+
+from engines.kernels import numpy_available
+from specs.spec import CipherSpec
+from utils.error import InvalidKeywordError
+
+if numpy_available():
+    from engines.broadcast import BroadcastText
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZÅÄÖ"
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class TestBroadcast(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(5)
+        self.text = "".join(rng.choice(ALPHABET + " .,é") for _ in range(500))
+        self.broadcast = BroadcastText(self.text, tuple(ALPHABET), block_cells=2000)
+
+    def _single(self, **spec):
+        return CipherSpec(text=self.text, alphabet=ALPHABET, **spec).to_cipher()
+
+    def test_rot_matches_cipher(self):
+        shifts = [1, 5, 28, -3]
+        matrix = self.broadcast.rot_matrix(shifts)
+        self.assertEqual(matrix.shape, (len(shifts), len(self.text)))
+        for shift, row, lazy in zip(shifts, matrix, self.broadcast.iter_rot(shifts)):
+            expected = self._single(type="rot", shift=shift).encrypt()
+            self.assertEqual(self.broadcast.row_text(row), expected)
+            self.assertEqual(lazy, expected)
+
+    def test_vigenere_matches_cipher(self):
+        keywords = ["KEY", "LEMONLEMON", list("ÅÄÖA"), "MIDNIGHT"]
+        ciphertexts = list(self.broadcast.iter_vigenere(keywords))
+        for keyword, row, lazy in zip(keywords, self.broadcast.vigenere_matrix(keywords), ciphertexts):
+            cipher = self._single(type="vigenere", keyword="".join(keyword))
+            self.assertEqual(self.broadcast.row_text(row), cipher.encrypt())
+            self.assertEqual(lazy, cipher.encrypt())
+
+        decrypted = BroadcastText(ciphertexts[1], tuple(ALPHABET)).vigenere_matrix(["LEMON"], decrypt=True)
+        self.assertEqual(self.broadcast.row_text(decrypted[0]), self.text)
+
+    def test_bytes(self):
+        text = b"ATTACK AT DAWN"
+        broadcast = BroadcastText(text, tuple("ABCDEFGHIJKLMNOPQRSTUVWXYZ"))
+        self.assertEqual(list(broadcast.iter_vigenere(["LEMON"])), [b"LXFOPV EF RNHR"])
+        self.assertEqual(list(broadcast.iter_rot([13])), [b"NGGNPX?NG?QNJA"])
+
+    def test_lazy_iterator_accepts_generators(self):
+        ciphertexts = self.broadcast.iter_rot(range(1, 1_000_000))
+        self.assertEqual(next(ciphertexts), self._single(type="rot", shift=1).encrypt())
+
+    def test_invalid_keyword(self):
+        with self.assertRaises(InvalidKeywordError):
+            self.broadcast.vigenere_matrix(["KEY", "K3Y"])
+        with self.assertRaises(InvalidKeywordError):
+            self.broadcast.vigenere_matrix(["AAAA"])
+
+
+if __name__ == "__main__":
+    unittest.main()
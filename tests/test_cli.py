@@ -0,0 +1,104 @@
+import io
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from cli.main import main, parse_size
+from cli.pipeline import run_pipeline
+from engines.kernels import ShiftKernel
+from engines.streams import open_stream
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class TestPipeline(unittest.TestCase):
+
+    def setUp(self):
+        self.kernel = ShiftKernel(alphabet=tuple(ALPHABET), shifts=(11, 4, 12, 14, 13))
+        self.text = "ÅTTACK AT DAWN, ÄND HOLD THE LINE! " * 200
+
+    def _run(self, text, decrypt=False, **kwargs):
+        sink = io.BytesIO()
+        stream = open_stream(self.kernel, decrypt)
+        stats = run_pipeline(io.BytesIO(text.encode("utf-8")), sink, stream.prepare, stream.transform, **kwargs)
+        return sink.getvalue().decode("utf-8"), stats
+
+    def test_chunking_matches_single_pass(self):
+        expected = self.kernel.transform(self.text)
+        for chunk_size, workers in [(7, 1), (7, 3), (1 << 20, 2)]:
+            result, stats = self._run(self.text, chunk_size=chunk_size, workers=workers)
+            self.assertEqual(result, expected)
+            self.assertEqual(stats.bytes_in, len(self.text.encode("utf-8")))
+
+    def test_round_trip(self):
+        encrypted, _ = self._run(self.text, chunk_size=13, workers=2)
+        decrypted, _ = self._run(encrypted, decrypt=True, chunk_size=5)
+        self.assertEqual(decrypted, self.text)
+
+    def test_unknown_encoding_is_raised(self):
+        with self.assertRaises(LookupError):
+            run_pipeline(io.BytesIO(b"ABC"), io.BytesIO(), len, lambda text, context: text, encoding="no-such-codec")
+
+    def test_worker_error_is_raised(self):
+        def fail(chunk, context):
+            raise RuntimeError("boom")
+
+        with self.assertRaises(RuntimeError):
+            run_pipeline(io.BytesIO(b"A" * 100), io.BytesIO(), len, fail, chunk_size=10, workers=2)
+
+
+class TestMain(unittest.TestCase):
+
+    def test_files_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plain, cipher, back = (os.path.join(tmp, name) for name in ("plain", "cipher", "back"))
+            with open(plain, "w", encoding="utf-8") as f:
+                f.write("HELLO, WORLD")
+
+            common = ["-t", "vigenere", "-a", ALPHABET, "-k", "KEY", "-q", "--chunk-size", "4"]
+            self.assertEqual(main(common + ["-i", plain, "-o", cipher]), 0)
+            self.assertEqual(main(common + ["-d", "-i", cipher, "-o", back]), 0)
+
+            with open(cipher, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "RIJVS, UYVJN")
+            with open(back, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "HELLO, WORLD")
+
+    def test_invalid_spec_exits(self):
+        with self.assertRaises(SystemExit):
+            main(["-t", "rot", "-a", ALPHABET, "-q"])
+
+    def test_file_errors_exit(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            plain = os.path.join(tmp, "plain")
+            with open(plain, "w", encoding="utf-8") as f:
+                f.write("HELLO")
+            output = os.path.join(tmp, "out")
+            common = ["-t", "rot", "-a", ALPHABET, "-s", "3", "-q"]
+            cases = {
+                "missing input": common + ["-i", os.path.join(tmp, "missing"), "-o", output],
+                "missing key file": ["-t", "vigenere", "-a", ALPHABET, "-m", "running", "-q",
+                                     "--key-file", os.path.join(tmp, "missing"), "-i", plain, "-o", output],
+                "unwritable output": common + ["-i", plain, "-o", os.path.join(tmp, "no-such-dir", "out")],
+                "unknown encoding": common + ["-i", plain, "-o", output, "--encoding", "no-such-codec"],
+                "unknown key file encoding": ["-t", "vigenere", "-a", ALPHABET, "-m", "running", "-q",
+                                              "--key-file", plain, "--encoding", "no-such-codec",
+                                              "-i", plain, "-o", output],
+            }
+            for name, argv in cases.items():
+                with self.subTest(name), mock.patch("sys.stderr", io.StringIO()) as stderr:
+                    with self.assertRaises(SystemExit) as caught:
+                        main(argv)
+                    self.assertNotEqual(caught.exception.code, 0)
+                    self.assertIn("error:", stderr.getvalue())
+                    self.assertNotIn("Traceback", stderr.getvalue())
+            self.assertFalse(os.path.exists(output))
+
+    def test_parse_size(self):
+        self.assertEqual(parse_size("4k"), 4096)
+        self.assertEqual(parse_size("100"), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
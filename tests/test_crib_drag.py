@@ -0,0 +1,59 @@
+import random
+import unittest
+
+from engines.kernels import ShiftKernel, numpy_available
+from specs.spec import CipherSpec
+
+if numpy_available():
+    from attacks.crib_drag import CribDragger
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+CRIB = "ATTACK AT DAWN ON THE EASTERN FRONT"
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class TestCribDrag(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(3)
+        filler = "".join(rng.choice(ALPHABET + " .,") for _ in range(5000))
+        self.offset = 3001
+        self.plain = filler[:self.offset] + CRIB + filler[self.offset:]
+        self.dragger = CribDragger(CRIB, ALPHABET)
+
+    def _encrypt(self, **spec):
+        return CipherSpec(text=self.plain, alphabet=ALPHABET, **spec).to_cipher().encrypt()
+
+    def test_vigenere_keyword(self):
+        hits = self.dragger.search(self._encrypt(type="vigenere", keyword="MIDNIGHT"))
+        self.assertEqual([(hit.offset, hit.period, hit.key) for hit in hits], [(self.offset, 7, "MIDNGHT")])
+        self.assertIsNone(hits[0].shift)
+
+    def test_rot_shift(self):
+        hits = self.dragger.search(self._encrypt(type="rot", shift=5))
+        self.assertEqual([(hit.offset, hit.shift) for hit in hits], [(self.offset, 5)])
+
+    def test_chunked_search_matches(self):
+        ciphertext = self._encrypt(type="vigenere", keyword="LEMON")
+        expected = self.dragger.search(ciphertext)
+        for block in (7, 64, 1000):
+            self.assertEqual(self.dragger.search(ciphertext, block=block), expected)
+            self.assertEqual(self.dragger.search(ciphertext.encode("ascii"), block=block), expected)
+
+    def test_implied_keys(self):
+        ciphertext = "LXFOPV EF RNHR"
+        dragger = CribDragger("ATTACK", ALPHABET)
+        keys = dragger.implied_keys(ciphertext)
+        self.assertEqual(keys.shape, (7, 6))
+        self.assertEqual("".join(ALPHABET[i] for i in keys[0]), "LEMONL")
+
+    def test_distinct_keys_only(self):
+        # "ABA" repeats a character, so it is never a reduced keyword.
+        ciphertext = ShiftKernel(alphabet=tuple(ALPHABET), shifts=(0, 1, 0)).transform(self.plain)
+        self.assertEqual(self.dragger.search(ciphertext), [])
+        hits = CribDragger(CRIB, ALPHABET, distinct=False).search(ciphertext)
+        self.assertEqual([(hit.offset, hit.key) for hit in hits], [(self.offset, "ABA")])
+
+
+if __name__ == "__main__":
+    unittest.main()
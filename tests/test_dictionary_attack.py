@@ -0,0 +1,138 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from engines.kernels import numpy_available
+from specs.spec import CipherSpec
+from structures.sequences import KeywordSequence
+from utils.error import InvalidCheckpointError, InvalidInputTypeError
+
+if numpy_available():
+    from analysis.ngrams import NgramScorer
+    from attacks.dictionary_attack import DictionaryAttack, file_shards, read_shard, reduce_keyword
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+SAMPLE = (
+    "It was the best of times, it was the worst of times, it was the age of wisdom, it was the age of "
+    "foolishness, it was the epoch of belief, it was the epoch of incredulity, it was the season of Light, "
+    "it was the season of Darkness, it was the spring of hope, it was the winter of despair, we had "
+    "everything before us, we had nothing before us, we were all going direct to Heaven, we were all "
+    "going direct the other way"
+).upper()
+
+PLAIN = (
+    "THERE WERE A KING WITH A LARGE JAW AND A QUEEN WITH A PLAIN FACE ON THE THRONE OF ENGLAND; "
+    "THERE WERE A KING WITH A LARGE JAW AND A QUEEN WITH A FAIR FACE ON THE THRONE OF FRANCE."
+)
+
+
+class StopRun(Exception):
+    pass
+
+
+def lower(word):
+    return word.lower()
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class TestDictionaryAttack(unittest.TestCase):
+
+    def setUp(self):
+        self.ciphertext = CipherSpec(type="vigenere", text=PLAIN, alphabet=ALPHABET, keyword="MIDNIGHT").to_cipher().encrypt()
+        self.scorer = NgramScorer.from_text(SAMPLE, ALPHABET)
+        rng = random.Random(7)
+        self.words = ["".join(rng.choice(ALPHABET.lower()) for _ in range(rng.randint(3, 10))) for _ in range(3000)]
+        self.words[1234] = "midnight"
+        self.attack = DictionaryAttack(self.ciphertext, ALPHABET, self.scorer, normalize=str.upper)
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.wordlist = os.path.join(self.tmp.name, "words.txt")
+        with open(self.wordlist, "w", encoding="utf-8") as f:
+            f.write("\n".join(self.words) + "\n")
+
+    def test_finds_keyword(self):
+        result = self.attack.run(self.words, workers=1, shard_size=500)
+        self.assertEqual(result.best.keyword, "MIDNIGHT")
+        self.assertEqual(result.tested, len(self.words))
+        self.assertGreater(result.rejected, 0.9 * len(self.words))
+
+    def test_keyword_sequence_semantics(self):
+        for word in ["MIDNIGHT", "LEMONLEMON", "AAB"]:
+            self.assertEqual(list(reduce_keyword(word)), KeywordSequence(word).value)
+        result = self.attack.score_words(["aaaa", "x", "no spaces"])
+        self.assertEqual((result.tested, result.invalid), (3, 3))
+
+        # Words reducing to the same key are one candidate.
+        result = self.attack.score_words(["midnight", "midnightmidnight"])
+        self.assertEqual([c.key for c in result.candidates], ["MIDNGHT"])
+
+    def test_file_shards_cover_every_line_once(self):
+        for shard_size in (1, 7, 64, 1 << 20):
+            lines = [line for start, end in file_shards(self.wordlist, shard_size)
+                     for line in read_shard(self.wordlist, start, end)]
+            self.assertEqual(lines, self.words)
+
+    def test_process_pool(self):
+        result = self.attack.run(self.wordlist, workers=2, shard_size=4096)
+        self.assertEqual(result.best.keyword, "MIDNIGHT")
+        self.assertEqual(result.tested, len(self.words))
+
+    def _interrupted(self, candidates, checkpoint, shard_size, after=2):
+        """Run the attack, stopping it once `after` shards have finished."""
+        run_task = DictionaryAttack._run_task
+        calls = []
+
+        def interrupt(attack, task):
+            if len(calls) == after:
+                raise StopRun()
+            calls.append(task)
+            return run_task(attack, task)
+
+        with mock.patch.object(DictionaryAttack, "_run_task", interrupt):
+            with self.assertRaises(StopRun):
+                self.attack.run(candidates, workers=1, checkpoint=checkpoint, shard_size=shard_size)
+
+    def test_resume(self):
+        checkpoint = os.path.join(self.tmp.name, "attack.json")
+        self._interrupted(self.wordlist, checkpoint, 2048)
+
+        result = self.attack.run(self.wordlist, workers=1, checkpoint=checkpoint, shard_size=2048)
+        self.assertEqual(result.tested, len(self.words))
+        self.assertEqual(result.shards, len(file_shards(self.wordlist, 2048)))
+        self.assertEqual(result.best.keyword, "MIDNIGHT")
+
+        other_scorer = NgramScorer.from_text(PLAIN, ALPHABET)
+        changed = [
+            (self.attack, 1024),
+            (DictionaryAttack(self.ciphertext, ALPHABET, self.scorer, normalize=lower), 2048),
+            (DictionaryAttack(self.ciphertext, ALPHABET, other_scorer, normalize=str.upper,
+                              threshold=self.attack.threshold), 2048),
+        ]
+        for attack, shard_size in changed:
+            with self.assertRaises(InvalidCheckpointError):
+                attack.run(self.wordlist, workers=1, checkpoint=checkpoint, shard_size=shard_size)
+
+        with self.assertRaises(InvalidInputTypeError):
+            DictionaryAttack(self.ciphertext, ALPHABET, self.scorer, normalize=lambda w: w.upper()).run(
+                self.wordlist, workers=1, checkpoint=checkpoint, shard_size=2048)
+
+    def test_resume_iterable(self):
+        checkpoint = os.path.join(self.tmp.name, "attack.json")
+        self._interrupted(self.words, checkpoint, 500)
+
+        shuffled = list(self.words)
+        shuffled[100], shuffled[2000] = shuffled[2000], shuffled[100]
+        with self.assertRaises(InvalidCheckpointError):
+            self.attack.run(shuffled, workers=1, checkpoint=checkpoint, shard_size=500)
+
+        result = self.attack.run(self.words, workers=1, checkpoint=checkpoint, shard_size=500)
+        self.assertEqual(result.tested, len(self.words))
+        self.assertEqual(result.best.keyword, "MIDNIGHT")
+
+
+if __name__ == "__main__":
+    unittest.main()
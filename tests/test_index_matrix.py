@@ -0,0 +1,68 @@
+import random
+import unittest
+from collections import Counter
+
+from engines.kernels import numpy_available
+from structures.rotation_matrix import RotationMatrix
+from transforms.list_ops import rotate
+from transforms.matrix_ops import MatrixTransform
+
+if numpy_available():
+    from structures.index_matrix import IndexMatrix
+    from transforms.array_matrix_ops import ArrayMatrixTransform
+
+BASE = list("ABCDEFG")
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class TestIndexMatrix(unittest.TestCase):
+
+    def setUp(self):
+        self.rm = RotationMatrix(base_sequence=BASE, matrix=[rotate(BASE, -i) for i in range(len(BASE))])
+        self.im = self.rm.to_index_matrix()
+
+    def test_round_trip(self):
+        self.assertEqual(self.im, IndexMatrix.rotations(BASE))
+        self.assertEqual(self.im.as_int_matrix(), self.rm.as_int_matrix())
+        self.assertEqual(self.im.to_rotation_matrix().matrix, self.rm.matrix)
+
+        odd = RotationMatrix(base_sequence=BASE, matrix=[["A", "x"], ["ab", "G"]])
+        converted = IndexMatrix.from_rotation_matrix(odd)
+        self.assertEqual(converted.as_int_matrix(), odd.as_int_matrix())
+        self.assertEqual(converted.to_rotation_matrix().matrix, [["A", "?"], ["?", "G"]])
+
+    def test_bulk_lookup(self):
+        rng = random.Random(1)
+        pairs = [(rng.randint(-20, 20), rng.randint(-20, 20)) for _ in range(200)]
+        expected = [self.rm.lookup(row, col) for row, col in pairs]
+        self.assertEqual(self.im.lookup_chars(pairs), expected)
+        rows, cols = zip(*pairs)
+        self.assertEqual(self.im.lookup(rows, cols).tolist(), [BASE.index(c) for c in expected])
+
+    def test_transforms_match_list_form(self):
+        for name in ("rotate_rows", "rotate_row_order", "rotate_column_order"):
+            for shift in (-3, 0, 1, 5):
+                expected = getattr(MatrixTransform, name)(self.rm, shift).matrix
+                result = getattr(ArrayMatrixTransform, name)(self.im, shift).to_rotation_matrix().matrix
+                self.assertEqual(result, expected, (name, shift))
+        for name in ("mirror_rows", "transpose"):
+            expected = getattr(MatrixTransform, name)(self.rm).matrix
+            self.assertEqual(getattr(ArrayMatrixTransform, name)(self.im).to_rotation_matrix().matrix, expected)
+
+    def test_analytics(self):
+        self.assertTrue(self.im.is_latin_square())
+        broken = RotationMatrix(base_sequence=BASE, matrix=[list(BASE)] * len(BASE)).to_index_matrix()
+        self.assertFalse(broken.is_latin_square())
+
+        counts = broken.column_counts()
+        for col in range(len(BASE)):
+            column = Counter(RotationMatrix(BASE, [list(BASE)] * len(BASE)).get_column_vector(col))
+            self.assertEqual(counts[:, col].tolist(), [column[char] for char in BASE])
+
+    def test_wide_alphabet_dtype(self):
+        self.assertEqual(IndexMatrix.dtype_for(26), IndexMatrix.rotations(BASE).indices.dtype)
+        self.assertEqual(IndexMatrix.dtype_for(70000).__name__, "uint32")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from ciphers.keyed_cipher import KeyedCipher
+from engines.key_streams import iterable_source
+from engines.kernels import ENGINES, NUMPY_ENGINES, numpy_available
+from specs.spec import CipherSpec
+from specs.types import CipherType, VigenereMode
+from utils.error import InvalidInputTypeError
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def sample_texts(count, size, seed=0):
+    rng = random.Random(seed)
+    return ["".join(rng.choice(ALPHABET + " ,.") for _ in range(rng.randint(1, size))) for _ in range(count)]
+
+
+SPECS = {
+    "rot": dict(type=CipherType.ROT, shift=7),
+    "substitution": dict(type=CipherType.SUBSTITUTION, keyword="KRYPTOS"),
+    "vigenere": dict(type=CipherType.VIGENERE, keyword="LEMON"),
+    "autokey": dict(type=CipherType.VIGENERE, keyword="QUEEN", mode=VigenereMode.AUTOKEY),
+}
+
+
+class TestKeyedCipher(unittest.TestCase):
+
+    def engines(self):
+        return [e for e in ENGINES if e not in NUMPY_ENGINES or numpy_available()]
+
+    def test_matches_cipher_across_threads(self):
+        texts = sample_texts(40, 300)
+        big = "".join(texts)
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            for name, fields in SPECS.items():
+                for engine in self.engines():
+                    with self.subTest(cipher=name, engine=engine):
+                        spec = CipherSpec(text="", alphabet=ALPHABET, engine=engine, **fields)
+                        cipher = KeyedCipher.from_spec(spec)
+                        expected = [CipherSpec(text=t, alphabet=ALPHABET, **fields).to_cipher().encrypt() for t in texts]
+                        self.assertEqual(cipher.map(texts, executor=pool), expected)
+                        plain = [CipherSpec(text=t, alphabet=ALPHABET, **fields).to_cipher().decrypt() for t in expected]
+                        self.assertEqual(cipher.map(expected, decrypt=True, workers=3), plain)
+
+                        ciphertext = cipher.encrypt(big, executor=pool, chunk_size=97)
+                        self.assertEqual(ciphertext, cipher.encrypt(big))
+                        self.assertEqual(cipher.decrypt(ciphertext, executor=pool, chunk_size=97), cipher.decrypt(ciphertext))
+
+    def test_shared_instance_from_many_threads(self):
+        cipher = KeyedCipher.from_spec(CipherSpec(type=CipherType.VIGENERE, text="", alphabet=ALPHABET, keyword="LEMON"))
+        texts = sample_texts(200, 500, seed=1)
+        expected = [cipher.encrypt(t) for t in texts]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(3):
+                self.assertEqual(list(pool.map(cipher.encrypt, texts)), expected)
+
+    def test_running_key_replays_source(self):
+        key = "".join(sample_texts(1, 1, seed=2)) + ALPHABET * 200
+        spec = CipherSpec(type=CipherType.VIGENERE, text="", alphabet=ALPHABET,
+                          mode=VigenereMode.RUNNING_KEY, key_source=iterable_source([key[:1000], key[1000:]]))
+        cipher = KeyedCipher.from_spec(spec)
+        texts = sample_texts(20, 400, seed=3)
+        ciphertexts = cipher.map(texts, workers=4)
+        self.assertEqual(ciphertexts, [cipher.encrypt(t) for t in texts])
+        self.assertEqual(cipher.map(ciphertexts, decrypt=True, workers=4), texts)
+
+    def test_bytes_and_buffers(self):
+        cipher = KeyedCipher.from_spec(CipherSpec(type=CipherType.ROT, text="", alphabet=ALPHABET, shift=13))
+        self.assertEqual(cipher.encrypt(b"HELLO, WORLD"), b"URYYB??JBEYQ")
+        self.assertEqual(cipher.decrypt(list("URYYB")), list("HELLO"))
+
+        out = bytearray(16)
+        self.assertEqual(cipher.encrypt_into(b"HELLO", out), 5)
+        self.assertEqual(bytes(out[:5]), b"URYYB")
+        self.assertEqual(cipher.decrypt_into(bytes(out[:5]), out), 5)
+        self.assertEqual(bytes(out[:5]), b"HELLO")
+        with self.assertRaises(InvalidInputTypeError):
+            cipher.encrypt_into("HELLO", out)
+
+    def test_frozen(self):
+        cipher = KeyedCipher.from_spec(CipherSpec(type=CipherType.ROT, text="", alphabet=ALPHABET, shift=3))
+        self.assertEqual(cipher.alphabet, tuple(ALPHABET))
+        self.assertIn(cipher.engine, ENGINES)
+        with self.assertRaises(AttributeError):
+            cipher.kernel = None
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from engines.kernels import numpy_available
+from specs.spec import CipherSpec
+from utils.error import InvalidInputTypeError
+
+if numpy_available():
+    from storage.packed import PackedReader, PackedWriter, bits_for, pack, unpack
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class TestPackedStorage(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        plain = "".join(rng.choice(ALPHABET) if rng.random() > 0.15 else rng.choice(" .,\né") for _ in range(5000))
+        self.text = CipherSpec(type="vigenere", text=plain, alphabet=ALPHABET, keyword="LEMON").to_cipher().encrypt()
+
+    def test_round_trip(self):
+        for block_size in (1, 7, 64, 4096, 1 << 17):
+            self.assertEqual(unpack(pack(self.text, ALPHABET, block_size)), self.text)
+        self.assertEqual(unpack(pack("", ALPHABET)), "")
+        self.assertEqual(unpack(pack(" ,.", ALPHABET, 2)), " ,.")
+
+    def test_unicode_and_bytes(self):
+        text = "ÅÄÖ€ " + self.text[:300] + "\U0001F512"
+        alphabet = ALPHABET + "ÅÄÖ"
+        self.assertEqual(unpack(pack(text, alphabet, 16)), text)
+
+        data = self.text.encode("utf-8")
+        self.assertEqual(unpack(pack(data, ALPHABET, 100)), data)
+
+    def test_bits_and_size(self):
+        self.assertEqual([bits_for(n) for n in (1, 2, 26, 32, 33, 64)], [1, 1, 5, 5, 6, 6])
+        letters = "".join(c for c in self.text if c in ALPHABET)
+        self.assertLess(len(pack(letters, ALPHABET)), len(letters) * 5 // 8 + 200)
+        self.assertLess(len(pack(self.text, ALPHABET)), len(self.text.encode("utf-8")))
+
+    def test_streaming_write_and_read(self):
+        buffer = io.BytesIO()
+        with PackedWriter(buffer, ALPHABET, block_size=128) as writer:
+            for start in range(0, len(self.text), 333):
+                writer.write(self.text[start:start + 333])
+
+        reader = PackedReader(io.BytesIO(buffer.getvalue()))
+        self.assertEqual(reader.length, len(self.text))
+        self.assertEqual(reader.blocks, -(-len(self.text) // 128))
+        self.assertEqual("".join(reader.iter_blocks()), self.text)
+
+        sequential = PackedReader(io.BytesIO(buffer.getvalue()), seekable=False)
+        self.assertEqual("".join(sequential.iter_blocks()), self.text)
+        with self.assertRaises(InvalidInputTypeError):
+            sequential.read_block(0)
+
+    def test_random_access(self):
+        reader = PackedReader(io.BytesIO(pack(self.text, ALPHABET, 100)))
+        self.assertEqual(reader.read_block(3), self.text[300:400])
+        self.assertEqual(reader.read_block(-1), self.text[(len(self.text) - 1) // 100 * 100:])
+        for start, stop in [(0, 1), (99, 101), (250, 1234), (4990, None), (10, 10), (-50, None)]:
+            self.assertEqual(reader.read(start, stop), self.text[start:stop])
+
+    def test_file_paths(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "archive.ctpk")
+            with PackedWriter(path, ALPHABET, block_size=512) as writer:
+                writer.write(self.text)
+            with PackedReader(path) as reader:
+                self.assertEqual(reader.alphabet, tuple(ALPHABET))
+                self.assertEqual(reader.read(1000, 2000), self.text[1000:2000])
+
+    def test_errors(self):
+        writer = PackedWriter(io.BytesIO(), ALPHABET)
+        writer.write("ABC")
+        with self.assertRaises(InvalidInputTypeError):
+            writer.write(b"ABC")
+        with self.assertRaises(InvalidInputTypeError):
+            PackedWriter(io.BytesIO(), ["AB", "C"])
+        with self.assertRaises(InvalidInputTypeError):
+            PackedReader(io.BytesIO(b"not a packed file at all"))
+
+
+if __name__ == "__main__":
+    unittest.main()
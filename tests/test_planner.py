@@ -0,0 +1,118 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from engines import planner
+from engines.kernels import ShiftKernel, KeyedKernel, numpy_available
+from engines.key_streams import iterable_source
+from engines.planner import KEYED, PERIODIC, ROT, calibrate, load_calibration, plan_execution
+from specs.spec import CipherSpec
+from specs.types import CipherType, VigenereMode
+from utils.cache import CACHE_ENV
+from utils.error import InvalidEngineError
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class PlannerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self._cache = tempfile.TemporaryDirectory()
+        patcher = mock.patch.dict(os.environ, {CACHE_ENV: self._cache.name})
+        patcher.start()
+        os.environ.pop(planner.ENGINE_ENV, None)
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self._cache.cleanup)
+        self.addCleanup(planner.reset_calibration)
+        planner.reset_calibration()
+
+
+class TestPlanExecution(PlannerTestCase):
+
+    def test_small_text_uses_translate(self):
+        for kind in (ROT, PERIODIC, KEYED):
+            plan = plan_execution(kind, text_size=100, alphabet_size=26)
+            self.assertEqual(plan.engine, "translate")
+            self.assertEqual(plan.source, "heuristic")
+
+    def test_rot_uses_translate(self):
+        self.assertEqual(plan_execution(ROT, text_size=1 << 24, alphabet_size=26).engine, "translate")
+
+    @unittest.skipUnless(numpy_available(), "NumPy is not installed")
+    def test_large_text_uses_numpy(self):
+        self.assertEqual(plan_execution(PERIODIC, text_size=1 << 16, alphabet_size=26).engine, "numpy")
+        plan = plan_execution(KEYED, text_size=1 << 24, alphabet_size=26, allow_parallel=False)
+        self.assertEqual(plan.engine, "numpy")
+
+    def test_forced_engine(self):
+        plan = plan_execution(PERIODIC, text_size=1 << 20, alphabet_size=26, engine="dict")
+        self.assertEqual((plan.engine, plan.source), ("dict", "forced"))
+
+        with mock.patch.dict(os.environ, {planner.ENGINE_ENV: "dict"}):
+            plan = plan_execution(ROT, text_size=10, alphabet_size=26)
+        self.assertEqual(plan.engine, "dict")
+        self.assertIn(planner.ENGINE_ENV, plan.source)
+
+    def test_unknown_engine(self):
+        with self.assertRaises(InvalidEngineError):
+            plan_execution(ROT, text_size=10, alphabet_size=26, engine="gpu")
+
+    def test_calibration_is_cached(self):
+        data = calibrate(sizes=(256,), repeat=1)
+        self.assertEqual(set(data["results"]), {ROT, PERIODIC, KEYED})
+
+        planner._calibration_loaded = False  # force a reload from disk
+        self.assertEqual(load_calibration(), data)
+        plan = plan_execution(PERIODIC, text_size=256, alphabet_size=26)
+        self.assertEqual(plan.source, "calibrated")
+        self.assertIn(plan.engine, data["results"][PERIODIC]["256"])
+
+        planner.reset_calibration()
+        self.assertIsNone(load_calibration())
+
+
+class TestSpecPlan(PlannerTestCase):
+
+    def test_explain(self):
+        spec = CipherSpec(type=CipherType.ROT, text="HELLO", alphabet=ALPHABET, shift=3)
+        self.assertIn("engine: translate", spec.explain())
+        self.assertIn("kind=rot, text=str[5]", spec.explain())
+
+        spec = CipherSpec(type="vigenere", text=b"HELLO", alphabet=ALPHABET, keyword="KEY", mode=VigenereMode.AUTOKEY)
+        self.assertIn("kind=keyed, text=bytes[5]", spec.explain())
+
+    def test_spec_engine_is_used(self):
+        spec = CipherSpec(type=CipherType.VIGENERE, text="HELLO", alphabet=ALPHABET, keyword="KEY", engine="dict")
+        cipher = spec.to_cipher()
+        self.assertEqual(cipher.engine, "dict")
+        self.assertEqual(cipher.encrypt(), "RIJVS")
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class TestEnginesAgree(unittest.TestCase):
+
+    def test_shift_engines(self):
+        text = "ATTACK AT DAWN, ÄND HOLD THE LINE! " * 50
+        for shifts, fill in [((3,), "?"), ((3,), None), ((11, 4, 12, 14, 13), None)]:
+            expected = ShiftKernel(tuple(ALPHABET), shifts, fill=fill, engine="dict").transform(text, 2)
+            for engine in ("translate", "numpy", "parallel"):
+                kernel = ShiftKernel(tuple(ALPHABET), shifts, fill=fill, engine=engine)
+                self.assertEqual(kernel.transform(text, 2), expected, engine)
+                if fill is None:
+                    self.assertEqual(kernel.transform(expected, 2, decrypt=True), text, engine)
+
+    def test_keyed_engines(self):
+        text = "ATTACK AT DAWN, ÄND HOLD THE LINE! " * 50
+        key = "LEMON" * len(text)
+        reference = KeyedKernel(tuple(ALPHABET), key_source=iterable_source(key), engine="dict")
+        key = key[:reference.advance(text)]
+        expected = reference.transform_with_key(text, key)
+        for engine in ("translate", "numpy", "parallel"):
+            kernel = KeyedKernel(tuple(ALPHABET), key_source=iterable_source(key), engine=engine)
+            self.assertEqual(kernel.transform_with_key(text, key), expected, engine)
+            self.assertEqual(kernel.transform_with_key(expected, key, decrypt=True), text, engine)
+
+
+if __name__ == "__main__":
+    unittest.main()
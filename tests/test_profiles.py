@@ -0,0 +1,114 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from engines.kernels import numpy_available
+from specs.spec import CipherSpec
+from utils.cache import CACHE_ENV
+from utils.error import DuplicateCharacterError, InvalidInputTypeError
+
+if numpy_available():
+    import numpy as np
+
+    from analysis.ngrams import NgramScorer
+    from analysis.profiles import LanguageProfile
+    from attacks.dictionary_attack import DictionaryAttack
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+SAMPLE = (
+    "It was the best of times, it was the worst of times, it was the age of wisdom, it was the age of "
+    "foolishness, it was the epoch of belief, it was the epoch of incredulity, it was the season of Light, "
+    "it was the season of Darkness, it was the spring of hope, it was the winter of despair."
+)
+
+
+@unittest.skipUnless(numpy_available(), "NumPy is not installed")
+class TestLanguageProfile(unittest.TestCase):
+
+    def setUp(self):
+        self._cache = tempfile.TemporaryDirectory()
+        self.addCleanup(self._cache.cleanup)
+        patcher = mock.patch.dict(os.environ, {CACHE_ENV: self._cache.name})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.corpus = os.path.join(self._cache.name, "corpus.txt")
+        with open(self.corpus, "w", encoding="utf-8") as f:
+            f.write(SAMPLE * 20)
+
+    def test_chunked_counts_match_ngram_scorer(self):
+        text = SAMPLE.upper()
+        for step in (1, 5, 64, len(text)):
+            profile = LanguageProfile.compile((text[i:i + step] for i in range(0, len(text), step)), ALPHABET)
+            for order in (1, 2, 4):
+                expected = NgramScorer.from_text(text, ALPHABET, order=order)
+                self.assertTrue(np.allclose(profile.table(order).log_probs, expected.log_probs, atol=1e-5))
+                self.assertAlmostEqual(profile.table(order).expected, expected.expected, places=9)
+                self.assertAlmostEqual(profile.table(order).uniform, expected.uniform, places=5)
+
+    def test_vectorized_scores(self):
+        profile = LanguageProfile.compile(SAMPLE, ALPHABET, normalize=str.upper)
+        matrix = np.stack([profile.indices("THESEASONOFHOPE"), profile.indices("QZXJQZXJQZXJQZX")])
+        scores = profile.score_batch(matrix)
+        self.assertGreater(scores[0], scores[1])
+        self.assertAlmostEqual(profile.score(matrix[0]), float(scores[0]), places=5)
+        self.assertEqual(profile.score_batch(matrix, order=1).shape, (2,))
+        with self.assertRaises(InvalidInputTypeError):
+            profile.table(3)
+
+    def test_cached_file_profile(self):
+        compiled = LanguageProfile.from_file(self.corpus, ALPHABET, normalize=str.upper)
+        with mock.patch.object(LanguageProfile, "compile", side_effect=AssertionError("not cached")):
+            cached = LanguageProfile.from_file(self.corpus, ALPHABET, normalize=str.upper)
+        self.assertIsInstance(cached.table(4).log_probs, np.memmap)
+        for order in compiled.orders:
+            self.assertTrue(np.array_equal(cached.table(order).log_probs, compiled.table(order).log_probs))
+        self.assertEqual(cached.expected, compiled.expected)
+
+        # Different settings or an edited corpus compile a fresh profile.
+        with mock.patch.object(LanguageProfile, "compile", wraps=LanguageProfile.compile) as compile_:
+            LanguageProfile.from_file(self.corpus, ALPHABET, orders=(1, 2), normalize=str.upper)
+            with open(self.corpus, "a", encoding="utf-8") as f:
+                f.write(" more text")
+            LanguageProfile.from_file(self.corpus, ALPHABET, normalize=str.upper)
+        self.assertEqual(compile_.call_count, 2)
+
+    def test_anonymous_normalizers_do_not_share_cache(self):
+        upper = LanguageProfile.from_file(self.corpus, ALPHABET, normalize=lambda s: s.upper())
+        with mock.patch.object(LanguageProfile, "compile", wraps=LanguageProfile.compile) as compile_:
+            again = LanguageProfile.from_file(self.corpus, ALPHABET, normalize=lambda s: s.upper())
+            with self.assertRaises(InvalidInputTypeError):
+                # Lowercase text has no alphabet characters to count.
+                LanguageProfile.from_file(self.corpus, ALPHABET, normalize=lambda s: s.lower())
+        self.assertEqual(compile_.call_count, 2)
+        self.assertTrue(np.array_equal(again.table(2).log_probs, upper.table(2).log_probs))
+
+        # An explicit tag names the normalizer, so the profile is cached under it.
+        LanguageProfile.from_file(self.corpus, ALPHABET, normalize=lambda s: s.upper(), cache_tag="upper")
+        with mock.patch.object(LanguageProfile, "compile", side_effect=AssertionError("not cached")):
+            LanguageProfile.from_file(self.corpus, ALPHABET, normalize=lambda s: s.upper(), cache_tag="upper")
+
+    def test_invalid_input(self):
+        with self.assertRaises(DuplicateCharacterError):
+            LanguageProfile.compile(SAMPLE, "ABCA")
+        with self.assertRaises(InvalidInputTypeError):
+            LanguageProfile.compile("AB", ALPHABET, orders=(4,))
+        with self.assertRaises(InvalidInputTypeError):
+            LanguageProfile.compile(SAMPLE, ALPHABET, orders=(0, 2))
+
+    def test_dictionary_attack_accepts_profile(self):
+        plain = "THE SEASON OF HOPE AND THE WINTER OF DESPAIR WERE THE BEST AND THE WORST OF TIMES " * 3
+        ciphertext = CipherSpec(type="vigenere", text=plain, alphabet=ALPHABET, keyword="LIGHT").to_cipher().encrypt()
+        profile = LanguageProfile.from_file(self.corpus, ALPHABET, normalize=str.upper)
+
+        rng = random.Random(3)
+        words = ["".join(rng.choice(ALPHABET) for _ in range(rng.randint(3, 8))) for _ in range(500)] + ["LIGHT"]
+        result = DictionaryAttack(ciphertext, ALPHABET, profile).run(words, workers=1)
+        self.assertEqual(result.best.keyword, "LIGHT")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from specs import registry
+from specs.spec import CipherSpec
+from specs.types import CipherType
+from utils.error import InvalidCipherTypeError
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+# Cumulative import time budget (microseconds) for a cold import of each module.
+IMPORT_BUDGET_US = 150_000
+CLI_IMPORT_BUDGET_US = 250_000
+
+
+def _cold_import(statement: str) -> subprocess.CompletedProcess:
+    env = dict(os.environ, PYTHONPATH=SRC_DIR)
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env, capture_output=True, text=True, check=True,
+    )
+
+
+class TestLazyRegistry(unittest.TestCase):
+
+    def test_import_does_not_load_ciphers(self):
+        result = _cold_import(
+            "import sys, specs.spec; "
+            "print(sorted(m for m in sys.modules if m.startswith('ciphers.') and m != 'ciphers.base_cipher'))"
+        )
+        self.assertEqual(result.stdout.strip(), "[]")
+
+    def _cumulative_import_us(self, module: str) -> int:
+        result = _cold_import(f"import {module}")
+        line = next(l for l in result.stderr.splitlines() if l.rstrip().endswith(f"| {module}"))
+        return int(line.split("|")[1])
+
+    def test_import_time_budget(self):
+        self.assertLess(self._cumulative_import_us("specs.spec"), IMPORT_BUDGET_US)
+
+    def test_cli_import_time_budget(self):
+        self.assertLess(self._cumulative_import_us("cli.main"), CLI_IMPORT_BUDGET_US)
+
+    def test_build_cipher_resolves_lazily(self):
+        spec = CipherSpec(type=CipherType.ROT, text="HELLO", alphabet="ABCDEFGHIJKLMNOPQRSTUVWXYZ", shift=3)
+        self.assertEqual(spec.to_cipher().encrypt(), "KHOOR")
+
+    def test_string_type_is_accepted(self):
+        spec = CipherSpec(type="vigenere", text="HELLO", alphabet="ABCDEFGHIJKLMNOPQRSTUVWXYZ", keyword="KEY")
+        self.assertEqual(spec.to_cipher().encrypt(), "RIJVS")
+
+    def test_unknown_type_raises(self):
+        spec = CipherSpec(type="no-such-cipher", text="HELLO", alphabet="ABC")
+        with self.assertRaises(InvalidCipherTypeError):
+            spec.to_cipher()
+
+    def test_lazy_target_with_attribute(self):
+        registry.register_lazy_cipher("rot-alias", "specs.constructors:rot_constructor")
+        try:
+            spec = CipherSpec(type="rot-alias", text="ABC", alphabet="ABC", shift=1)
+            self.assertEqual(spec.to_cipher().encrypt(), "BCA")
+            self.assertIn("rot-alias", registry.registered_cipher_types())
+        finally:
+            registry._lazy_registry.pop("rot-alias", None)
+            registry._registry.pop("rot-alias", None)
+
+
+if __name__ == '__main__':
+    unittest.main()
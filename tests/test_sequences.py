@@ -0,0 +1,94 @@
+import pickle
+import unittest
+
+from structures.sequences import ALPHABET_REGISTRY_SIZE, AlphabetSequence, clear_alphabet_registry
+from utils.coercion import coerce_to_char_list
+from utils.error import DuplicateCharacterError, EmptySequenceError, InvalidInputTypeError
+
+
+class TestAlphabetRegistry(unittest.TestCase):
+
+    def setUp(self):
+        clear_alphabet_registry()
+        self.addCleanup(clear_alphabet_registry)
+
+    def test_interned(self):
+        alphabet = AlphabetSequence("ABCDE")
+        self.assertIs(AlphabetSequence("ABCDE"), alphabet)
+        self.assertIs(AlphabetSequence(list("ABCDE")), alphabet)
+        self.assertIsNot(AlphabetSequence("ABCDF"), alphabet)
+        self.assertEqual(alphabet.value, list("ABCDE"))
+        self.assertEqual(alphabet.chars, tuple("ABCDE"))
+        self.assertEqual(alphabet.index_map, {char: idx for idx, char in enumerate("ABCDE")})
+
+    def test_input_list_is_not_shared(self):
+        raw = list("ABC")
+        alphabet = AlphabetSequence(raw)
+        raw.append("D")
+        self.assertEqual(alphabet.value, list("ABC"))
+        self.assertEqual(AlphabetSequence(raw).value, list("ABCD"))
+
+    def test_registry_is_bounded(self):
+        first = AlphabetSequence("XY")
+        for i in range(ALPHABET_REGISTRY_SIZE):
+            AlphabetSequence([chr(0x100 + i), chr(0x1000 + i)])
+        again = AlphabetSequence("XY")
+        self.assertIsNot(again, first)
+        self.assertEqual(again, first)
+
+    def test_duplicate_report_names_first_duplicates(self):
+        chars = [chr(c) for c in range(0x100, 0x100 + 5000)]
+        with self.assertRaises(DuplicateCharacterError) as caught:
+            AlphabetSequence(chars + chars[10:20])
+        message = str(caught.exception)
+        self.assertIn("'Ċ' at 10 and 5000", message)
+        self.assertIn("10 repeated characters in total", message)
+        self.assertLess(len(message), 200)
+
+        with self.assertRaises(DuplicateCharacterError):
+            AlphabetSequence("ABA")
+        # A failed validation is not interned.
+        with self.assertRaises(DuplicateCharacterError):
+            AlphabetSequence("ABA")
+
+    def test_invalid_input(self):
+        with self.assertRaises(EmptySequenceError):
+            AlphabetSequence("")
+        with self.assertRaises(InvalidInputTypeError):
+            AlphabetSequence(None)
+        with self.assertRaises(TypeError):
+            AlphabetSequence()
+        with self.assertRaises(InvalidInputTypeError):
+            AlphabetSequence(["A", 1])
+        with self.assertRaises(InvalidInputTypeError):
+            AlphabetSequence([["A"], ["B"]])
+        with self.assertRaises(InvalidInputTypeError) as caught:
+            coerce_to_char_list(["A"] * 10000 + [None])
+        self.assertIn("NoneType", str(caught.exception))
+        self.assertLess(len(str(caught.exception)), 100)
+
+    def test_other_iterables_rejected_whether_or_not_cached(self):
+        for interned in (False, True):
+            if interned:
+                AlphabetSequence(["A", "B"])
+            with self.subTest(interned=interned):
+                with self.assertRaises(InvalidInputTypeError):
+                    AlphabetSequence(("A", "B"))
+                with self.assertRaises(InvalidInputTypeError):
+                    AlphabetSequence(iter("AB"))
+
+    def test_pickle(self):
+        alphabet = AlphabetSequence("ABC")
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            self.assertIs(pickle.loads(pickle.dumps(alphabet, protocol)), alphabet)
+
+        # Unpickled after the registry is cleared: rebuilt and validated, then interned again.
+        data = pickle.dumps(alphabet)
+        clear_alphabet_registry()
+        restored = pickle.loads(data)
+        self.assertEqual(restored.index_map, alphabet.index_map)
+        self.assertIs(AlphabetSequence("ABC"), restored)
+
+
+if __name__ == "__main__":
+    unittest.main()
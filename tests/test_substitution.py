@@ -0,0 +1,51 @@
+import unittest
+
+from engines.kernels import SubstitutionKernel, numpy_available
+from specs.spec import CipherSpec
+from specs.types import CipherType
+from transforms.alphabet_ops import keyed_alphabet
+from utils.error import InvalidKeywordError
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+class TestKeyedAlphabet(unittest.TestCase):
+
+    def test_keyed_alphabet(self):
+        self.assertEqual("".join(keyed_alphabet("LEMONLEMON", ALPHABET)), "LEMONABCDFGHIJKPQRSTUVWXYZ")
+        self.assertEqual(keyed_alphabet("CAB", "ABC"), ["C", "A", "B"])
+
+    def test_keyword_outside_alphabet(self):
+        with self.assertRaises(InvalidKeywordError):
+            keyed_alphabet("K3Y", ALPHABET)
+
+
+class TestSubstitutionCipher(unittest.TestCase):
+
+    def _cipher(self, text, **kwargs):
+        return CipherSpec(type=CipherType.SUBSTITUTION, text=text, alphabet=ALPHABET, keyword="KRYPTOS", **kwargs).to_cipher()
+
+    def test_round_trip(self):
+        text = "ATTACK AT DAWN! Ärligt."
+        encrypted = self._cipher(text).encrypt()
+        self.assertEqual(encrypted, "KNNKYD KN PKVG! Ärligt.")
+        self.assertEqual(self._cipher(encrypted).decrypt(), text)
+        self.assertEqual(self._cipher(text.encode("utf-8")).encrypt(), encrypted.encode("utf-8"))
+
+    def test_engines_agree(self):
+        engines = ["translate", "dict"] + (["numpy", "parallel"] if numpy_available() else [])
+        text = "THE QUICK BROWN FOX JUMPS OVER THE LAZY DOG, ÅÄÖ. " * 100
+        kernels = [SubstitutionKernel(tuple(ALPHABET), tuple(keyed_alphabet("ZEBRAS", ALPHABET)), engine=e) for e in engines]
+        for decrypt in (False, True):
+            results = {kernel.transform(text, decrypt=decrypt) for kernel in kernels}
+            self.assertEqual(len(results), 1)
+
+    def test_permutation_is_required(self):
+        with self.assertRaises(InvalidKeywordError):
+            SubstitutionKernel(tuple("ABC"), tuple("ABB"))
+        with self.assertRaises(InvalidKeywordError):
+            CipherSpec(type="substitution", text="ABC", alphabet=ALPHABET).to_cipher()
+
+
+if __name__ == "__main__":
+    unittest.main()
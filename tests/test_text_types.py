@@ -0,0 +1,78 @@
+import unittest
+from unittest import mock
+
+from ciphers.classic_vigenere_cipher import ClassicVigenereCipher
+from ciphers.rot_cipher import RotCipher
+from specs.spec import CipherSpec
+from specs.types import CipherType, VigenereMode
+from structures.sequences import KeywordSequence
+from utils.error import InvalidInputTypeError
+
+ALPHABET = list("ABCDEFGHIJKLMNOPQRSTUVWXYZ")
+
+
+class TestTextTypes(unittest.TestCase):
+
+    def test_return_type_matches_input(self):
+        cases = [
+            ("HELLO, WORLD", "RIJVS, UYVJN"),
+            (list("HELLO, WORLD"), list("RIJVS, UYVJN")),
+            (b"HELLO, WORLD", b"RIJVS, UYVJN"),
+            (bytearray(b"HELLO, WORLD"), bytearray(b"RIJVS, UYVJN")),
+            (memoryview(b"HELLO, WORLD"), memoryview(b"RIJVS, UYVJN")),
+        ]
+        for text, expected in cases:
+            with self.subTest(type=type(text).__name__):
+                cipher = ClassicVigenereCipher(text=text, alphabet=ALPHABET, keyword=KeywordSequence("KEY"))
+                result = cipher.encrypt()
+                self.assertIsInstance(result, type(text))
+                self.assertEqual(result, expected)
+
+    def test_rot_bytes_round_trip(self):
+        data = bytes(range(256))
+        encrypted = RotCipher(text=data, alphabet=ALPHABET, shift=3).encrypt()
+        self.assertEqual(encrypted[ord("A")], ord("D"))
+        self.assertEqual(encrypted[ord("a")], ord("?"))
+        decrypted = RotCipher(text=encrypted, alphabet=ALPHABET, shift=3).decrypt()
+        self.assertEqual(decrypted[ord("A"):ord("Z") + 1], bytes(range(ord("A"), ord("Z") + 1)))
+
+    def test_encrypt_into_buffer(self):
+        out = bytearray(16)
+        cipher = CipherSpec(type=CipherType.ROT, text=b"HELLO", alphabet=ALPHABET, shift=3).to_cipher()
+        self.assertEqual(cipher.encrypt_into(out), 5)
+        self.assertEqual(bytes(out[:5]), b"KHOOR")
+
+        autokey = CipherSpec(type=CipherType.VIGENERE, text=memoryview(b"KHOOR"), alphabet=ALPHABET,
+                             keyword="KEY", mode=VigenereMode.AUTOKEY).to_cipher()
+        written = autokey.encrypt_into(memoryview(out)[8:])
+        self.assertEqual(written, 5)
+        self.assertEqual(bytes(out[8:13]), autokey.encrypt())
+
+    def test_encrypt_into_writes_chunks_in_place(self):
+        text = b"ATTACK AT DAWN, HOLD THE LINE! " * 5000
+        for fields in [dict(type=CipherType.VIGENERE, keyword="LEMON"),
+                       dict(type=CipherType.VIGENERE, keyword="QUEEN", mode=VigenereMode.AUTOKEY),
+                       dict(type=CipherType.SUBSTITUTION, keyword="KRYPTOS")]:
+            with self.subTest(**fields):
+                expected = CipherSpec(text=text, alphabet=ALPHABET, **fields).to_cipher().encrypt()
+                buffer = bytearray(text)
+                cipher = CipherSpec(text=buffer, alphabet=ALPHABET, **fields).to_cipher()
+                with mock.patch("engines.streams.ChunkStream.process_all", side_effect=AssertionError("whole result")):
+                    self.assertEqual(cipher.encrypt_into(buffer), len(text))
+                self.assertEqual(bytes(buffer), expected)
+
+    def test_encrypt_into_rejects_str_and_small_buffers(self):
+        cipher = RotCipher(text="HELLO", alphabet=ALPHABET, shift=3)
+        with self.assertRaises(InvalidInputTypeError):
+            cipher.encrypt_into(bytearray(5))
+        with self.assertRaises(InvalidInputTypeError):
+            RotCipher(text=b"HELLO", alphabet=ALPHABET, shift=3).encrypt_into(bytearray(2))
+
+    def test_bytes_need_byte_alphabet(self):
+        cipher = RotCipher(text=b"AB", alphabet=["A", "B", "Ω"], shift=1)
+        with self.assertRaises(InvalidInputTypeError):
+            cipher.encrypt()
+
+
+if __name__ == '__main__':
+    unittest.main()
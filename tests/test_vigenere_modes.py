@@ -0,0 +1,133 @@
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from ciphers.classic_vigenere_cipher import ClassicVigenereCipher
+from engines.key_streams import iterable_source, mapped_file_source
+from engines.kernels import ENGINES, NUMPY_ENGINES, SPARSE_PASSTHROUGH, KeyedKernel, ShiftKernel, numpy_available
+from engines.streams import open_stream
+from specs.spec import CipherSpec
+from specs.types import CipherType, VigenereMode
+from structures.sequences import KeywordSequence
+from utils.error import InvalidKeywordError
+
+ALPHABET = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+TEXT = "ATTACK AT DAWN, HOLD THE LINE UNTIL NOON."
+
+
+def reference(text, key, decrypt=False):
+    """Shift alphabet characters of `text` by successive characters of `key`."""
+    sign = -1 if decrypt else 1
+    keys = iter(key)
+    return "".join(
+        ALPHABET[(ALPHABET.index(c) + sign * ALPHABET.index(next(keys))) % 26] if c in ALPHABET else c
+        for c in text
+    )
+
+
+class TestRepeatingMode(unittest.TestCase):
+
+    def test_decrypt_inverts_encrypt(self):
+        cipher = ClassicVigenereCipher(text=list("HELLO, WORLD"), alphabet=list(ALPHABET), keyword=KeywordSequence("KEY"))
+        encrypted = cipher.encrypt()
+        self.assertEqual("".join(encrypted), "RIJVS, UYVJN")
+        back = ClassicVigenereCipher(text=encrypted, alphabet=list(ALPHABET), keyword=KeywordSequence("KEY"))
+        self.assertEqual("".join(back.decrypt()), "HELLO, WORLD")
+
+    def test_engines_match_reference_with_passthrough(self):
+        rng = random.Random(13)
+        engines = [e for e in ENGINES if e not in NUMPY_ENGINES or numpy_available()]
+        # Sparse to dense passthrough, including regex metacharacters and non-BMP characters.
+        for others in [" ", " \n.,-]^\\", "é€\U0001F512 ", "[]{}\":"]:
+            for density in [0.02, 1 / SPARSE_PASSTHROUGH, 0.6]:
+                text = "".join(rng.choice(others) if rng.random() < density else rng.choice(ALPHABET) for _ in range(500))
+                kernel = ShiftKernel(alphabet=tuple(ALPHABET), shifts=(11, 4, 12, 14, 13))
+                for position, decrypt in [(0, False), (7, True)]:
+                    key = ("LEMON" * 200)[position:]
+                    for engine in engines:
+                        self.assertEqual(
+                            ENGINES[engine](kernel, text, position, decrypt),
+                            reference(text, key, decrypt),
+                            (engine, others, density),
+                        )
+
+        # Non-ASCII alphabet with a fill: every engine agrees with the dict engine.
+        kernel = ShiftKernel(alphabet=tuple(ALPHABET + "ÅÄÖ"), shifts=(3, 28, 9), fill="?")
+        text = "".join(rng.choice(ALPHABET + "ÅÄÖ -é") for _ in range(2000))
+        expected = ENGINES["dict"](kernel, text, 2, False)
+        for engine in engines:
+            self.assertEqual(ENGINES[engine](kernel, text, 2, False), expected, engine)
+
+        if numpy_available():
+            from engines import numpy_engine
+            with mock.patch.object(numpy_engine, "PARALLEL_CHUNK", 97):
+                self.assertEqual(ENGINES["parallel"](kernel, text, 2, False), expected)
+
+
+class TestRunningKeyMode(unittest.TestCase):
+
+    BOOK = "It was the best of times, it was the worst of times; it was the age of wisdom...".upper()
+
+    def _spec(self, text, source):
+        return CipherSpec(type=CipherType.VIGENERE, text=text, alphabet=ALPHABET,
+                          mode=VigenereMode.RUNNING_KEY, key_source=source)
+
+    def test_iterable_source_skips_non_alphabet_key_characters(self):
+        key = [c for c in self.BOOK if c in ALPHABET]
+        cipher = self._spec(TEXT, iterable_source(self.BOOK)).to_cipher()
+        self.assertEqual("".join(cipher.encrypt()), reference(TEXT, key))
+
+    def test_mapped_file_round_trip(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "book.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.BOOK * 50)
+
+            encrypted = "".join(self._spec(TEXT * 20, mapped_file_source(path, chunk_size=7)).to_cipher().encrypt())
+            decrypted = self._spec(encrypted, mapped_file_source(path)).to_cipher().decrypt()
+            self.assertEqual("".join(decrypted), TEXT * 20)
+
+    def test_lockstep_chunks_match_single_pass(self):
+        kernel = KeyedKernel(alphabet=tuple(ALPHABET), key_source=iterable_source(self.BOOK * 4))
+        self.assertEqual(
+            open_stream(kernel).process_all(TEXT * 3, chunk_size=5),
+            open_stream(kernel).process_all(TEXT * 3),
+        )
+
+    def test_exhausted_key_raises(self):
+        cipher = self._spec(TEXT, iterable_source("SHORT")).to_cipher()
+        with self.assertRaises(InvalidKeywordError):
+            cipher.encrypt()
+
+
+class TestAutokeyMode(unittest.TestCase):
+
+    def _cipher(self, text):
+        return CipherSpec(type=CipherType.VIGENERE, text=text, alphabet=ALPHABET,
+                          keyword="QUEENLY", mode=VigenereMode.AUTOKEY).to_cipher()
+
+    def test_key_is_primer_then_plaintext(self):
+        # The primer is used as written, repeated letters included.
+        plain = [c for c in TEXT if c in ALPHABET]
+        expected = reference(TEXT, list("QUEENLY") + plain)
+        self.assertEqual("".join(self._cipher(TEXT).encrypt()), expected)
+
+    def test_single_letter_primer(self):
+        plain = [c for c in TEXT if c in ALPHABET]
+        spec = CipherSpec(type=CipherType.VIGENERE, text=TEXT, alphabet=ALPHABET, keyword="K", mode=VigenereMode.AUTOKEY)
+        self.assertEqual(spec.to_cipher().encrypt(), reference(TEXT, ["K"] + plain))
+        with self.assertRaises(InvalidKeywordError):
+            CipherSpec(type=CipherType.VIGENERE, text=TEXT, alphabet=ALPHABET, keyword="k",
+                       mode=VigenereMode.AUTOKEY).to_cipher()
+
+    def test_round_trip_in_chunks(self):
+        kernel = KeyedKernel(alphabet=tuple(ALPHABET), primer=tuple("QUEENLY"))
+        encrypted = open_stream(kernel).process_all(TEXT * 10, chunk_size=3)
+        self.assertEqual(open_stream(kernel, decrypt=True).process_all(encrypted, chunk_size=4), TEXT * 10)
+        self.assertEqual("".join(self._cipher(encrypted).decrypt()), TEXT * 10)
+
+
+if __name__ == '__main__':
+    unittest.main()